@@ -0,0 +1,37 @@
+# built-in packages
+from dataclasses import dataclass, asdict
+
+# internal packages
+from src.jobs.generate_synthetic_data import generate_synthetic_data, GENERATED_EMAIL_TEMPLATE
+
+BENCHMARK_PASSWORD = "1234"
+# the first generated (non default) user
+BENCHMARK_EMAIL = GENERATED_EMAIL_TEMPLATE.format(3)
+
+
+@dataclass
+class DatasetSize:
+    vacations: int
+    users: int
+    likes: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+DATASET_SIZES = {
+    "tiny": DatasetSize(vacations=100, users=100, likes=1_000),
+    "small": DatasetSize(vacations=1_000, users=10_000, likes=100_000),
+    "large": DatasetSize(vacations=10_000, users=100_000, likes=5_000_000),
+}
+
+
+def seed_dataset(env: str, size: DatasetSize, seed: int = 42) -> dict:
+    """
+    Replaces the environment's data with a deterministic synthetic dataset of the given size
+    (bulk loaded with COPY, see src/jobs/generate_synthetic_data.py).
+    Returns the row count of every table.
+    """
+    return generate_synthetic_data(env=env, vacations=size.vacations, users=size.users, likes=size.likes, seed=seed)
+
+#
@@ -0,0 +1,148 @@
+# built-in packages
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, List
+
+# internal packages
+from benchmarks.dataset import DATASET_SIZES, DatasetSize, BENCHMARK_PASSWORD, BENCHMARK_EMAIL, seed_dataset
+from src.config import test_env
+from src.dal.cache import dao_cache
+from src.dal.catalog_read_model import catalog_read_models
+from src.dal.country_dao import CountryDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.user_dao import UserDAO
+from src.dal.vacation_dao import VacationDAO
+from src.services.user_service import UserService
+from src.services.vacation_service import VacationService
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def time_calls(name: str, function: Callable, repeat: int, cold_cache: bool = True) -> dict:
+    """
+    Calls the function 'repeat' times (after one warm-up call) and returns its timing statistics in milliseconds.
+    With cold_cache the DAO read cache is cleared before every call, so the database is actually queried.
+    """
+    function()
+    durations = []
+    for _ in range(repeat):
+        if cold_cache:
+            dao_cache.clear()
+        started = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - started) * 1000)
+
+    durations.sort()
+    return {
+        "name": name,
+        "runs": repeat,
+        "cold_cache": cold_cache,
+        "min_ms": round(durations[0], 3),
+        "median_ms": round(statistics.median(durations), 3),
+        "p95_ms": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+        "mean_ms": round(statistics.fmean(durations), 3),
+        "max_ms": round(durations[-1], 3),
+    }
+
+
+def run_benchmarks(env: str, repeat: int) -> List[dict]:
+    """
+    Times the DAO and service methods on the data currently in the environment's database.
+    """
+    first_vacation_id = VacationDAO(env=env).get_vacations_page(limit=1)[0].vacation_id
+    bench_user = UserDAO(env=env).get_user_by_email(BENCHMARK_EMAIL)
+    page_cursor = VacationService(env=env).get_vacations_page()[1]
+    login_repeat = max(1, repeat // 10)   # pbkdf2 is slow by design
+    travel_from = date.today() + timedelta(days=100)
+
+    benchmarks = [
+        ("VacationDAO.get_all_vacations", lambda: VacationDAO(env=env).get_all_vacations(), repeat, True),
+        ("VacationDAO.get_all_vacations (cached)", lambda: VacationDAO(env=env).get_all_vacations(), repeat, False),
+        ("VacationDAO.get_vacations_page", lambda: VacationDAO(env=env).get_vacations_page(limit=13), repeat, True),
+        ("VacationDAO.get_vacation_by_id", lambda: VacationDAO(env=env).get_vacation_by_id(first_vacation_id), repeat, True),
+        ("LikeDAO.get_liked_vacation_ids_by_user", lambda: LikeDAO(env=env).get_liked_vacation_ids_by_user(bench_user.user_id), repeat, True),
+        ("LikeDAO.toggle_like", lambda: LikeDAO(env=env).toggle_like(bench_user.user_id, first_vacation_id), repeat, True),
+        ("UserDAO.get_user_by_email", lambda: UserDAO(env=env).get_user_by_email(BENCHMARK_EMAIL), repeat, True),
+        ("VacationService.get_vacations_page", lambda: VacationService(env=env).get_vacations_page(), repeat, True),
+        ("VacationService.get_vacations_page (2nd page)", lambda: VacationService(env=env).get_vacations_page(page_cursor), repeat, True),
+        ("home page reads, sequential (3 round trips)", lambda: (VacationService(env=env).get_vacations_page(),
+                                                                 CountryDAO(env=env).get_all_countries(),
+                                                                 LikeDAO(env=env).get_liked_vacation_ids_by_user(bench_user.user_id)), repeat, True),
+        ("VacationService.get_home_page (pipelined)", lambda: VacationService(env=env).get_home_page(bench_user.user_id), repeat, True),
+        ("VacationService.get_vacations_page (read model)",
+         lambda: (catalog_read_models.refresh(env), VacationService(env=env).get_vacations_page(page_cursor)), repeat, False),
+        ("VacationService.search_vacations (facets only)", lambda: VacationService(env=env).search_vacations(), repeat, True),
+        ("VacationService.search_vacations (text + price)",
+         lambda: VacationService(env=env).search_vacations(query="חופים", min_price=1000, max_price=5000), repeat, True),
+        ("VacationDAO.get_vacations_overlapping (7 days)",
+         lambda: VacationDAO(env=env).get_vacations_overlapping(travel_from, travel_from + timedelta(days=7), limit=12), repeat, True),
+        ("VacationDAO.get_vacations_starting_between (30 days)",
+         lambda: VacationDAO(env=env).get_vacations_starting_between(date.today(), date.today() + timedelta(days=30), limit=12), repeat, True),
+        ("UserService.login", lambda: UserService(env=env).login(BENCHMARK_EMAIL, BENCHMARK_PASSWORD), login_repeat, True),
+    ]
+    return [time_calls(name, function, runs, cold_cache) for name, function, runs, cold_cache in benchmarks]
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(env: str, size: DatasetSize, repeat: int, seed: bool = True) -> dict:
+    """
+    Seeds the dataset (unless seed is False) and runs all benchmarks.
+    Returns the JSON-serializable report: run metadata, dataset row counts and the timing of every benchmark.
+    """
+    seed_started = time.perf_counter()
+    row_counts = seed_dataset(env, size) if seed else None
+    seed_seconds = round(time.perf_counter() - seed_started, 3) if seed else None
+
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "env": env,
+        "dataset": {"requested": size.to_dict(), "rows": row_counts, "seed_seconds": seed_seconds},
+        "repeat": repeat,
+        "results": run_benchmarks(env, repeat),
+    }
+
+
+if __name__ == "__main__":
+    # usage: python -m benchmarks.run_benchmarks [--size small|large] [--vacations N --users N --likes N] [--repeat N] [--output file.json]
+    # WARNING: the benchmark database (the test environment) is reset and re-seeded.
+    parser = argparse.ArgumentParser(description="Time the DAO and service methods on a synthetic dataset")
+    parser.add_argument("--size", choices=list(DATASET_SIZES), default="small")
+    parser.add_argument("--vacations", type=int, help="override the number of generated vacations")
+    parser.add_argument("--users", type=int, help="override the number of generated users")
+    parser.add_argument("--likes", type=int, help="override the number of generated likes")
+    parser.add_argument("--repeat", type=int, default=50, help="timed calls per benchmark")
+    parser.add_argument("--no-seed", action="store_true", help="benchmark the data already in the database")
+    parser.add_argument("--output", help="JSON report path (default: benchmarks/results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    preset = DATASET_SIZES[args.size]
+    size = DatasetSize(vacations=args.vacations if args.vacations is not None else preset.vacations,
+                       users=args.users if args.users is not None else preset.users,
+                       likes=args.likes if args.likes is not None else preset.likes)
+
+    report = run_suite(test_env, size, args.repeat, seed=not args.no_seed)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2, ensure_ascii=False)
+
+    for result in report["results"]:
+        print(f"{result['name']:<48} median {result['median_ms']:>9.3f} ms   p95 {result['p95_ms']:>9.3f} ms")
+    print(f"report written to {output}")
+
+#
@@ -1,13 +1,16 @@
 # internal packages
 from tests.runner import test_all
 from src.api import create_app
-from src.dal.database import initialize_database
+from src.config import display_env
+from src.dal.migrate import migrate_database
+from src.jobs.process_vacation_images import process_vacation_images
 
 
 if __name__ == "__main__":
     # -- Running Tests --
     test_all()
-    initialize_database()
+    migrate_database(env=display_env)
+    process_vacation_images(env=display_env)
 
     # -- Running Application --
     app = create_app()
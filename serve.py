@@ -0,0 +1,167 @@
+# built-in packages
+import time
+_PROCESS_STARTED = time.perf_counter()   # taken before the application imports, so they are part of the startup time
+
+import argparse
+import json
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+
+# internal packages
+from src.api import create_app, warm_up_templates
+from src.config import display_env, SERVER_HOST, SERVER_PORT, SERVER_WORKERS
+from src.dal.database import close_pools
+from src.dal.country_dao import CountryDAO
+from src.services.password_hasher import password_hasher
+from src.services.catalog_snapshot import catalog_snapshots
+from src.dal.catalog_read_model import catalog_read_models
+from src.services.vacation_service import VacationService
+
+# external packages
+from flask import Flask
+from werkzeug.serving import make_server
+
+logger = logging.getLogger("jbproject.server")
+# a worker that dies this soon after starting is not restarted right away (e.g. the database is down)
+_RESTART_BACKOFF_SECONDS = 1.0
+
+
+def _elapsed_ms() -> float:
+    return round((time.perf_counter() - _PROCESS_STARTED) * 1000, 1)
+
+
+def warm_up_caches(env: str) -> None:
+    """
+    Fills the worker's DAO cache with the reads every home page visit makes (this opens the worker's connection pool),
+    builds the catalog read model and takes the catalog snapshot served while the database is slow or down.
+    """
+    CountryDAO(env=env).get_all_countries()
+    VacationService(env=env).get_vacations_page()
+    catalog_read_models.refresh(env)
+    catalog_snapshots.refresh(env)
+
+
+def run_worker(app: Flask, listen_socket: socket.socket, worker_number: int, ready_fd: int) -> None:
+    """
+    Serves requests on the shared listening socket until SIGTERM / SIGINT.
+    Runs in a forked child: its connection pools and password hashing processes are its own, opened on first use.
+    """
+    def stop(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    server = make_server(SERVER_HOST, listen_socket.getsockname()[1], app, threaded=True, fd=listen_socket.fileno())
+    try:
+        try:
+            warm_up_caches(display_env)
+        except Exception as e:
+            logger.warning(json.dumps({"event": "cache_warm_up_failed", "worker": worker_number, "error": str(e)}))
+
+        os.write(ready_fd, f"{worker_number} {_elapsed_ms()}\n".encode())
+        os.close(ready_fd)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        close_pools()
+        password_hasher.shutdown()
+
+
+def serve(host: str = SERVER_HOST, port: int = SERVER_PORT, workers: int = SERVER_WORKERS) -> None:
+    """
+    Production entry point: builds the application once (no tests, no schema changes, no database connection),
+    compiles the templates, then forks 'workers' processes that share one listening socket.
+    Workers that exit are restarted; SIGTERM / SIGINT stop all of them.
+    Startup times (milliseconds since the process started) are logged as one JSON line once every worker is ready.
+    """
+    imports_ms = _elapsed_ms()
+    app = create_app()
+    templates = warm_up_templates(app)
+    app_ready_ms = _elapsed_ms()
+
+    listen_socket = socket.create_server((host, port), backlog=1024)
+    listen_socket.set_inheritable(True)
+    ready_read_fd, ready_write_fd = os.pipe()
+    worker_pids = {}
+    stopping = False
+
+    def start_worker(worker_number: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read_fd)
+            exit_code = 0
+            try:
+                run_worker(app, listen_socket, worker_number, ready_write_fd)
+            except SystemExit as e:
+                exit_code = e.code or 0
+            except BaseException:
+                logger.exception("worker %s crashed", worker_number)
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        worker_pids[pid] = (worker_number, time.monotonic())
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for worker_number in range(workers):
+        start_worker(worker_number)
+
+    # startup report: every worker writes one line to the pipe once it is ready to serve
+    ready_times, buffer, deadline = [], b"", time.monotonic() + 60
+    while len(ready_times) < workers and not stopping and time.monotonic() < deadline:
+        readable, _, _ = select.select([ready_read_fd], [], [], 1.0)
+        if readable:
+            buffer += os.read(ready_read_fd, 4096)
+            *lines, buffer = buffer.split(b"\n")
+            ready_times += [float(line.split()[1]) for line in lines if line]
+    logger.info(json.dumps({"event": "startup", "pid": os.getpid(), "address": f"{host}:{listen_socket.getsockname()[1]}",
+                            "workers": workers, "templates": templates, "imports_ms": imports_ms, "app_ready_ms": app_ready_ms,
+                            "first_worker_ready_ms": min(ready_times, default=None),
+                            "all_workers_ready_ms": max(ready_times) if len(ready_times) == workers else None}))
+
+    while worker_pids:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        worker_number, started = worker_pids.pop(pid, (None, None))
+        if stopping or worker_number is None:
+            continue
+        logger.warning(json.dumps({"event": "worker_exited", "worker": worker_number, "pid": pid,
+                                   "exit_code": os.waitstatus_to_exitcode(status)}))
+        if time.monotonic() - started < _RESTART_BACKOFF_SECONDS:
+            time.sleep(_RESTART_BACKOFF_SECONDS)
+        if not stopping:
+            start_worker(worker_number)
+
+    listen_socket.close()
+
+
+if __name__ == "__main__":
+    # usage: python serve.py [--host 0.0.0.0] [--port 5001] [--workers 4]
+    # (the database schema is migrated separately: python -m src.dal.migrate)
+    parser = argparse.ArgumentParser(description="Run the application with pre-forked worker processes")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(message)s")
+    serve(host=args.host, port=args.port, workers=args.workers)
+
+#
@@ -2,7 +2,12 @@
 import os
 
 # internal packages
-from src.api import auth_routes, errors_routes, vacation_routes
+from src.api import auth_routes, errors_routes, vacation_routes, stats_routes, media_routes, export_routes
+from src.api.utils.api_utils import vacation_image_url, vacation_image_srcset
+from src.api.utils.timing_utils import init_request_timing
+from src.api.utils.latency_budget_utils import init_latency_budgets
+from src.api.utils.stale_utils import init_stale_marking
+from src.dal.instrumentation import configure_slow_query_log
 from src import config
 from src.config import display_env
 
@@ -23,6 +28,11 @@ def create_app():
     app.secret_key = os.getenv("SECRET_KEY", "some_secret_key")
     app.config.from_object(config)
     csrf.init_app(app)
+    app.jinja_env.globals.update(vacation_image_url=vacation_image_url, vacation_image_srcset=vacation_image_srcset)
+    init_request_timing(app)
+    init_latency_budgets(app)
+    init_stale_marking(app)
+    configure_slow_query_log(config.slow_query_log_file)
     
     @app.route("/")
     def root():
@@ -30,8 +40,22 @@ def create_app():
     
     app.register_blueprint(auth_routes.bp)
     app.register_blueprint(vacation_routes.bp)
+    app.register_blueprint(stats_routes.bp)
+    app.register_blueprint(media_routes.bp)
+    app.register_blueprint(export_routes.bp)
     app.register_blueprint(errors_routes.bp)
 
     return app
 
+
+def warm_up_templates(app: Flask) -> int:
+    """
+    Compiles every template once (a forked worker inherits the compiled templates instead of compiling them on its first requests).
+    Returns the number of compiled templates.
+    """
+    template_names = app.jinja_env.list_templates(extensions=["html"])
+    for template_name in template_names:
+        app.jinja_env.get_template(template_name)
+    return len(template_names)
+
 #
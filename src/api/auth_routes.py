@@ -1,6 +1,7 @@
 # internal packages
 from src.api.utils.api_utils import is_valid_email, is_valid_password, all_fields_filled
 from src.services.user_service import UserService
+from src.services import errors
 from src.dal.user_dao import UserDAO
 from src.config import display_env
 
@@ -45,6 +46,9 @@ def login_page():
             else:
                 flash("אימייל או סיסמה שגויים", category="error")
 
+        except errors.ServiceUnavailableError:
+            flash("השרת עמוס כרגע, נא לנסות שוב בעוד מספר שניות", category="error")
+
         except Exception:
             abort(500)
 
@@ -92,6 +96,9 @@ def register_page():
                 })
                 return redirect(url_for("vacations.home_page"))
 
+        except errors.ServiceUnavailableError:
+            flash("השרת עמוס כרגע, נא לנסות שוב בעוד מספר שניות", category="error")
+
         except Exception:
             abort(500)
 
@@ -1,3 +1,6 @@
+# internal packages
+from src.dal.latency_budget import LatencyBudgetExceeded
+
 # external packages
 from flask import Blueprint, render_template
 
@@ -19,8 +22,15 @@ def page_not_found(e):
 
 @bp.app_errorhandler(500)
 def internal_error(e):
+    # routes turn unexpected exceptions into abort(500): a latency budget violation is still answered with 503
+    if isinstance(e.__context__, LatencyBudgetExceeded):
+        return service_unavailable(e.__context__)
     return render_template("error.html", status_code=500), 500
 
+@bp.app_errorhandler(LatencyBudgetExceeded)
+def service_unavailable(e):
+    return render_template("error.html", status_code=503), 503, {"Retry-After": str(e.retry_after)}
+
 @bp.app_errorhandler(Exception)
 def generic_error(e):
     return render_template("error.html", status_code=500), 500
@@ -0,0 +1,35 @@
+# internal packages
+from src.api.utils.api_utils import admin_required
+from src.services.export_service import ExportService
+from src.services import errors
+from src.config import display_env, EXPORT_FETCH_SIZE
+
+# external packages
+from flask import Blueprint, Response, request, jsonify
+
+env = display_env
+bp = Blueprint('export', __name__, url_prefix=f"/{env}/export")
+
+_MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@bp.route("/<entity>")
+@admin_required
+def export_entity(entity):
+    """
+    Streams a whole table (vacations / likes / users) as a file download, chunk by chunk.
+    Query parameters: format ("ndjson" or "csv"), fetch_size (rows per chunk).
+    Access restricted to admin users.
+    """
+    file_format = request.args.get("format", "ndjson")
+    fetch_size = request.args.get("fetch_size", EXPORT_FETCH_SIZE, type=int)
+
+    try:
+        chunks = ExportService(env=env).export_rows(entity, file_format, fetch_size)
+    except errors.InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return Response(chunks, mimetype=_MIMETYPES[file_format],
+                    headers={"Content-Disposition": f"attachment; filename={entity}.{file_format}"})
+
+#
@@ -0,0 +1,31 @@
+# built-in packages
+import re
+
+# external packages
+from flask import Blueprint, current_app, send_from_directory
+
+bp = Blueprint('media', __name__, url_prefix="/media")
+
+# content-addressed files ('<hash>_<variant>.webp') never change, so browsers and proxies may cache them forever
+_CONTENT_ADDRESSED_FILE = re.compile(r"^([0-9a-f]{32})_\w+\.webp$")
+_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+_DEFAULT_MAX_AGE = 60 * 60
+
+
+@bp.route("/vacation-images/<file_name>")
+def vacation_image(file_name):
+    """
+    Serves a vacation photo from the upload folder.
+    Content-addressed photos are served as immutable with a strong ETag derived from the file name.
+    """
+    match = _CONTENT_ADDRESSED_FILE.match(file_name)
+    if not match:
+        return send_from_directory(current_app.config["UPLOAD_FOLDER"], file_name, max_age=_DEFAULT_MAX_AGE)
+
+    response = send_from_directory(current_app.config["UPLOAD_FOLDER"], file_name, max_age=_IMMUTABLE_MAX_AGE,
+                                   etag=file_name.removesuffix(".webp"))
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+#
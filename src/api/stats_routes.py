@@ -0,0 +1,91 @@
+# internal packages
+from src.api.utils.api_utils import admin_required
+from src.dal.database import get_pool_stats
+from src.dal.cache import dao_cache
+from src.dal.latency_budget import budget_stats
+from src.services.password_hasher import password_hasher
+from src.services.catalog_snapshot import catalog_snapshots
+from src.dal.catalog_read_model import catalog_read_models
+from src.dal.change_events import change_listener
+from src.config import display_env
+
+# external packages
+from flask import Blueprint, jsonify
+
+env = display_env
+bp = Blueprint('stats', __name__, url_prefix=f"/{env}/stats")
+
+
+@bp.route("/db-pool")
+@admin_required
+def db_pool_stats():
+    """
+    Returns the database connection pool statistics as JSON.
+    Access restricted to admin users.
+    """
+    return jsonify(get_pool_stats(env)), 200
+
+
+@bp.route("/dao-cache")
+@admin_required
+def dao_cache_stats():
+    """
+    Returns the DAO read cache statistics (hits, misses, hit ratio, ...) as JSON.
+    Access restricted to admin users.
+    """
+    return jsonify(dao_cache.get_stats()), 200
+
+
+@bp.route("/password-hashing")
+@admin_required
+def password_hashing_stats():
+    """
+    Returns the password hashing pool statistics (queue wait vs hash time, rejections, timeouts) as JSON.
+    Access restricted to admin users.
+    """
+    return jsonify(password_hasher.get_stats()), 200
+
+
+@bp.route("/latency-budgets")
+@admin_required
+def latency_budget_stats():
+    """
+    Returns the latency budget violations of this process (per budget: deadline, statement_timeout, lock_timeout,
+    pool_timeout) as JSON.
+    Access restricted to admin users.
+    """
+    return jsonify(budget_stats.get_stats()), 200
+
+
+@bp.route("/catalog-snapshot")
+@admin_required
+def catalog_snapshot_stats():
+    """
+    Returns the catalog snapshot statistics (snapshot age, refreshes, failed reads, reads answered stale) as JSON.
+    Access restricted to admin users.
+    """
+    return jsonify(catalog_snapshots.get_stats()), 200
+
+
+@bp.route("/catalog-read-model")
+@admin_required
+def catalog_read_model_stats():
+    """
+    Returns the catalog read model statistics (full builds, likes-only refreshes, failed refreshes and, per environment,
+    the size and age of the model and whether it is up to date) as JSON.
+    Access restricted to admin users.
+    """
+    return jsonify(catalog_read_models.get_stats()), 200
+
+
+@bp.route("/change-events")
+@admin_required
+def change_events_stats():
+    """
+    Returns the change listener statistics (notifications of other processes' writes applied to the DAO cache,
+    notifications of own writes skipped, reconnects and the environments listened to) as JSON.
+    Access restricted to admin users.
+    """
+    return jsonify(change_listener.get_stats()), 200
+
+#
@@ -2,8 +2,12 @@
 import re
 from functools import wraps
 
+# internal packages
+from src.config import display_env
+from src.dal.unit_of_work import unit_of_work
+
 # external packages
-from flask import session, redirect, url_for, abort
+from flask import session, redirect, url_for, abort, make_response
 
 
 def admin_required(f):
@@ -32,6 +36,21 @@ def login_required(f):
     return decorated_function
 
 
+def transactional_route(f):
+    """
+    Decorator: Runs every DAO/service call of the request in one transaction,
+    committed before the response is sent, or rolled back on an error response (4xx/5xx) or exception.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        with unit_of_work(display_env) as uow:
+            response = make_response(f(*args, **kwargs))
+            if response.status_code >= 400:
+                uow.rollback()
+        return response
+    return decorated_function
+
+
 def all_fields_filled(*fields) -> bool:
     """
     Checks if all provided fields are non-empty.
@@ -55,4 +74,23 @@ def is_valid_password(password: str, min_length: int = 4) -> bool:
     """
     return len(password) >= min_length
 
+
+def vacation_image_url(vacation, variant: str = "original") -> str:
+    """
+    Returns the URL of a vacation photo variant ('card'/'popup'/'original').
+    Falls back to photo_file_path for photos without variants.
+    """
+    variants = vacation.photo_variants or {}
+    file_name = variants.get(variant, {}).get("file", vacation.photo_file_path)
+    return url_for("media.vacation_image", file_name=file_name)
+
+
+def vacation_image_srcset(vacation) -> str:
+    """
+    Returns the srcset attribute value of a vacation photo (all its variants with their widths).
+    Returns an empty string for photos without variants.
+    """
+    variants = sorted((vacation.photo_variants or {}).values(), key=lambda variant: variant["width"])
+    return ", ".join(f"{url_for('media.vacation_image', file_name=variant['file'])} {variant['width']}w" for variant in variants)
+
 #
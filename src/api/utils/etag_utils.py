@@ -0,0 +1,80 @@
+# built-in packages
+import hashlib
+import os
+import time
+import uuid
+from functools import wraps
+
+# internal packages
+from src.config import display_env, CONDITIONAL_GET_MAX_AGE
+from src.dal.cache import dao_cache
+from src.services.catalog_snapshot import served_stale_age
+
+# external packages
+from flask import request, session, make_response
+
+CATALOG_TABLES = ("vacations", "countries", "likes")
+# table versions start again from 0 when the process restarts, the epoch keeps old validators from matching them.
+# Every worker process counts its own versions (they only converge through the change notifications), so a forked
+# worker takes its own epoch: a validator is only ever matched by the worker that issued it
+_PROCESS_EPOCH = uuid.uuid4().hex
+
+
+def _new_epoch_after_fork() -> None:
+    global _PROCESS_EPOCH
+    _PROCESS_EPOCH = uuid.uuid4().hex
+
+
+os.register_at_fork(after_in_child=_new_epoch_after_fork)
+
+
+def catalog_version(env: str = display_env) -> tuple:
+    """
+    Returns the version of the vacations catalog: bumped by every vacation, country or like mutation,
+    and by every clear of the DAO cache (the data was reset, e.g. initialize_database or the synthetic data job).
+    """
+    return (dao_cache.generation, *dao_cache.table_versions(env, CATALOG_TABLES))
+
+
+def user_likes_version(user_id: int | None, env: str = display_env) -> int:
+    """
+    Returns the version of the likes of one user: bumped whenever the user likes or unlikes a vacation.
+    """
+    return dao_cache.scope_version(env, "likes", user_id) if user_id is not None else 0
+
+
+def compute_etag() -> str:
+    """
+    Returns the strong ETag of the current request's page: the catalog and user likes versions, everything in the
+    session the page renders (user, role, name, CSRF token) and the requested URL, without running any query.
+    """
+    user_id = session.get("user_id")
+    csrf_token = session.get("csrf_token") or ""
+    parts = (_PROCESS_EPOCH, int(time.time() // CONDITIONAL_GET_MAX_AGE), catalog_version(), user_likes_version(user_id),
+             user_id, session.get("role_id"), session.get("user_name"), hashlib.sha256(csrf_token.encode()).hexdigest(),
+             request.full_path)
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+
+def conditional_get(f):
+    """
+    Decorator for GET views: answers 304 Not Modified, before the view (and any DAO query) runs,
+    when the If-None-Match header holds the current ETag of the page; otherwise the response gets the ETag.
+    Pages are private (per user) and must be revalidated on every use.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        etag = compute_etag()
+        if etag in request.if_none_match:
+            response = make_response("", 304)
+        else:
+            response = make_response(f(*args, **kwargs))
+            # a page answered from the catalog snapshot must not be revalidated as current once the database is back
+            if response.status_code != 200 or served_stale_age() is not None:
+                return response
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+    return decorated_function
+
+#
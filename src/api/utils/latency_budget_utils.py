@@ -0,0 +1,26 @@
+# internal packages
+from src.config import ROUTE_LATENCY_BUDGET_MS, ROUTE_LATENCY_BUDGETS_MS
+from src.dal.latency_budget import start_latency_budget, end_latency_budget
+
+# external packages
+from flask import Flask, g, request
+
+
+def init_latency_budgets(app: Flask) -> None:
+    """
+    Runs every request under the latency budget of its route (ROUTE_LATENCY_BUDGETS_MS, else ROUTE_LATENCY_BUDGET_MS):
+    its statements still running at the deadline are cancelled and the request answers '503 Service Unavailable'
+    with a Retry-After header (see errors_routes) instead of holding its thread and connection.
+    """
+    @app.before_request
+    def start_request_budget():
+        budget_ms = ROUTE_LATENCY_BUDGETS_MS.get(request.endpoint, ROUTE_LATENCY_BUDGET_MS)
+        g.latency_budget_token = start_latency_budget(f"route {request.endpoint}", budget_ms)
+
+    @app.teardown_request
+    def end_request_budget(exception=None):
+        token = g.pop("latency_budget_token", None)
+        if token is not None:
+            end_latency_budget(token)
+
+#
@@ -0,0 +1,34 @@
+# internal packages
+from src.services.catalog_snapshot import start_stale_tracking, end_stale_tracking, served_stale_age
+
+# external packages
+from flask import Flask, g
+
+STALE_HEADER = "X-Catalog-Stale"
+
+
+def init_stale_marking(app: Flask) -> None:
+    """
+    Marks the responses answered from the catalog snapshot (while the database is slow or down):
+        X-Catalog-Stale: <age of the snapshot in seconds>
+    They are never stored by the browser, so the fresh page is shown as soon as the database is back.
+    """
+    @app.before_request
+    def start_request_stale_tracking():
+        g.stale_tracking_token = start_stale_tracking()
+
+    @app.after_request
+    def add_stale_header(response):
+        age = served_stale_age()
+        if age is not None:
+            response.headers[STALE_HEADER] = str(int(age))
+            response.headers["Cache-Control"] = "no-store"
+        return response
+
+    @app.teardown_request
+    def end_request_stale_tracking(exception=None):
+        token = g.pop("stale_tracking_token", None)
+        if token is not None:
+            end_stale_tracking(token)
+
+#
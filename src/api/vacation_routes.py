@@ -1,19 +1,22 @@
 # built-in packages
-from datetime import datetime
-import os
+from dataclasses import asdict
+from datetime import date, datetime
 
 # internal packages
-from src.config import UPLOAD_FOLDER, display_env
-from src.api.utils.api_utils import admin_required, login_required, all_fields_filled
+from src.config import display_env, VACATIONS_PAGE_SIZE
+from src.api.utils.api_utils import admin_required, login_required, all_fields_filled, transactional_route
+from src.api.utils.etag_utils import conditional_get
 from src.dal.vacation_dao import VacationDAO
-from src.dal.country_dao import CountryDAO
 from src.dal.like_dao import LikeDAO
 from src.services.vacation_service import VacationService
 from src.services.user_service import UserService
+from src.services.image_service import ImageService
+from src.services.vacation_import_service import VacationImportService
+from src.services.catalog_snapshot import served_stale_age
+from src.services import errors
 
 # external packages
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify, abort
-from werkzeug.utils import secure_filename
+from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify, abort, current_app
 
 env = display_env
 bp = Blueprint('vacations', __name__, url_prefix=f"/{env}")
@@ -21,18 +24,96 @@ bp = Blueprint('vacations', __name__, url_prefix=f"/{env}")
 
 @bp.route("/")
 @login_required
+@conditional_get
 def home_page():
     """
-    Renders the home page with all vacations and user-specific data.
+    Renders the home page with the first page of vacations and user-specific data (read in a single database round trip).
     Redirects to login if the user is not authenticated.
     """
-    vacations = VacationDAO(env=env).get_all_vacations()
-    countries = CountryDAO(env=env).get_all_countries()
+    page = VacationService(env=env).get_home_page(session["user_id"])
+    is_admin = session.get("role_id") == 2
+
+    return render_template("index.html", vacations=page.vacations, next_cursor=page.next_cursor, countries=page.countries,
+                           is_admin=is_admin, liked_vacations=page.liked_vacations, env=display_env)
+
+
+@bp.route("/vacations")
+@login_required
+@conditional_get
+def vacations_page():
+    """
+    Returns the next page of vacation cards (infinite scroll) as rendered HTML with the cursor of the following page.
+    """
+    try:
+        vacations, next_cursor = VacationService(env=env).get_vacations_page(cursor=request.args.get("cursor"))
+    except errors.InvalidInputError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    is_admin = session.get("role_id") == 2
+    # a page from the catalog snapshot means the database is failing, the likes are not read then
+    liked_vacations = LikeDAO(env=env).get_liked_vacation_ids_by_user(
+        session["user_id"]) if served_stale_age() is None else []
+
+    html = render_template("vacation-cards.html", vacations=vacations, is_admin=is_admin, liked_vacations=liked_vacations)
+    return jsonify({"html": html, "next_cursor": next_cursor}), 200
+
+
+@bp.route("/search")
+@login_required
+@conditional_get
+def search_vacations():
+    """
+    Searches the vacations: free text (q), countries (country_id, repeatable), price range (min_price, max_price)
+    and start date window (start_from, start_to as YYYY-MM-DD), paged by page / page_size.
+    Returns the matching vacation cards as rendered HTML with the total number of matches and the facet counts.
+    """
+    try:
+        start_from, start_to = (date.fromisoformat(request.args[name]) if request.args.get(name) else None
+                                for name in ("start_from", "start_to"))
+        result = VacationService(env=env).search_vacations(
+            query=request.args.get("q"),
+            country_ids=[int(country_id) for country_id in request.args.getlist("country_id")],
+            min_price=int(request.args["min_price"]) if request.args.get("min_price") else None,
+            max_price=int(request.args["max_price"]) if request.args.get("max_price") else None,
+            start_from=start_from, start_to=start_to,
+            page=int(request.args["page"]) if request.args.get("page") else 1,
+            page_size=int(request.args["page_size"]) if request.args.get("page_size") else VACATIONS_PAGE_SIZE)
+    except (ValueError, errors.InvalidInputError, errors.InvalidTypeInputError) as e:
+        return jsonify({"error": str(e)}), 400
+
     is_admin = session.get("role_id") == 2
     liked_vacations = LikeDAO(env=env).get_liked_vacation_ids_by_user(
         session["user_id"])
 
-    return render_template("index.html", vacations=vacations, countries=countries, is_admin=is_admin, liked_vacations=liked_vacations, env=display_env)
+    html = render_template("vacation-cards.html", vacations=result.vacations, is_admin=is_admin, liked_vacations=liked_vacations)
+    return jsonify({"html": html, "total": result.total, "page": result.page, "page_size": result.page_size,
+                    "country_facets": [asdict(facet) for facet in result.country_facets],
+                    "price_facets": [asdict(facet) for facet in result.price_facets]}), 200
+
+
+@bp.route("/available")
+@login_required
+@conditional_get
+def available_vacations():
+    """
+    Returns the vacation cards (as rendered HTML) of the vacations taking place during the travel window
+    start_date..end_date (YYYY-MM-DD), or of the vacations starting within the next within_days days.
+    """
+    try:
+        if request.args.get("within_days"):
+            vacations = VacationService(env=env).get_vacations_starting_within(days=int(request.args["within_days"]))
+        else:
+            vacations = VacationService(env=env).get_vacations_overlapping(start_date=date.fromisoformat(request.args.get("start_date", "")),
+                                                                           end_date=date.fromisoformat(request.args.get("end_date", "")))
+    except (ValueError, errors.InvalidInputError, errors.InvalidTypeInputError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    is_admin = session.get("role_id") == 2
+    liked_vacations = LikeDAO(env=env).get_liked_vacation_ids_by_user(
+        session["user_id"])
+
+    html = render_template("vacation-cards.html", vacations=vacations, is_admin=is_admin, liked_vacations=liked_vacations)
+    return jsonify({"html": html, "count": len(vacations)}), 200
 
 
 @bp.route("/add-vacation", methods=["GET", "POST"])
@@ -42,8 +123,7 @@ def add_vacation():
     Handles adding a vacation with validation and image upload.
     Access restricted to admin users.
     """
-    countries = CountryDAO(env=env).get_all_countries()
-    countries.sort(key=lambda c: c.country_name)
+    countries = VacationService(env=env).get_countries()
 
     if request.method == "POST":
         destination_id = request.form.get("destination_id")
@@ -88,13 +168,16 @@ def add_vacation():
             flash("לא ניתן לבחור תאריכים שכבר עברו", "error")
             return render_template("add-vacation.html", countries=countries, form_data=form_data, env=display_env)
 
-        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-        filename = secure_filename(file.filename)
-        file.save(os.path.join(UPLOAD_FOLDER, filename))
+        try:
+            filename, photo_variants = ImageService(upload_folder=current_app.config["UPLOAD_FOLDER"]).save_vacation_image(
+                file.stream)
+        except errors.InvalidInputError:
+            flash("קובץ התמונה אינו תקין", "error")
+            return render_template("add-vacation.html", countries=countries, form_data=form_data, env=display_env)
 
         try:
             VacationService(env=env).add_vacation(
-                country_id, vacation_info, start_date, end_date, price, filename
+                country_id, vacation_info, start_date, end_date, price, filename, photo_variants
             )
             flash("החופשה נוספה בהצלחה", "success")
             return redirect(url_for("vacations.add_vacation"))
@@ -110,12 +193,11 @@ def add_vacation():
 @bp.route("/edit-vacation/<int:vacation_id>", methods=["GET", "POST"])
 @admin_required
 def edit_vacation(vacation_id):
-    vacation = VacationDAO(env=env).get_vacation_by_id(vacation_id)
+    vacation = VacationService(env=env).get_vacation(vacation_id)
     if not vacation:
         abort(404)
 
-    countries = CountryDAO(env=env).get_all_countries()
-    countries.sort(key=lambda c: c.country_name)
+    countries = VacationService(env=env).get_countries()
 
     if request.method == "POST":
         form_data = {
@@ -164,16 +246,21 @@ def edit_vacation(vacation_id):
                 "edit-vacation.html", vacation=vacation, countries=countries, form_data=form_data, env=display_env
             )
 
-        filename = vacation.photo_file_path
+        filename, photo_variants = None, None
         if file and file.filename:
-            os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(UPLOAD_FOLDER, filename))
+            try:
+                filename, photo_variants = ImageService(upload_folder=current_app.config["UPLOAD_FOLDER"]).save_vacation_image(
+                    file.stream)
+            except errors.InvalidInputError:
+                flash("קובץ התמונה אינו תקין", "error")
+                return render_template(
+                    "edit-vacation.html", vacation=vacation, countries=countries, form_data=form_data, env=display_env
+                )
 
         try:
             VacationService(env=env).update_vacation(
                 vacation_id, country_id, vacation_info,
-                start_date, end_date, price, filename
+                start_date, end_date, price, filename, photo_variants
             )
             flash("החופשה עודכנה בהצלחה", "success")
             return redirect(url_for("vacations.home_page"))
@@ -199,8 +286,31 @@ def edit_vacation(vacation_id):
     )
 
 
+@bp.route("/import-vacations", methods=["POST"])
+@admin_required
+def import_vacations():
+    """
+    Imports many vacations from an uploaded CSV/NDJSON file ("file") and returns a JSON report
+    with the number of imported vacations and the errors of every rejected row.
+    Access restricted to admin users.
+    """
+    file = request.files.get("file")
+    if not file or not file.filename:
+        return jsonify({"error": "Missing file"}), 400
+
+    import_service = VacationImportService(env=env)
+    try:
+        rows = import_service.parse_file(file.stream, file.filename)
+    except errors.InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+
+    report = import_service.import_vacations(rows)
+    return jsonify(asdict(report)), 200
+
+
 @bp.route("/delete-vacation/<int:vacation_id>", methods=["POST"])
 @admin_required
+@transactional_route
 def delete_vacation(vacation_id):
     """
     Deletes a vacation by ID and returns JSON response.
@@ -221,8 +331,12 @@ def delete_vacation(vacation_id):
 @bp.route("/like", methods=["POST"])
 @login_required
 def toggle_like():
+    """
+    Toggles the user's like on a vacation (or sets it when "liked" is sent) and returns the updated likes count.
+    """
     data = request.get_json()
     vacation_id = data.get("vacation_id")
+    liked = data.get("liked")
     user_id = session.get("user_id")
 
     if not vacation_id or not user_id:
@@ -234,23 +348,18 @@ def toggle_like():
     except ValueError:
         return jsonify({"error": "Invalid ID format"}), 400
 
-    if LikeDAO(env=env).get_like_by_user_and_vacation(user_id, vacation_id):
-        UserService(env=env).remove_like(user_id, vacation_id)
-        action = "removed"
-    else:
-        UserService(env=env).add_like(user_id, vacation_id)
-        action = "added"
+    if not isinstance(liked, (bool, type(None))):
+        return jsonify({"error": "Invalid liked value"}), 400
 
-    updated_vacation = next(
-        (v for v in VacationService(env=env).get_vacations() if v.vacation_id == vacation_id),
-        None
-    )
-
-    if not updated_vacation:
-        return jsonify({"error": "Vacation not found after update"}), 404
+    try:
+        liked, likes_count = UserService(env=env).toggle_like(user_id, vacation_id, liked)
+    except errors.InvalidInputError:
+        return jsonify({"error": "Vacation not found"}), 404
 
+    action = "added" if liked else "removed"
     return jsonify({
-        "likes_count": updated_vacation.likes_count,
+        "likes_count": likes_count,
+        "liked": liked,
         "message": f"Like {action} successfully"
     }), 200
 
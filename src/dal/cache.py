@@ -0,0 +1,173 @@
+# built-in packages
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Tuple
+
+# internal packages
+from src.config import dao_cache_max_entries, dao_cache_ttl
+from src.dal.unit_of_work import current_unit_of_work
+
+
+class DAOCache:
+    """
+    LRU cache with TTL for the results of DAO read methods.
+    Every cached entry remembers the version of the tables it was read from; a write through
+    any DAO bumps the version of the tables it touches, so older entries are treated as misses.
+    """
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (expires_at, table_versions, value)
+        self._table_versions = {}       # (env, table) -> version
+        self._scope_versions = {}       # (env, table, scope) -> version, e.g. the likes of one user
+        self.generation = 0             # bumped by clear(), which drops every entry without a table write
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+
+    def table_versions(self, env: str, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        """
+        Returns the current versions of the given tables.
+        """
+        # no lock: reading an int from a dict is atomic, and readers of the catalog read model must never wait for one
+        return tuple(self._table_versions.get((env, table), 0) for table in tables)
+
+
+    def scope_version(self, env: str, table: str, scope: Any) -> int:
+        """
+        Returns the current version of the rows of the table that belong to one scope (e.g. the likes of one user).
+        """
+        with self._lock:
+            return self._scope_versions.get((env, table, scope), 0)
+
+
+    def get(self, key: tuple, env: str, tables: Tuple[str, ...]) -> Tuple[bool, Any]:
+        """
+        Returns (True, value) for a fresh entry, (False, None) for a missing, expired or invalidated one.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, versions, value = entry
+                current_versions = tuple(self._table_versions.get((env, table), 0) for table in tables)
+                if expires_at > time.monotonic() and versions == current_versions:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return True, value
+                del self._entries[key]
+
+            self._stats["misses"] += 1
+            return False, None
+
+
+    def set(self, key: tuple, value: Any, versions: Tuple[int, ...]) -> None:
+        """
+        Stores a value read under the given table versions, evicting the least recently used entries when full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, versions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+
+    def invalidate(self, env: str, *tables: str, scope: Any = None) -> None:
+        """
+        Bumps the version of the given tables, invalidating every entry read from them,
+        and - if a scope is given - the version of that scope of the tables.
+        """
+        with self._lock:
+            for table in tables:
+                self._table_versions[(env, table)] = self._table_versions.get((env, table), 0) + 1
+                if scope is not None:
+                    self._scope_versions[(env, table, scope)] = self._scope_versions.get((env, table, scope), 0) + 1
+            self._stats["invalidations"] += 1
+
+
+    def clear(self) -> None:
+        """
+        Removes all entries (e.g. after the database was re-initialized).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self._stats["invalidations"] += 1
+
+
+    def get_stats(self) -> dict:
+        """
+        Returns hit/miss/eviction/invalidation counters, the hit ratio and the current number of entries.
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {**self._stats, "entries": len(self._entries), "max_entries": self.max_entries, "ttl": self.ttl,
+                    "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else 0.0}
+
+
+dao_cache = DAOCache(max_entries=dao_cache_max_entries, ttl=dao_cache_ttl)
+
+
+def cached_read(*tables: str):
+    """
+    Decorator for DAO read methods: caches the result per method and arguments until the TTL
+    expires or one of the given tables is written. Cached results must be treated as read-only
+    (lists are copied, the objects inside them are shared).
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            uow = current_unit_of_work(self.env)
+            if uow is not None and uow.written_tables.intersection(tables):
+                # the open transaction sees its own uncommitted writes, which must not be shared through the cache
+                return method(self, *args, **kwargs)
+
+            key = (self.env, method.__qualname__, args, tuple(sorted(kwargs.items())))
+            try:
+                found, value = dao_cache.get(key, self.env, tables)
+            except TypeError:
+                # unhashable arguments, bypass the cache
+                return method(self, *args, **kwargs)
+
+            if not found:
+                versions = dao_cache.table_versions(self.env, tables)
+                value = method(self, *args, **kwargs)
+                dao_cache.set(key, value, versions)
+            return list(value) if isinstance(value, list) else value
+        return wrapper
+    return decorator
+
+
+def invalidates(*tables: str, scope_arg: str | None = None):
+    """
+    Decorator for DAO mutation methods: invalidates cached reads of the given tables once the write is done,
+    or - inside a unit of work - once its transaction is committed or rolled back.
+    With scope_arg, the version of the scope given by that argument (e.g. scope_arg="user_id") is bumped as well.
+    """
+    def decorator(method):
+        signature = inspect.signature(method) if scope_arg else None
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            scope = signature.bind(self, *args, **kwargs).arguments.get(scope_arg) if signature else None
+            uow = current_unit_of_work(self.env)
+            if uow is not None:
+                if scope is not None:
+                    uow.written_tables.update(tables)
+                    uow.on_finish(lambda: dao_cache.invalidate(self.env, *tables, scope=scope))
+                elif not uow.written_tables.issuperset(tables):
+                    uow.written_tables.update(tables)
+                    uow.on_finish(dao_cache.invalidate, self.env, *tables)
+                return method(self, *args, **kwargs)
+
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                dao_cache.invalidate(self.env, *tables, scope=scope)
+        return wrapper
+    return decorator
+
+#
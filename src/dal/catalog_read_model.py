@@ -0,0 +1,220 @@
+# built-in packages
+import bisect
+import dataclasses
+import json
+import logging
+import math
+import os
+import threading
+import time
+from datetime import date
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Tuple
+
+# internal packages
+from src.config import dao_cache_ttl
+from src.dal.cache import dao_cache
+from src.dal.country_dao import CountryDAO
+from src.dal.unit_of_work import current_unit_of_work
+from src.dal.vacation_dao import VacationDAO
+from src.models.country_dto import Country
+from src.models.vacation_dto import Vacation
+
+read_model_logger = logging.getLogger("jbproject.catalog_read_model")
+
+CATALOG_TABLES = ("vacations", "countries", "likes")
+# rebuilds in a row when the catalog keeps changing while it is read (the readers use the database meanwhile)
+_MAX_REBUILDS_PER_REFRESH = 3
+
+
+def _start_key(vacation: Vacation) -> Tuple[date, int]:
+    return vacation.vacation_start_date, vacation.vacation_id
+
+
+class CatalogReadModel:
+    """
+    Immutable in-memory view of the catalog (every vacation with its country name and likes count, and every country),
+    indexed by vacation id, by country and by start date. It is never modified: a change of the catalog builds
+    a new model that replaces it (copy-on-write), so any number of threads read it without a lock.
+    The returned lists are new, the Vacation / Country objects inside them are shared and must be treated as read-only.
+    """
+    def __init__(self, vacations: Iterable[Vacation], countries: Iterable[Country], versions: tuple, built_at: float | None = None):
+        self.versions = versions
+        self.built_at = time.monotonic() if built_at is None else built_at
+        self._by_start = tuple(sorted(vacations, key=_start_key))
+        self._start_keys = tuple(_start_key(vacation) for vacation in self._by_start)
+        self._by_id = MappingProxyType({vacation.vacation_id: vacation for vacation in self._by_start})
+        by_country = {}
+        for vacation in self._by_start:
+            by_country.setdefault(vacation.country_id, []).append(vacation)
+        self._by_country = MappingProxyType({country_id: tuple(country_vacations) for country_id, country_vacations in by_country.items()})
+        self._countries = tuple(countries)
+
+
+    def __len__(self) -> int:
+        return len(self._by_start)
+
+
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+
+    def get_all_vacations(self) -> List[Vacation]:
+        """
+        Returns all vacations ordered by (start date, id).
+        """
+        return list(self._by_start)
+
+
+    def get_vacation_by_id(self, vacation_id: int) -> Vacation | None:
+        return self._by_id.get(vacation_id)
+
+
+    def get_vacations_by_country(self, country_id: int) -> List[Vacation]:
+        """
+        Returns the vacations of one country ordered by (start date, id).
+        """
+        return list(self._by_country.get(country_id, ()))
+
+
+    def get_vacations_page(self, limit: int, after_start_date: date | None = None, after_vacation_id: int | None = None) -> List[Vacation]:
+        """
+        Same keyset page as VacationDAO.get_vacations_page: up to 'limit' vacations after the given (start date, id).
+        """
+        start = 0
+        if after_start_date is not None and after_vacation_id is not None:
+            start = bisect.bisect_right(self._start_keys, (after_start_date, after_vacation_id))
+        return list(self._by_start[start:start + limit])
+
+
+    def get_vacations_starting_between(self, from_date: date, to_date: date, limit: int = 100) -> List[Vacation]:
+        """
+        Same as VacationDAO.get_vacations_starting_between: vacations starting from_date..to_date (inclusive), by start date.
+        """
+        start = bisect.bisect_left(self._start_keys, (from_date,))
+        end = bisect.bisect_right(self._start_keys, (to_date, math.inf))
+        return list(self._by_start[start:min(end, start + limit)])
+
+
+    def get_all_countries(self) -> List[Country]:
+        return list(self._countries)
+
+
+    def with_likes_counts(self, likes_counts: Dict[int, int], versions: tuple) -> "CatalogReadModel":
+        """
+        Returns a new model with the given likes counts (vacations whose count is unchanged are shared with this model).
+        The rest of the catalog is not read again, so the new model keeps this one's age.
+        """
+        vacations = [vacation if likes_counts.get(vacation.vacation_id, vacation.likes_count) == vacation.likes_count
+                     else dataclasses.replace(vacation, likes_count=likes_counts[vacation.vacation_id]) for vacation in self._by_start]
+        return CatalogReadModel(vacations, self._countries, versions, built_at=self.built_at)
+
+
+class CatalogReadModels:
+    """
+    Keeps the catalog read model of every environment. A model is served only while the catalog tables have not been
+    written since it was built (same DAO cache table versions) and for at most 'ttl' seconds, like the DAO cache:
+    otherwise the reader gets None - and reads the database as before - while one background thread builds the new model
+    and swaps it in. Only the likes changed: just the likes counts are read again.
+    """
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._models = {}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stats = {"full_builds": 0, "likes_refreshes": 0, "refresh_failures": 0}
+
+
+    @staticmethod
+    def _versions(env: str) -> tuple:
+        return (dao_cache.generation, *dao_cache.table_versions(env, CATALOG_TABLES))
+
+
+    def current(self, env: str ='dev') -> CatalogReadModel | None:
+        """
+        Returns the environment's model if it is up to date, else None (and has it rebuilt in the background).
+        Never blocks: in the steady state this is a dictionary lookup and a version comparison.
+        """
+        uow = current_unit_of_work(env)
+        if uow is not None and uow.written_tables.intersection(CATALOG_TABLES):
+            # the open transaction must see its own uncommitted writes
+            return None
+
+        model = self._models.get(env)
+        if model is not None and model.versions == self._versions(env) and model.age() < self.ttl:
+            return model
+        self._schedule_refresh(env)
+        return None
+
+
+    def refresh(self, env: str ='dev') -> CatalogReadModel:
+        """
+        Builds the model of the current catalog (or only re-reads the likes counts if nothing else changed) and swaps it in.
+        """
+        for _ in range(_MAX_REBUILDS_PER_REFRESH):
+            # the versions are taken before reading, so a write during the read leaves the model outdated, never wrong
+            versions = self._versions(env)
+            model = self._models.get(env)
+            if model is not None and model.versions == versions and model.age() < self.ttl:
+                return model
+
+            if model is not None and model.versions[:-1] == versions[:-1] and model.age() < self.ttl:
+                model = model.with_likes_counts(VacationDAO(env=env).get_likes_counts(), versions)
+                stat = "likes_refreshes"
+            else:
+                model = CatalogReadModel(VacationDAO(env=env).get_all_vacations(), CountryDAO(env=env).get_all_countries(), versions)
+                stat = "full_builds"
+            with self._lock:
+                self._models[env] = model
+                self._stats[stat] += 1
+        return model
+
+
+    def _schedule_refresh(self, env: str) -> None:
+        with self._lock:
+            if env in self._refreshing:
+                return
+            self._refreshing.add(env)
+        threading.Thread(target=self._refresh_in_background, args=(env,), name=f"catalog-read-model-{env}", daemon=True).start()
+
+
+    def _refresh_in_background(self, env: str) -> None:
+        try:
+            self.refresh(env)
+        except Exception as e:
+            with self._lock:
+                self._stats["refresh_failures"] += 1
+            read_model_logger.warning(json.dumps({"event": "catalog_read_model_refresh_failed", "env": env, "error": str(e)}))
+        finally:
+            with self._lock:
+                self._refreshing.discard(env)
+
+
+    def get_stats(self) -> dict:
+        """
+        Returns the build counters and, per environment, the size and age of the model and whether it is up to date.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            models = dict(self._models)
+        stats["models"] = {env: {"vacations": len(model), "age_seconds": round(model.age(), 3),
+                                 "up_to_date": model.versions == self._versions(env) and model.age() < self.ttl}
+                           for env, model in models.items()}
+        return stats
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+    def reset_after_fork(self) -> None:
+        # a refresh thread does not survive a fork: the child keeps the inherited models and refreshes them itself
+        self._lock = threading.Lock()
+        self._refreshing = set()
+
+
+catalog_read_models = CatalogReadModels(ttl=dao_cache_ttl)
+os.register_at_fork(after_in_child=catalog_read_models.reset_after_fork)
+
+#
@@ -0,0 +1,142 @@
+# built-in packages
+import json
+import logging
+import os
+import socket
+import threading
+
+# internal packages
+from src.config import change_listener_reconnect_delay
+from src.dal.cache import dao_cache
+
+# external packages
+import psycopg as pg
+
+change_logger = logging.getLogger("jbproject.change_events")
+
+# the channel the table triggers notify on (migration 0009_table_change_notifications)
+CHANGE_CHANNEL = "table_changes"
+CHANGED_TABLES = ("roles", "users", "countries", "vacations", "likes")
+
+
+def application_name() -> str:
+    """
+    Returns the application_name of this process's database connections. The table triggers send it with every
+    notification, so the process skips the notifications of its own writes (their invalidation is already done).
+    """
+    return f"jbproject:{os.getpid()}:{socket.gethostname()}"[:63]
+
+
+class ChangeListener:
+    """
+    Listens, per environment, to the notifications of the writes made by other processes (other server workers,
+    jobs, psql) and invalidates the DAO cache tables they changed - and with them the ETags and the catalog read
+    model - as soon as the writing transaction commits.
+    One connection and one thread per environment; a lost connection is re-opened every 'reconnect_delay' seconds,
+    and since notifications sent meanwhile are lost, every table is invalidated once it is back.
+    """
+    def __init__(self, reconnect_delay: float):
+        self.reconnect_delay = reconnect_delay
+        self._lock = threading.Lock()
+        self._threads = {}
+        self._stop = threading.Event()
+        self._stats = {"notifications": 0, "own_writes_skipped": 0, "reconnects": 0}
+
+
+    def start(self, env: str, conn_info: str) -> None:
+        """
+        Starts listening to the environment's changes (once per process). The first LISTEN runs before returning,
+        so no write committed after this call is missed.
+        """
+        with self._lock:
+            if env in self._threads:
+                return
+            try:
+                conn = self._connect(conn_info)
+            except pg.OperationalError as e:
+                change_logger.warning(json.dumps({"event": "change_listener_connect_failed", "env": env, "error": str(e)}))
+                conn = None
+            thread = threading.Thread(target=self._listen_forever, args=(env, conn_info, conn, self._stop),
+                                      name=f"change-listener-{env}", daemon=True)
+            self._threads[env] = thread
+        thread.start()
+
+
+    @staticmethod
+    def _connect(conn_info: str) -> pg.Connection:
+        conn = pg.connect(conn_info, autocommit=True, application_name=application_name(), connect_timeout=2)
+        conn.execute(f"LISTEN {CHANGE_CHANNEL}")
+        return conn
+
+
+    def _listen_forever(self, env: str, conn_info: str, conn: pg.Connection | None, stop: threading.Event) -> None:
+        while not stop.is_set():
+            if conn is None:
+                try:
+                    conn = self._connect(conn_info)
+                except pg.OperationalError:
+                    stop.wait(self.reconnect_delay)
+                    continue
+                # the notifications sent while there was no listening connection are lost
+                dao_cache.invalidate(env, *CHANGED_TABLES)
+                with self._lock:
+                    self._stats["reconnects"] += 1
+
+            try:
+                for notify in conn.notifies(timeout=1.0):
+                    self._apply(env, notify.payload)
+            except pg.OperationalError as e:
+                change_logger.warning(json.dumps({"event": "change_listener_disconnected", "env": env, "error": str(e)}))
+                conn.close()
+                conn = None
+                stop.wait(self.reconnect_delay)
+
+        if conn is not None:
+            conn.close()
+
+
+    def _apply(self, env: str, payload: str) -> None:
+        change = json.loads(payload)
+        if change["origin"] == application_name():
+            with self._lock:
+                self._stats["own_writes_skipped"] += 1
+            return
+
+        dao_cache.invalidate(env, change["table"])
+        with self._lock:
+            self._stats["notifications"] += 1
+
+
+    def get_stats(self) -> dict:
+        """
+        Returns the counters (notifications applied, own writes skipped, reconnects) and the environments listened to.
+        """
+        with self._lock:
+            return {**self._stats, "listening": sorted(env for env, thread in self._threads.items() if thread.is_alive())}
+
+
+    def stop(self) -> None:
+        """
+        Stops the listener threads and closes their connections (e.g. on worker shutdown).
+        """
+        with self._lock:
+            stop, self._stop = self._stop, threading.Event()
+            threads = list(self._threads.values())
+            self._threads.clear()
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=2.0)
+
+
+    def reset_after_fork(self) -> None:
+        # the listener threads do not survive a fork and the inherited connections are the parent's:
+        # the child starts its own listener with its first connection pool
+        self._lock = threading.Lock()
+        self._threads = {}
+        self._stop = threading.Event()
+
+
+change_listener = ChangeListener(reconnect_delay=change_listener_reconnect_delay)
+os.register_at_fork(after_in_child=change_listener.reset_after_fork)
+
+#
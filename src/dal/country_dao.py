@@ -2,7 +2,8 @@
 from typing import List
 
 # internal packages
-from src.dal.database import prod_db_conn, dev_db_conn
+from src.dal.unit_of_work import get_connection
+from src.dal.cache import cached_read, invalidates
 from src.models.country_dto import Country
 
 # external packages 
@@ -13,15 +14,16 @@ import psycopg.rows as pgrows
 class CountryDAO:
     def __init__(self, env: str ='dev'):
         self.table_name = "countries"
-        self.db_conn = prod_db_conn if env == 'prod' else dev_db_conn
+        self.env = env
 
 
+    @cached_read("countries")
     def get_all_countries(self) -> List[Country]:
         """
         Retrieves all countries from the 'countries' table.
         Returns: List[Country]: A list of Country objects representing the countries in the table.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {};").format(Identifier(self.table_name))
             cur.execute(query)
             result = cur.fetchall()
@@ -31,29 +33,30 @@ class CountryDAO:
         return countries
 
 
+    @invalidates("countries")
     def add_country(self, country_name: str) -> Country:
         """
         Add a new country to the 'countries' table with the provided details.
         Args: country_name (str).
         Returns: dict: A dictionary representing the inserted country.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING *").format(
                 Identifier(self.table_name), Identifier("country_name"), Placeholder())
             cur.execute(query, (country_name,)) 
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return Country(country_id=result["country_id"], country_name=result["country_name"])
 
         
+    @cached_read("countries")
     def get_country_by_id(self, country_id: int) -> Country | None:
         """
         Retrieves a country from the 'countries' table by country_id.
         Args: country_id (int)
         Returns: Country: A Country object representing the country, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {} WHERE {} = {}").format(Identifier(self.table_name), Identifier("country_id"), Placeholder())
             cur.execute(query, (country_id,))
             result = cur.fetchone()
@@ -61,32 +64,68 @@ class CountryDAO:
         return Country(country_id=result["country_id"], country_name=result["country_name"]) if result else None
         
         
+    def get_existing_country_ids(self, country_ids: List[int]) -> set:
+        """
+        Checks many country ids in one query.
+        Args: country_ids (List[int])
+        Returns: set: The ids (out of the given ones) that exist in the 'countries' table.
+        """
+        with get_connection(self.env) as conn, conn.cursor() as cur:
+            query = SQL("SELECT {} FROM {} WHERE {} = ANY({})").format(
+                Identifier("country_id"), Identifier(self.table_name), Identifier("country_id"), Placeholder())
+            cur.execute(query, (list(country_ids),))
+            result = cur.fetchall()
+
+        return {row[0] for row in result}
+
+
+    @invalidates("countries")
     def update_country_value_by_id(self, country_id: int, column_to_update: str, new_value: str) -> Country| None:
         """
         Updates the value of a specific column for a country in the 'countries' table.
         Args: country_id (int), column_to_update (str), new_value (str).
         Returns: Country: A Country object representing the country, or None if not found.
         """
-        with self.db_conn.cursor() as cur:
+        with get_connection(self.env) as conn, conn.cursor() as cur:
             query = SQL("UPDATE {} SET {} = {} WHERE {} = {} RETURNING *").format(
                 Identifier(self.table_name), Identifier(column_to_update), Placeholder(), Identifier("country_id"),Placeholder())
             cur.execute(query, (new_value, country_id))
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return Country(country_id=result["country_id"], country_name=result["country_name"]) if result else None
         
         
+    @invalidates("countries")
+    def update_country_values_by_id(self, country_id: int, values: dict) -> Country | None:
+        """
+        Updates several columns of a country in the 'countries' table in a single statement.
+        Args: country_id (int), values (dict): column name -> new value, only the columns that changed.
+        Returns: Country: The updated country as a Country object, or None if not found.
+        """
+        if not values:
+            return self.get_country_by_id(country_id)
+
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("UPDATE {} SET {} WHERE {} = {} RETURNING *").format(
+                Identifier(self.table_name),
+                SQL(", ").join(SQL("{} = {}").format(Identifier(column), Placeholder()) for column in values),
+                Identifier("country_id"), Placeholder())
+            cur.execute(query, (*values.values(), country_id))
+            result = cur.fetchone()
+
+        return Country(country_id=result["country_id"], country_name=result["country_name"]) if result else None
+        
+        
+    @invalidates("countries")
     def delete_country_by_id(self, country_id: int) -> Country | None:
         """
         Deletes a country from the 'countries' table by country_id.
         Args: country_id (int)
         Returns: Country: A Country object representing the country, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("DELETE FROM {} WHERE {} = {} RETURNING *").format(Identifier(self.table_name), Identifier("country_id"), Placeholder())
             cur.execute(query, (country_id,))
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return Country(country_id=result["country_id"], country_name=result["country_name"]) if result else None
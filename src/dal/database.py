@@ -1,40 +1,133 @@
 # built-in packages
 import os
+import threading
 
 # internal packages
-from src.config import prod_db_conn_info, dev_db_conn_info
+from src.config import (prod_db_conn_info, dev_db_conn_info, db_pool_min_size, db_pool_max_size, db_pool_timeout,
+                        db_pool_max_idle, db_pool_max_lifetime, db_pool_reconnect_timeout, DB_STATEMENT_TIMEOUT_MS,
+                        DB_LOCK_TIMEOUT_MS)
+from src.dal.instrumentation import InstrumentedCursor, InstrumentedServerCursor
 
 # external packages
-import psycopg as pg
+from psycopg import Connection
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 
-try:
-    prod_db_conn = pg.connect(prod_db_conn_info)
-    dev_db_conn = pg.connect(dev_db_conn_info)
 
-except Exception as e:
-    print(f"Error connecting to DB: {e}")
+def _reconnect_failed(pool: ConnectionPool) -> None:
+    print(f"Error connecting to DB: pool '{pool.name}' could not reconnect within {db_pool_reconnect_timeout} seconds")
+
+
+def _configure_connection(conn: Connection) -> None:
+    # unlike cursor_factory, the server-side cursor class is not a connect() argument: it is set on every new connection
+    conn.server_cursor_factory = InstrumentedServerCursor
+
+
+def _create_pool(conn_info: str, name: str) -> ConnectionPool:
+    """
+    Creates a connection pool for one environment.
+    Connections are health-checked on checkout and replaced automatically when broken,
+    and their cursors - server-side ones included - are instrumented (statement count, DB time and slow-query log).
+    Every statement is bounded by the server-side statement_timeout / lock_timeout (set once, at connect time).
+    The connections carry this process's application_name, so it recognizes the change notifications of its own writes.
+    """
+    from src.dal.change_events import application_name
+
+    return ConnectionPool(
+        conn_info,
+        name=name,
+        min_size=db_pool_min_size,
+        max_size=db_pool_max_size,
+        timeout=db_pool_timeout,
+        max_idle=db_pool_max_idle,
+        max_lifetime=db_pool_max_lifetime,
+        reconnect_timeout=db_pool_reconnect_timeout,
+        reconnect_failed=_reconnect_failed,
+        check=ConnectionPool.check_connection,
+        configure=_configure_connection,
+        kwargs={"cursor_factory": InstrumentedCursor, "application_name": application_name(),
+                "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS} -c lock_timeout={DB_LOCK_TIMEOUT_MS}"},
+        open=True
+    )
+
+
+_conn_infos = {"prod": prod_db_conn_info, "dev": dev_db_conn_info}
+# pools are opened on first use, so importing this module (or starting a process that never queries an environment)
+# connects to nothing
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_db_pool(env: str ='dev') -> ConnectionPool:
+    """
+    Returns the connection pool of the given environment ('dev'/'prod'), opening it on first use
+    (together with the listener of the other processes' writes, which invalidates this process's DAO cache).
+    Use 'with pool.connection() as conn' to check out a connection; it is committed
+    (or rolled back on error) and returned to the pool when the block exits.
+    """
+    env = 'prod' if env == 'prod' else 'dev'
+    pool = _pools.get(env)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(env)
+            if pool is None:
+                from src.dal.change_events import change_listener
+
+                change_listener.start(env, _conn_infos[env])
+                pool = _pools[env] = _create_pool(_conn_infos[env], name=env)
+    return pool
+
+
+def close_pools() -> None:
+    """
+    Closes the connection pools opened by this process and stops its change listener (e.g. on worker shutdown).
+    """
+    from src.dal.change_events import change_listener
+
+    change_listener.stop()
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _forget_pools_after_fork() -> None:
+    # a forked worker must not use (or close) the parent's connections and the pool threads do not survive the fork:
+    # the child drops the inherited pools, its own are opened on first use
+    global _pools_lock
+    _pools.clear()
+    _pools_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_pools_after_fork)
+
+
+def get_pool_stats(env: str ='dev') -> dict:
+    """
+    Returns the current statistics of the environment's connection pool
+    (pool size, available connections, waiting requests, errors, etc.).
+    """
+    return get_db_pool(env).get_stats()
 
 
 def initialize_database(env: str ='dev') -> str:
     """
-    Initializes the database by dropping existing tables and recreating them 
-    using SQL commands from the 'init_db.sql' file.
+    Initializes the database from scratch by dropping existing tables and applying
+    all the migrations from the 'migrations' folder (used to reset the dev/test database).
     """
-    data_base = dev_db_conn if env == 'dev' else prod_db_conn
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sql_file_path = current_dir.replace('dal', 'init_db.sql')
+    from src.dal.cache import dao_cache
+    from src.dal.migrate import migrate_database
+
     try:
-        with open(sql_file_path, 'r', encoding='utf-8' ) as sql_file:
-            sql_commands = sql_file.read()
-        with data_base.cursor(row_factory=dict_row) as cur:
+        with get_db_pool(env).connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                "DROP TABLE IF EXISTS users, countries, likes, roles, vacations;")
-            cur.execute(sql_commands)
-            data_base.commit()
+                "DROP TABLE IF EXISTS users, countries, likes, roles, vacations, schema_migrations;")
+            conn.commit()
+        migrate_database(env=env)
+        dao_cache.clear()
 
     except Exception as e:
         print(f"Error initializing database: {e}")
-        data_base.rollback()
 
 #
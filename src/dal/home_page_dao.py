@@ -0,0 +1,61 @@
+# built-in packages
+import time
+from typing import List, Tuple
+
+# internal packages
+from src.dal.unit_of_work import get_connection
+from src.dal.instrumentation import record_pipeline_sync
+from src.models.vacation_dto import Vacation
+from src.models.country_dto import Country
+
+# external packages
+from psycopg.sql import SQL, Identifier, Placeholder
+import psycopg.rows as pgrows
+
+
+class HomePageDAO:
+    """
+    Reads everything the home page needs with the three queries sent together in pipeline mode:
+    one network round trip instead of one per query.
+    """
+    def __init__(self, env: str ='dev'):
+        self.env = env
+
+
+    def get_home_page_data(self, user_id: int, limit: int) -> Tuple[List[Vacation], List[Country], List[int]]:
+        """
+        Retrieves the first page of vacations (ordered by start date), all countries and the ids of the vacations the user liked.
+        Args: user_id (int), limit (int): number of vacations to read.
+        Returns: Tuple: The vacations, the countries and the liked vacation ids.
+        """
+        with get_connection(self.env) as conn:
+            with conn.pipeline():
+                vacations_cur = conn.cursor(row_factory=pgrows.dict_row)
+                vacations_cur.execute(SQL("""SELECT * FROM {} AS v JOIN {} AS c ON v.{} = c.{}
+                                             ORDER BY v.{}, v.{} LIMIT {}""").format(
+                    Identifier("vacations"), Identifier("countries"), Identifier("country_id"), Identifier("country_id"),
+                    Identifier("vacation_start_date"), Identifier("vacation_id"), Placeholder()), (limit,))
+                countries_cur = conn.cursor(row_factory=pgrows.dict_row)
+                countries_cur.execute(SQL("SELECT * FROM {}").format(Identifier("countries")))
+                likes_cur = conn.cursor()
+                likes_cur.execute(SQL("SELECT {} FROM {} WHERE {} = {}").format(
+                    Identifier("vacation_id"), Identifier("likes"), Identifier("user_id"), Placeholder()), (user_id,))
+
+                # the first fetch sends the queued queries and waits for all their results
+                started = time.perf_counter()
+                vacation_rows = vacations_cur.fetchall()
+                country_rows = countries_cur.fetchall()
+                like_rows = likes_cur.fetchall()
+                record_pipeline_sync((time.perf_counter() - started) * 1000, len(vacation_rows) + len(country_rows) + len(like_rows))
+
+            for cur in (vacations_cur, countries_cur, likes_cur):
+                cur.close()
+
+        vacations = [Vacation(vacation_id=row['vacation_id'], country_id=row['country_id'], country_name=row['country_name'],
+                              vacation_info=row['vacation_info'], vacation_start_date=row['vacation_start_date'],
+                              vacation_end_date=row['vacation_end_date'], price=row['price'], photo_file_path=row['photo_file_path'],
+                              likes_count=row['likes_count'], photo_variants=row['photo_variants']) for row in vacation_rows]
+        countries = [Country(country_id=row["country_id"], country_name=row["country_name"]) for row in country_rows]
+        return vacations, countries, [row[0] for row in like_rows]
+
+#
@@ -0,0 +1,220 @@
+# built-in packages
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+
+# internal packages
+from src.config import slow_query_threshold_ms, slow_query_max_statement_length, DB_STATEMENT_TIMEOUT_MS
+from src.dal.latency_budget import budgeted_statement
+
+# external packages
+import psycopg as pg
+from psycopg.sql import Composable
+
+slow_query_logger = logging.getLogger("jbproject.slow_queries")
+
+
+@dataclass
+class RequestQueryStats:
+    """
+    SQL and template timings collected while one request (or job) runs.
+    """
+    route: str | None = None
+    statements: int = 0
+    rows: int = 0
+    db_ms: float = 0.0
+    render_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "db_ms": round(self.db_ms, 3), "render_ms": round(self.render_ms, 3)}
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+@contextmanager
+def collect_query_stats(route: str | None = None):
+    """
+    Context manager: every statement executed inside the block (on any pooled connection) is
+    counted in the yielded RequestQueryStats.
+    """
+    token = start_query_stats(route)
+    try:
+        yield _current_stats.get()
+    finally:
+        end_query_stats(token)
+
+
+def start_query_stats(route: str | None = None):
+    """
+    Starts collecting statistics for the current request, returns the token for end_query_stats.
+    """
+    return _current_stats.set(RequestQueryStats(route=route))
+
+
+def end_query_stats(token) -> None:
+    _current_stats.reset(token)
+
+
+def get_query_stats() -> RequestQueryStats | None:
+    """
+    Returns the statistics of the current request, None outside of a request.
+    """
+    return _current_stats.get()
+
+
+def record_render_time(render_ms: float) -> None:
+    """
+    Adds template render time to the statistics of the current request.
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.render_ms += render_ms
+
+
+def record_pipeline_sync(duration_ms: float, rows: int) -> None:
+    """
+    Adds the wait for the results of a pipeline (whose statements were recorded when queued) to the statistics of the current request.
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.db_ms += duration_ms
+        stats.rows += rows
+
+
+def configure_slow_query_log(log_file: str | None) -> None:
+    """
+    Writes the slow-query log (one JSON object per line) to the given file, once per process.
+    Without a file the records go to the default logging handlers.
+    """
+    if not log_file or any(isinstance(handler, logging.FileHandler) for handler in slow_query_logger.handlers):
+        return
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    handler = logging.FileHandler(log_file, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.WARNING)
+
+
+class InstrumentedCursor(pg.Cursor):
+    """
+    Cursor used by the connection pools: times every statement (and COPY), adds it to the current request's
+    statistics and logs statements slower than slow_query_threshold_ms.
+    Statements run within the current latency budget (see latency_budget.budgeted_statement).
+    """
+    def execute(self, query, params=None, **kwargs):
+        # the pool's health check runs an empty statement on checkout, it is not a query of the request
+        if not query:
+            return super().execute(query, params, **kwargs)
+        with budgeted_statement(self.connection, DB_STATEMENT_TIMEOUT_MS):
+            started = time.perf_counter()
+            try:
+                return super().execute(query, params, **kwargs)
+            finally:
+                _record_statement(self, query, time.perf_counter() - started, self.rowcount)
+
+
+    def executemany(self, query, params_seq, **kwargs):
+        with budgeted_statement(self.connection, DB_STATEMENT_TIMEOUT_MS):
+            started = time.perf_counter()
+            try:
+                return super().executemany(query, params_seq, **kwargs)
+            finally:
+                _record_statement(self, query, time.perf_counter() - started, self.rowcount)
+
+
+    @contextmanager
+    def copy(self, statement, params=None, **kwargs):
+        # a COPY is recorded once it ends: its duration includes the rows written to (or read from) it
+        with budgeted_statement(self.connection, DB_STATEMENT_TIMEOUT_MS):
+            started = time.perf_counter()
+            try:
+                with super().copy(statement, params, **kwargs) as copy:
+                    yield copy
+            finally:
+                _record_statement(self, statement, time.perf_counter() - started, self.rowcount)
+
+
+class InstrumentedServerCursor(pg.ServerCursor):
+    """
+    Server-side (named) cursor used by the connection pools, instrumented like InstrumentedCursor:
+    the DECLARE and every FETCH round trip are timed and recorded with the rows they returned.
+    """
+    def execute(self, query, params=None, **kwargs):
+        with budgeted_statement(self.connection, DB_STATEMENT_TIMEOUT_MS):
+            started = time.perf_counter()
+            try:
+                return super().execute(query, params, **kwargs)
+            finally:
+                _record_statement(self, query, time.perf_counter() - started, 0)
+
+
+    def fetchone(self):
+        return self._fetch(lambda: super(InstrumentedServerCursor, self).fetchone(), "FETCH 1")
+
+
+    def fetchmany(self, size: int = 0):
+        return self._fetch(lambda: super(InstrumentedServerCursor, self).fetchmany(size),
+                           f"FETCH {size or self.arraysize}")
+
+
+    def fetchall(self):
+        return self._fetch(lambda: super(InstrumentedServerCursor, self).fetchall(), "FETCH ALL")
+
+
+    def __iter__(self):
+        # fetches itersize rows per round trip, like ServerCursor.__iter__, each of them recorded
+        while True:
+            rows = self.fetchmany(self.itersize)
+            yield from rows
+            if len(rows) < self.itersize:
+                break
+
+
+    def _fetch(self, fetch, statement: str):
+        with budgeted_statement(self.connection, DB_STATEMENT_TIMEOUT_MS):
+            started = time.perf_counter()
+            result = None
+            try:
+                result = fetch()
+                return result
+            finally:
+                rows = len(result) if isinstance(result, list) else int(result is not None)
+                _record_statement(self, f"{statement} FROM {self.name}", time.perf_counter() - started, rows)
+
+
+def _record_statement(cursor: pg.Cursor, query, duration: float, rows: int) -> None:
+    duration_ms = duration * 1000
+    rows = max(rows, 0)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.rows += rows
+        stats.db_ms += duration_ms
+
+    if duration_ms >= slow_query_threshold_ms:
+        slow_query_logger.warning(json.dumps({
+            "event": "slow_query",
+            "route": stats.route if stats is not None else None,
+            "duration_ms": round(duration_ms, 3),
+            "rows": rows,
+            "statement": _statement_text(query, cursor)[:slow_query_max_statement_length]
+        }, ensure_ascii=False))
+
+
+def _statement_text(query, cursor: pg.Cursor) -> str:
+    # parameters are never logged, only the statement with its placeholders
+    if isinstance(query, Composable):
+        try:
+            query = query.as_string(cursor)
+        except Exception:
+            query = repr(query)
+    elif isinstance(query, bytes):
+        query = query.decode("utf-8", errors="replace")
+    return " ".join(str(query).split())
+
+#
@@ -0,0 +1,265 @@
+# built-in packages
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+
+# internal packages
+from src.config import DAO_LATENCY_BUDGETS_MS, LATENCY_BUDGET_RETRY_AFTER
+
+# external packages
+import psycopg as pg
+from psycopg import errors as pg_errors
+from psycopg_pool import PoolTimeout
+
+budget_logger = logging.getLogger("jbproject.latency_budget")
+
+
+class LatencyBudgetExceeded(Exception):
+    """
+    Raised when a statement (or the wait for a pooled connection) does not fit in its latency budget:
+    the request or DAO method deadline passed, or the server's statement_timeout / lock_timeout cancelled it.
+    The routes answer it with '503 Service Unavailable' and a Retry-After header.
+    """
+    def __init__(self, budget: str, reason: str, retry_after: int = LATENCY_BUDGET_RETRY_AFTER):
+        super().__init__(f"Latency budget '{budget}' exceeded ({reason})")
+        self.budget = budget
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class _Budget:
+    name: str
+    deadline: float   # time.monotonic()
+
+
+_current_budget: ContextVar[_Budget | None] = ContextVar("latency_budget", default=None)
+
+
+def start_latency_budget(name: str, budget_ms: float | None):
+    """
+    Starts a latency budget for the current request (or DAO call): its statements must finish within budget_ms
+    from now. A budget never extends the one it is nested in, only tightens it. None means no budget of its own.
+    Returns the token for end_latency_budget.
+    """
+    current = _current_budget.get()
+    if budget_ms is not None:
+        deadline = time.monotonic() + budget_ms / 1000
+        if current is None or deadline < current.deadline:
+            current = _Budget(name, deadline)
+    return _current_budget.set(current)
+
+
+def end_latency_budget(token) -> None:
+    _current_budget.reset(token)
+
+
+@contextmanager
+def latency_budget(name: str, budget_ms: float | None):
+    """
+    Context manager: the statements executed inside the block must finish within budget_ms (see start_latency_budget).
+    """
+    token = start_latency_budget(name, budget_ms)
+    try:
+        yield
+    finally:
+        end_latency_budget(token)
+
+
+def budgeted(method):
+    """
+    Decorator for DAO methods: runs the method under its budget from DAO_LATENCY_BUDGETS_MS ('<DAO class>.<method>'),
+    methods without a configured budget are returned unchanged.
+    """
+    name = method.__qualname__
+    budget_ms = DAO_LATENCY_BUDGETS_MS.get(name)
+    if budget_ms is None:
+        return method
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with latency_budget(name, budget_ms):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def remaining_seconds() -> float | None:
+    """
+    Returns the seconds left in the current budget, None when no budget applies.
+    Raises LatencyBudgetExceeded when the budget is already spent (no statement is sent then).
+    """
+    budget = _current_budget.get()
+    if budget is None:
+        return None
+    remaining = budget.deadline - time.monotonic()
+    if remaining <= 0:
+        raise budget_exceeded(budget.name, "deadline")
+    return remaining
+
+
+class _BudgetStats:
+    """
+    Budget violations of this process, per budget and reason.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._violations = {}
+
+    def record(self, budget: str, reason: str) -> None:
+        with self._lock:
+            reasons = self._violations.setdefault(budget, {})
+            reasons[reason] = reasons.get(reason, 0) + 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            violations = {budget: dict(reasons) for budget, reasons in self._violations.items()}
+        return {"total_violations": sum(sum(reasons.values()) for reasons in violations.values()), "violations": violations}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._violations.clear()
+
+
+budget_stats = _BudgetStats()
+
+
+def budget_exceeded(budget: str, reason: str) -> LatencyBudgetExceeded:
+    """
+    Counts and logs a budget violation, returns the exception to raise.
+    """
+    budget_stats.record(budget, reason)
+    budget_logger.warning(json.dumps({"event": "latency_budget_exceeded", "budget": budget, "reason": reason}))
+    return LatencyBudgetExceeded(budget, reason)
+
+
+def as_budget_exceeded(error: Exception) -> LatencyBudgetExceeded | None:
+    """
+    Returns the budget violation a database error stands for (server statement_timeout / lock_timeout,
+    or no pooled connection freed in time), None for any other error.
+    """
+    budget = _current_budget.get()
+    name = budget.name if budget is not None else "database"
+    if isinstance(error, pg_errors.LockNotAvailable):
+        return budget_exceeded(name, "lock_timeout")
+    if isinstance(error, pg_errors.QueryCanceled):
+        return budget_exceeded(name, "statement_timeout" if "statement timeout" in str(error) else "cancelled")
+    if isinstance(error, PoolTimeout):
+        return budget_exceeded(name, "pool_timeout")
+    return None
+
+
+@dataclass(eq=False)
+class _Watch:
+    conn: pg.Connection
+    budget: str
+    deadline: float
+    done: bool = False
+    cancelled: bool = False
+    # held while the cancel request is sent, and by unwatch: the statement does not return before a cancel in progress ends
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class _StatementWatchdog:
+    """
+    One thread per process that cancels (client side, through a cancel request) the statements still running
+    at the deadline of their budget. Statements register before they are sent and unregister when they return.
+    The cancel request is sent outside the lock of the deadlines heap, so a server slow to answer it
+    does not hold up the registration of the other statements.
+    """
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._heap = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+
+    def watch(self, conn: pg.Connection, budget: str, deadline: float) -> _Watch:
+        watch = _Watch(conn, budget, deadline)
+        with self._condition:
+            heapq.heappush(self._heap, (deadline, next(self._sequence), watch))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="statement-watchdog", daemon=True)
+                self._thread.start()
+            if self._heap[0][2] is watch:
+                self._condition.notify()
+        return watch
+
+
+    def unwatch(self, watch: _Watch) -> None:
+        # the entry is dropped from the heap lazily; taking the watch's lock means a cancel in progress ends before
+        # the connection can send its next statement
+        with watch.lock:
+            watch.done = True
+
+
+    def _next_expired(self) -> _Watch:
+        # waits for the earliest deadline and takes its watch off the heap
+        with self._condition:
+            while True:
+                while self._heap and self._heap[0][2].done:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                return heapq.heappop(self._heap)[2]
+
+
+    def _run(self) -> None:
+        while True:
+            watch = self._next_expired()
+            with watch.lock:
+                if watch.done:
+                    continue
+                watch.cancelled = True
+                try:
+                    watch.conn.cancel_safe(timeout=1.0)
+                except Exception as e:
+                    budget_logger.warning(json.dumps({"event": "statement_cancel_failed", "budget": watch.budget, "error": str(e)}))
+
+
+    def reset_after_fork(self) -> None:
+        # the watchdog thread does not survive a fork, the child starts its own on first use
+        self._condition = threading.Condition()
+        self._heap = []
+        self._thread = None
+
+
+statement_watchdog = _StatementWatchdog()
+os.register_at_fork(after_in_child=statement_watchdog.reset_after_fork)
+
+
+@contextmanager
+def budgeted_statement(conn: pg.Connection, statement_timeout_ms: float):
+    """
+    Context manager around one statement: fails fast when the budget is already spent, and has the statement
+    cancelled at the budget deadline when it comes before the server's own statement_timeout.
+    The cancelled statement (or one stopped by statement_timeout / lock_timeout) raises LatencyBudgetExceeded.
+    """
+    remaining = remaining_seconds()
+    watch = None
+    if remaining is not None and remaining * 1000 < statement_timeout_ms:
+        budget = _current_budget.get()
+        watch = statement_watchdog.watch(conn, budget.name, budget.deadline)
+    try:
+        yield
+    except (pg_errors.QueryCanceled, pg_errors.LockNotAvailable) as e:
+        if watch is not None and watch.cancelled:
+            raise budget_exceeded(watch.budget, "deadline") from e
+        raise as_budget_exceeded(e) from e
+    finally:
+        if watch is not None:
+            statement_watchdog.unwatch(watch)
+
+#
@@ -1,19 +1,22 @@
 # built-in packages
-from typing import List
+from typing import List, Tuple, Iterator
 
 # internal packages
-from src.dal.database import prod_db_conn, dev_db_conn
+from src.dal.unit_of_work import get_connection
+from src.dal.latency_budget import budgeted
+from src.dal.cache import invalidates
 from src.models.like_dto import Like
 
 # external packages 
 from psycopg.sql import SQL, Identifier, Placeholder
+from psycopg.errors import ForeignKeyViolation
 import psycopg.rows as pgrows
 
 
 class LikeDAO:
     def __init__(self, env: str ='dev'):
         self.table_name = "likes"
-        self.db_conn = prod_db_conn if env == 'prod' else dev_db_conn
+        self.env = env
 
 
     def get_all_likes(self) -> List[Like]:
@@ -21,7 +24,7 @@ class LikeDAO:
         Retrieves all likes from the 'likes' table.
         Returns: List[Like]: A list of Like objects.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {};").format(Identifier(self.table_name))
             cur.execute(query)
             result = cur.fetchall()
@@ -33,26 +36,39 @@ class LikeDAO:
         """
         Retrieves a list of vacation_ids that the given user has liked.
         """
-        with self.db_conn.cursor() as cur:
+        with get_connection(self.env) as conn, conn.cursor() as cur:
             query = SQL("SELECT vacation_id FROM {} WHERE user_id = %s;").format(Identifier(self.table_name))
             cur.execute(query, (user_id,))
             rows = cur.fetchall()
         return [row[0] for row in rows]
 
 
+    def iter_all_likes(self, fetch_size: int = 1000) -> Iterator[Like]:
+        """
+        Streams all likes from the 'likes' table through a server-side cursor, fetching fetch_size rows per round trip,
+        so memory use does not grow with the table size. The connection is held until the iteration ends.
+        Returns: Iterator[Like]: Like objects, one at a time.
+        """
+        with get_connection(self.env) as conn, conn.cursor(name="likes_export", row_factory=pgrows.dict_row) as cur:
+            cur.itersize = fetch_size
+            cur.execute(SQL("SELECT * FROM {} ORDER BY {}").format(Identifier(self.table_name), Identifier("like_id")))
+            for row in cur:
+                yield Like(like_id=row["like_id"], user_id=row["user_id"], vacation_id=row["vacation_id"])
+
+
+    @invalidates("likes", scope_arg="user_id")
     def add_like(self, user_id: int, vacation_id: int) -> Like:
         """
         Adds a new like to the 'likes' table.
         Args: user_id (int), vacation_id (int)
         Returns: Like: The inserted like as a Like object.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING *").format(
                 Identifier(self.table_name),  
                 SQL(", ").join(map(Identifier, ["user_id", "vacation_id"])),
                 SQL(", ").join(Placeholder() for _ in range(2)))
             cur.execute(query, (user_id, vacation_id)) 
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return Like(like_id=result["like_id"], user_id=result["user_id"], vacation_id=result["vacation_id"])
@@ -64,7 +80,7 @@ class LikeDAO:
         Args: like_id (int).
         Returns: Like: The like as a Like object, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {} WHERE {} = {}").format(Identifier(self.table_name), Identifier("like_id"), Placeholder())
             cur.execute(query, (like_id,))
             result = cur.fetchone()
@@ -78,7 +94,7 @@ class LikeDAO:
         Args: user_id (int), vacation_id (int).
         Returns: Like: The like as a Like object, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {} WHERE {} = {} AND {} = {}").format(Identifier(self.table_name), Identifier("user_id"), Placeholder(),
                                                                              Identifier("vacation_id"), Placeholder())
             cur.execute(query, (user_id, vacation_id))
@@ -87,35 +103,96 @@ class LikeDAO:
         return Like(like_id=result["like_id"], user_id=result["user_id"], vacation_id=result["vacation_id"]) if result else None
     
         
+    @invalidates("likes")
     def update_like_value_by_id(self, like_id: int, column_to_update: str, new_value: int) -> Like | None:
         """
         Updates the value of a specific column for a like in the 'likes' table.
         Args: likes_id (int), column_to_update (str), new_value (str).
          Returns: Like: The updated like as a Like object, or None if not found
         """
-        with self.db_conn.cursor() as cur:
+        with get_connection(self.env) as conn, conn.cursor() as cur:
             query = SQL("UPDATE {} SET {} = {} WHERE {} = {} RETURNING *").format(
                 Identifier(self.table_name), Identifier(column_to_update), Placeholder(), Identifier("like_id"),Placeholder())
             cur.execute(query, (new_value, like_id))
-            self.db_conn.commit()
             result = cur.fetchone()
         
         return Like(like_id=result["like_id"], user_id=result["user_id"], vacation_id=result["vacation_id"]) if result else None
         
         
+    @invalidates("likes")
+    def update_like_values_by_id(self, like_id: int, values: dict) -> Like | None:
+        """
+        Updates several columns of a like in the 'likes' table in a single statement.
+        Args: like_id (int), values (dict): column name -> new value, only the columns that changed.
+        Returns: Like: The updated like as a Like object, or None if not found.
+        """
+        if not values:
+            return self.get_like_by_id(like_id)
+
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("UPDATE {} SET {} WHERE {} = {} RETURNING *").format(
+                Identifier(self.table_name),
+                SQL(", ").join(SQL("{} = {}").format(Identifier(column), Placeholder()) for column in values),
+                Identifier("like_id"), Placeholder())
+            cur.execute(query, (*values.values(), like_id))
+            result = cur.fetchone()
+
+        return Like(like_id=result["like_id"], user_id=result["user_id"], vacation_id=result["vacation_id"]) if result else None
+        
+        
+    @invalidates("likes", scope_arg="user_id")
     def delete_like(self, user_id: int, vacation_id: int) -> Like | None:
         """
         Deletes a like from the 'likes' table by like_id.
         Args: like_id (int)
         Returns: Like: The deleted like as a Like object, or None if not found
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("DELETE FROM {} WHERE {} = {} AND {} = {} RETURNING *").format(Identifier(self.table_name), Identifier("user_id"), Placeholder(),
                                                                                  Identifier("vacation_id"), Placeholder())
             cur.execute(query, (user_id, vacation_id))
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return Like(like_id=result["like_id"], user_id=result["user_id"], vacation_id=result["vacation_id"]) if result else None
 
+
+    @invalidates("likes", scope_arg="user_id")
+    @budgeted
+    def toggle_like(self, user_id: int, vacation_id: int, liked: bool | None = None) -> Tuple[bool, int] | None:
+        """
+        Toggles the like of a user on a vacation (or sets it when 'liked' is given) in one transaction,
+        relying on the unique (user_id, vacation_id) constraint so concurrent calls cannot create duplicates.
+        Args: user_id (int), vacation_id (int), liked (bool | None): None to toggle, True/False to set the like idempotently.
+        Returns: Tuple[bool, int]: Whether the vacation is now liked by the user and its updated likes_count, or None if the user or vacation is not found.
+        """
+        like_columns = SQL(", ").join(map(Identifier, ["user_id", "vacation_id"]))
+        if liked is None:
+            # a like is removed if it exists, otherwise inserted; a concurrent insert ends up as "liked" through the conflict
+            query = SQL("""WITH removed AS (DELETE FROM {table} WHERE {user_id} = %(user_id)s AND {vacation_id} = %(vacation_id)s RETURNING 1),
+                                added AS (INSERT INTO {table} ({columns}) SELECT %(user_id)s, %(vacation_id)s
+                                          WHERE NOT EXISTS (SELECT 1 FROM removed)
+                                          ON CONFLICT ({columns}) DO NOTHING)
+                           SELECT NOT EXISTS (SELECT 1 FROM removed)""")
+        elif liked:
+            query = SQL("""INSERT INTO {table} ({columns}) VALUES (%(user_id)s, %(vacation_id)s)
+                           ON CONFLICT ({columns}) DO NOTHING""")
+        else:
+            query = SQL("DELETE FROM {table} WHERE {user_id} = %(user_id)s AND {vacation_id} = %(vacation_id)s")
+        query = query.format(table=Identifier(self.table_name), columns=like_columns,
+                             user_id=Identifier("user_id"), vacation_id=Identifier("vacation_id"))
+        params = {"user_id": user_id, "vacation_id": vacation_id}
+
+        try:
+            # a savepoint inside a unit of work, so a missing user/vacation does not abort the whole transaction
+            with get_connection(self.env) as conn, conn.transaction(), conn.cursor() as cur:
+                cur.execute(query, params)
+                is_liked = cur.fetchone()[0] if liked is None else liked
+                cur.execute(SQL("SELECT {} FROM {} WHERE {} = {}").format(
+                    Identifier("likes_count"), Identifier("vacations"), Identifier("vacation_id"), Placeholder()), (vacation_id,))
+                result = cur.fetchone()
+        except ForeignKeyViolation:
+            return None
+
+        return (is_liked, result[0]) if result else None
+
 # 
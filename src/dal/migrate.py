@@ -0,0 +1,194 @@
+# built-in packages
+import argparse
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# internal packages
+from src.dal.database import get_db_pool
+
+# external packages
+import psycopg as pg
+from psycopg.sql import SQL, Identifier, Placeholder
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+MIGRATIONS_TABLE = "schema_migrations"
+
+# migration files are named '<4 digit version>_<name>.sql' and applied in version order
+_MIGRATION_FILE_PATTERN = re.compile(r"^(\d{4})_(\w+)\.sql$")
+# first line of a migration that must run outside a transaction (e.g. CREATE INDEX CONCURRENTLY)
+_NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+# pg_advisory_lock key, so two processes never migrate the same database at the same time
+_MIGRATION_LOCK_KEY = 8_240_501
+# pooled connections bound every statement (DB_STATEMENT_TIMEOUT_MS, DB_LOCK_TIMEOUT_MS); a migration may rewrite a whole
+# table or wait for another process's migration, so its transaction lifts both
+_UNBOUNDED_TRANSACTION = "SET LOCAL statement_timeout = 0; SET LOCAL lock_timeout = 0"
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    sql: str
+
+    @property
+    def transactional(self) -> bool:
+        return not self.sql.lstrip().startswith(_NO_TRANSACTION_MARKER)
+
+
+def get_migrations() -> List[Migration]:
+    """
+    Returns all migrations found in the migrations folder, sorted by version.
+    """
+    migrations = []
+    for file_name in sorted(os.listdir(MIGRATIONS_DIR)):
+        match = _MIGRATION_FILE_PATTERN.match(file_name)
+        if not match:
+            continue
+        with open(os.path.join(MIGRATIONS_DIR, file_name), 'r', encoding='utf-8') as sql_file:
+            migrations.append(Migration(version=int(match.group(1)), name=match.group(2), sql=sql_file.read()))
+
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError("Duplicate migration versions found in the migrations folder")
+
+    return migrations
+
+
+def get_applied_versions(env: str ='dev') -> set:
+    """
+    Returns the versions already applied to the environment's database.
+    """
+    with get_db_pool(env).connection() as conn, conn.cursor() as cur:
+        _ensure_migrations_table(cur)
+        cur.execute(SQL("SELECT {} FROM {}").format(Identifier("version"), Identifier(MIGRATIONS_TABLE)))
+        rows = cur.fetchall()
+
+    return {row[0] for row in rows}
+
+
+def get_migration_status(env: str ='dev') -> List[Tuple[Migration, bool]]:
+    """
+    Returns every known migration together with whether it is applied.
+    """
+    applied = get_applied_versions(env)
+    return [(migration, migration.version in applied) for migration in get_migrations()]
+
+
+def migrate_database(env: str ='dev', target_version: int | None = None) -> List[Migration]:
+    """
+    Applies all pending migrations (up to target_version, if given) to the environment's database, in version order.
+    Each migration runs in its own transaction and is recorded in the 'schema_migrations' table,
+    except migrations marked '-- migrate: no-transaction', whose statements run one by one in autocommit mode.
+    Returns: List[Migration]: The migrations that were applied.
+    """
+    pool = get_db_pool(env)
+    applied_now = []
+
+    with pool.connection() as lock_conn:
+        lock_conn.execute(_UNBOUNDED_TRANSACTION)
+        lock_conn.execute("SELECT pg_advisory_lock(%s)", (_MIGRATION_LOCK_KEY,))
+        # end the transaction right away, an open snapshot would block CREATE INDEX CONCURRENTLY
+        lock_conn.commit()
+        try:
+            with lock_conn.cursor() as cur:
+                _ensure_migrations_table(cur)
+                _baseline_existing_schema(cur)
+            lock_conn.commit()
+
+            applied = get_applied_versions(env)
+            for migration in get_migrations():
+                if migration.version in applied or (target_version is not None and migration.version > target_version):
+                    continue
+                _apply_migration(pool, migration)
+                applied_now.append(migration)
+
+        finally:
+            lock_conn.execute("SELECT pg_advisory_unlock(%s)", (_MIGRATION_LOCK_KEY,))
+            lock_conn.commit()
+
+    return applied_now
+
+
+def _ensure_migrations_table(cur: pg.Cursor) -> None:
+    cur.execute(SQL("""CREATE TABLE IF NOT EXISTS {} (
+                           version INT PRIMARY KEY,
+                           name VARCHAR(100) NOT NULL,
+                           applied_at TIMESTAMPTZ NOT NULL DEFAULT now())""").format(Identifier(MIGRATIONS_TABLE)))
+
+
+def _baseline_existing_schema(cur: pg.Cursor) -> None:
+    """
+    Databases created before migrations existed already have the initial schema (and data),
+    so version 1 is recorded as applied instead of being run again.
+    """
+    cur.execute(SQL("SELECT NOT EXISTS (SELECT 1 FROM {}) AND to_regclass('vacations') IS NOT NULL").format(
+        Identifier(MIGRATIONS_TABLE)))
+    if cur.fetchone()[0]:
+        initial = get_migrations()[0]
+        _record_migration(cur, initial)
+
+
+def _apply_migration(pool, migration: Migration) -> None:
+    if migration.transactional:
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(_UNBOUNDED_TRANSACTION)
+            cur.execute(migration.sql)
+            _record_migration(cur, migration)
+            conn.commit()
+        return
+
+    with pg.connect(pool.conninfo, autocommit=True) as conn:
+        for statement in _split_statements(migration.sql):
+            conn.execute(statement)
+    with pool.connection() as conn, conn.cursor() as cur:
+        _record_migration(cur, migration)
+        conn.commit()
+
+
+def _record_migration(cur: pg.Cursor, migration: Migration) -> None:
+    cur.execute(SQL("INSERT INTO {} ({}) VALUES ({}) ON CONFLICT DO NOTHING").format(
+        Identifier(MIGRATIONS_TABLE), SQL(", ").join(map(Identifier, ["version", "name"])), SQL(", ").join(Placeholder() for _ in range(2))),
+        (migration.version, migration.name))
+
+
+def _split_statements(sql: str) -> List[str]:
+    """
+    Splits a migration into single statements (a statement ends with ';' at the end of a line, outside $$ blocks).
+    Comment lines are dropped.
+    """
+    statements, current, in_dollar_quote = [], [], False
+    for line in sql.splitlines():
+        if not in_dollar_quote and line.strip().startswith("--"):
+            continue
+        if line.count("$$") % 2:
+            in_dollar_quote = not in_dollar_quote
+        current.append(line)
+        if not in_dollar_quote and line.rstrip().endswith(";"):
+            statements.append("\n".join(current).strip())
+            current = []
+
+    if "\n".join(current).strip():
+        statements.append("\n".join(current).strip())
+    return statements
+
+
+if __name__ == "__main__":
+    # usage: python -m src.dal.migrate --env prod [up [--target N] | status]
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    parser.add_argument("--env", choices=["dev", "prod"], default="dev")
+    parser.add_argument("command", nargs="?", choices=["up", "status"], default="up")
+    parser.add_argument("--target", type=int, default=None, help="apply migrations up to this version only")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        for migration, is_applied in get_migration_status(env=args.env):
+            print(f"[{'x' if is_applied else ' '}] {migration.version:04d} {migration.name}")
+    else:
+        applied_migrations = migrate_database(env=args.env, target_version=args.target)
+        for migration in applied_migrations:
+            print(f"[{args.env}] applied {migration.version:04d} {migration.name}")
+        print(f"[{args.env}] database is up to date ({len(applied_migrations)} migration(s) applied)")
+
+#
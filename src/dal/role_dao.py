@@ -2,7 +2,8 @@
 from typing import List
 
 # internal packages
-from src.dal.database import prod_db_conn, dev_db_conn
+from src.dal.unit_of_work import get_connection
+from src.dal.cache import cached_read, invalidates
 from src.models.role_dto import Role
 
 # external packages 
@@ -13,15 +14,16 @@ import psycopg.rows as pgrows
 class RoleDAO:
     def __init__(self, env: str ='dev'):
         self.table_name = "roles"
-        self.db_conn = prod_db_conn if env == 'prod' else dev_db_conn
+        self.env = env
 
 
+    @cached_read("roles")
     def get_all_roles(self) -> List[Role]:
         """
         Retrieves all roles from the 'roles' table.
         Returns: List[Role]: A list of Role enum objects.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {};").format(Identifier(self.table_name))
             cur.execute(query)
             result = cur.fetchall()
@@ -29,13 +31,14 @@ class RoleDAO:
         return [Role(row['role_name']) for row in result]
 
 
+    @invalidates("roles")
     def add_role(self, role_name: str) -> Role:
         """
         Add a new role to the 'roles' table with the provided details.
         Args: role_name (str).
         Returns: Role: A Role enum object representing the inserted role.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING *").format(Identifier(self.table_name), Identifier("role_name"), Placeholder())
             cur.execute(query, (role_name,))
             result = cur.fetchone()
@@ -43,13 +46,14 @@ class RoleDAO:
         return Role(result['role_name'])
         
         
+    @cached_read("roles")
     def get_role_by_id(self, role_id: int) -> Role | None:
         """
         Retrieves a role from the 'roles' table by role_id.
         Args: role_id (int).
         Returns: Role: A Role enum object, or None if no role is found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {} WHERE {} = {}").format(Identifier(self.table_name), Identifier("role_id"), Placeholder())
             cur.execute(query, (role_id,))
             result = cur.fetchone()
@@ -57,32 +61,32 @@ class RoleDAO:
         return Role(result['role_name']) if result else None
         
         
+    @invalidates("roles")
     def update_role_value_by_id(self, role_id: int, column_to_update: str, new_value: str) -> Role | None:
         """
         Updates the value of a specific column for a role in the 'roles' table.
         Args: roles_id (int), column_to_update (str), new_value (str).
         Returns: Role: A Role enum object, or None if no role is found.
         """
-        with self.db_conn.cursor() as cur:
+        with get_connection(self.env) as conn, conn.cursor() as cur:
             query = SQL("UPDATE {} SET {} = {} WHERE {} = {} RETURNING *").format(
                 Identifier(self.table_name), Identifier(column_to_update), Placeholder(), Identifier("role_id"),Placeholder())
             cur.execute(query, (new_value, role_id))
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return Role(result['role_name']) if result else None
         
         
+    @invalidates("roles")
     def delete_role_by_id(self, role_id: int) -> Role | None:
         """
         Deletes a role from the 'roles' table by role_id.
         Args: role_id (int)
         Returns: Role: A Role enum object, or None if no role is found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("DELETE FROM {} WHERE {} = {} RETURNING *").format(Identifier(self.table_name), Identifier("role_id"), Placeholder())
             cur.execute(query, (role_id,))
-            self.db_conn.commit()
             result = cur.fetchone()
 
         return Role(result['role_name']) if result else None
@@ -0,0 +1,179 @@
+# built-in packages
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterator
+
+# internal packages
+from src.config import db_pool_timeout
+from src.dal.database import get_db_pool
+from src.dal.latency_budget import LatencyBudgetExceeded, as_budget_exceeded, remaining_seconds
+
+# external packages
+import psycopg as pg
+from psycopg.pq import TransactionStatus
+
+
+class UnitOfWork:
+    """
+    One database transaction shared by every DAO call of a request (or of a service method).
+    The connection is checked out of the pool on the first statement only, so a unit of work that
+    never touches the database costs nothing. It ends with a single commit (one WAL flush) or a rollback,
+    after which the registered callbacks run (e.g. DAO cache invalidation of the written tables).
+    """
+    def __init__(self, env: str ='dev'):
+        self.env = env
+        self.written_tables = set()
+        self._conn = None
+        self._on_finish = []
+        self._finished = False
+
+
+    def connection(self) -> pg.Connection:
+        """
+        Returns the connection of the unit of work, checking it out of the pool on first use.
+        """
+        if self._finished:
+            raise RuntimeError("The unit of work is already committed or rolled back")
+        if self._conn is None:
+            self._conn = get_db_pool(self.env).getconn(timeout=_pool_wait_timeout())
+        return self._conn
+
+
+    def on_finish(self, callback: Callable, *args) -> None:
+        """
+        Registers a callback to run once the transaction is committed or rolled back.
+        """
+        self._on_finish.append((callback, args))
+
+
+    def commit(self) -> None:
+        """
+        Commits the transaction (rolls it back instead if a statement failed) and returns the connection to the pool.
+        """
+        if self._conn is not None and self._conn.info.transaction_status == TransactionStatus.INERROR:
+            self.rollback()
+            return
+        self._finish(commit=True)
+
+
+    def rollback(self) -> None:
+        """
+        Rolls back the transaction and returns the connection to the pool.
+        """
+        self._finish(commit=False)
+
+
+    def _finish(self, commit: bool) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        try:
+            if self._conn is not None:
+                try:
+                    if commit:
+                        self._conn.commit()
+                    else:
+                        self._conn.rollback()
+                finally:
+                    get_db_pool(self.env).putconn(self._conn)
+                    self._conn = None
+        finally:
+            for callback, args in self._on_finish:
+                callback(*args)
+
+
+_current_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar("unit_of_work", default=None)
+
+
+def current_unit_of_work(env: str ='dev') -> UnitOfWork | None:
+    """
+    Returns the unit of work open for the environment in the current context, if any.
+    """
+    uow = _current_unit_of_work.get()
+    return uow if uow is not None and uow.env == env else None
+
+
+def begin_unit_of_work(env: str ='dev'):
+    """
+    Opens a unit of work for the current context (see unit_of_work).
+    Returns the token to pass to end_unit_of_work.
+    """
+    return _current_unit_of_work.set(UnitOfWork(env))
+
+
+def end_unit_of_work(token, commit: bool) -> None:
+    """
+    Commits (or rolls back) the unit of work opened by begin_unit_of_work and closes it.
+    """
+    uow = _current_unit_of_work.get()
+    _current_unit_of_work.reset(token)
+    if commit:
+        uow.commit()
+    else:
+        uow.rollback()
+
+
+@contextmanager
+def unit_of_work(env: str ='dev') -> Iterator[UnitOfWork]:
+    """
+    Context manager: every DAO call of the environment inside the block runs in one transaction,
+    committed when the block exits and rolled back if it raises.
+    Nested blocks join the outer unit of work, which alone commits.
+    """
+    current = current_unit_of_work(env)
+    if current is not None:
+        yield current
+        return
+
+    token = begin_unit_of_work(env)
+    try:
+        yield _current_unit_of_work.get()
+    except BaseException:
+        end_unit_of_work(token, commit=False)
+        raise
+    end_unit_of_work(token, commit=True)
+
+
+def transactional(method):
+    """
+    Decorator for service methods: runs the method (all its DAO calls) in one unit of work of self.env.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with unit_of_work(self.env):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _pool_wait_timeout() -> float:
+    # a request does not wait for a free connection longer than what is left of its latency budget
+    remaining = remaining_seconds()
+    return db_pool_timeout if remaining is None else min(db_pool_timeout, remaining)
+
+
+@contextmanager
+def get_connection(env: str ='dev') -> Iterator[pg.Connection]:
+    """
+    Returns the connection DAOs run their statements on: the one of the open unit of work,
+    or else a pooled connection that is committed (or rolled back on error) when the block exits.
+    Statements stopped by statement_timeout / lock_timeout, and a wait for a pooled connection that outlasts
+    the latency budget, raise LatencyBudgetExceeded.
+    """
+    try:
+        uow = current_unit_of_work(env)
+        if uow is not None:
+            yield uow.connection()
+            return
+
+        with get_db_pool(env).connection(timeout=_pool_wait_timeout()) as conn:
+            yield conn
+    except LatencyBudgetExceeded:
+        raise
+    except Exception as e:
+        budget_error = as_budget_exceeded(e)
+        if budget_error is None:
+            raise
+        raise budget_error from e
+
+#
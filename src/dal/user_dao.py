@@ -1,8 +1,9 @@
 # built-in packages
-from typing import List
+from typing import List, Iterator
 
 # internal packages
-from src.dal.database import prod_db_conn, dev_db_conn
+from src.dal.unit_of_work import get_connection
+from src.dal.cache import invalidates
 from src.models.user_dto import User
 
 # external packages 
@@ -13,7 +14,7 @@ import psycopg.rows as pgrows
 class UserDAO:
     def __init__(self, env: str ='dev'):
         self.table_name = "users"
-        self.db_conn = prod_db_conn if env == 'prod' else dev_db_conn
+        self.env = env
 
 
     def get_all_users(self) -> List[User]:
@@ -21,7 +22,7 @@ class UserDAO:
         Retrieves all users from the 'users' table.
         Returns: List[User]: A list of User objects.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {};").format(Identifier(self.table_name))
             cur.execute(query)
             result = cur.fetchall()
@@ -30,17 +31,31 @@ class UserDAO:
                      email=row['email'], hashed_password=row['hashed_password'], role_id=row['role_id']) for row in result]
 
 
+    def iter_all_users(self, fetch_size: int = 1000) -> Iterator[User]:
+        """
+        Streams all users from the 'users' table through a server-side cursor, fetching fetch_size rows per round trip,
+        so memory use does not grow with the table size. The connection is held until the iteration ends.
+        Returns: Iterator[User]: User objects, one at a time.
+        """
+        with get_connection(self.env) as conn, conn.cursor(name="users_export", row_factory=pgrows.dict_row) as cur:
+            cur.itersize = fetch_size
+            cur.execute(SQL("SELECT * FROM {} ORDER BY {}").format(Identifier(self.table_name), Identifier("user_id")))
+            for row in cur:
+                yield User(user_id=row['user_id'], first_name=row['first_name'], last_name=row['last_name'],
+                           email=row['email'], hashed_password=row['hashed_password'], role_id=row['role_id'])
+
+
+    @invalidates("users")
     def add_user(self, first_name: str, last_name: str, email: str, hashed_password: str) -> User:
         """
         Add a new user to the 'users' table with the provided details.
         Returns: User: A User object representing the inserted user, including all columns and their values.
         """
         role_id = 1
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("INSERT INTO {} (first_name, last_name, email, hashed_password, role_id) VALUES (%s, %s, %s, %s, %s) RETURNING *").format(
                 Identifier(self.table_name))
             cur.execute(query, (first_name, last_name, email, hashed_password, role_id))
-            self.db_conn.commit()
             result = cur.fetchone()
         
         return User(user_id=result['user_id'], first_name=result['first_name'], last_name=result['last_name'],
@@ -53,7 +68,7 @@ class UserDAO:
         Args: user_id (int).
         Returns: User: A User object representing the user with the specified user_id, or None if no user is found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {} WHERE {} = {}").format(Identifier(self.table_name), Identifier("user_id"), Placeholder())
             cur.execute(query, (user_id,))
             result = cur.fetchone()
@@ -63,33 +78,55 @@ class UserDAO:
                     email=result['email'], hashed_password=result['hashed_password'], role_id=result['role_id']) if result else None
         
         
+    @invalidates("users")
     def update_user_value_by_id(self, user_id: int, column_to_update: str, new_value: str) -> User | None:
         """
         Updates the value of a specific column for a user in the 'users' table.
         Args: user_id (int), column_to_update (str), new_value (str).
         Returns: User: A User object representing the user, or None if not found.
         """
-        with self.db_conn.cursor() as cur:
+        with get_connection(self.env) as conn, conn.cursor() as cur:
             query = SQL("UPDATE {} SET {} = {} WHERE {} = {} RETURNING *").format(
                 Identifier(self.table_name), Identifier(column_to_update), Placeholder(), Identifier("user_id"),Placeholder())
             cur.execute(query, (new_value, user_id))
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return User(user_id=result['user_id'], first_name=result['first_name'], last_name=result['last_name'],
                 email=result['email'], hashed_password=result['hashed_password'], role_id=result['role_id']) if result else None
         
         
+    @invalidates("users")
+    def update_user_values_by_id(self, user_id: int, values: dict) -> User | None:
+        """
+        Updates several columns of a user in the 'users' table in a single statement.
+        Args: user_id (int), values (dict): column name -> new value, only the columns that changed.
+        Returns: User: The updated user as a User object, or None if not found.
+        """
+        if not values:
+            return self.get_user_by_id(user_id)
+
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("UPDATE {} SET {} WHERE {} = {} RETURNING *").format(
+                Identifier(self.table_name),
+                SQL(", ").join(SQL("{} = {}").format(Identifier(column), Placeholder()) for column in values),
+                Identifier("user_id"), Placeholder())
+            cur.execute(query, (*values.values(), user_id))
+            result = cur.fetchone()
+
+        return User(user_id=result['user_id'], first_name=result['first_name'], last_name=result['last_name'],
+                    email=result['email'], hashed_password=result['hashed_password'], role_id=result['role_id']) if result else None
+        
+        
+    @invalidates("users", "likes")
     def delete_user_by_id(self, user_id: int) -> User | None:
         """
         Deletes a user from the 'users' table by user_id.
         Args: user_id (int).
         Returns: User: A User object representing the user, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("DELETE FROM {} WHERE {} = {} RETURNING *").format(Identifier(self.table_name), Identifier("user_id"), Placeholder())
             cur.execute(query, (user_id,))
-            self.db_conn.commit()
             result = cur.fetchone()
 
         return User(user_id=result['user_id'], first_name=result['first_name'], last_name=result['last_name'],
@@ -102,7 +139,7 @@ class UserDAO:
         Args: email (str), hashed_password (str).
         Returns: User: A User object representing the user with the specified email and hashed_password, or None if no user is found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {} WHERE {} = {} AND {} = {}").format(
                 Identifier(self.table_name), Identifier("email"), Placeholder(), Identifier("hashed_password"), Placeholder())
             cur.execute(query, (email, hashed_password))
@@ -119,7 +156,7 @@ class UserDAO:
         Args: email (str).
         Returns: User: A User object representing the user with the specified email and hashed_password, or None if no user is found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("SELECT * FROM {} WHERE {} = {}").format(
                 Identifier(self.table_name), Identifier("email"), Placeholder())
             cur.execute(query, (email,))
@@ -136,7 +173,7 @@ class UserDAO:
         Args: email (str).
         Returns: bool: True if the email exists, False otherwise.
         """
-        with self.db_conn.cursor() as cur:
+        with get_connection(self.env) as conn, conn.cursor() as cur:
             query = SQL("SELECT EXISTS (SELECT 1 FROM {} WHERE {} = {})").format(
                 Identifier(self.table_name), Identifier("email"), Placeholder()
             )
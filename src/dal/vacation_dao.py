@@ -1,34 +1,40 @@
 # built-in packages
-from typing import List
+from typing import Dict, List, Iterator, Tuple
 from datetime import date
 
 # internal packages
-from src.dal.database import dev_db_conn, prod_db_conn
+from src.dal.unit_of_work import get_connection
+from src.dal.latency_budget import budgeted
+from src.dal.cache import cached_read, invalidates
 from src.models.vacation_dto import Vacation
+from src.models.vacation_search_dto import CountryFacet
 
 # external packages 
 from psycopg.sql import SQL, Identifier, Placeholder
+from psycopg.types.json import Jsonb
 import psycopg.rows as pgrows
 
+# the full-text search vector of a vacation 'v': the expression of the GIN index of migration 0006_vacation_search_indexes,
+# which only applies to a query using this very expression
+SEARCH_VECTOR = SQL(r"""(to_tsvector('simple', coalesce(v.vacation_info, ''))
+    || to_tsvector('simple', regexp_replace(coalesce(v.vacation_info, ''), '(^|\s)[ובהלמשכ](\S)', '\1\2', 'g')))""")
+
 
 class VacationDAO:
     def __init__(self, env: str ='dev'):
         self.table_name = "vacations"
-        self.db_conn = prod_db_conn if env == 'prod' else dev_db_conn
+        self.env = env
 
 
+    @cached_read("vacations", "countries", "likes")
     def get_all_vacations(self) -> List[Vacation]:
         """
         Retrieves all vacations from the 'vacations' table.
         Returns: List[Vacation]: A list of Vacation objects.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
-            query = SQL("""SELECT *, (SELECT COUNT(*) FROM {} AS l WHERE l.{} = v.{}) AS likes_count
-                            FROM {} AS v JOIN {} AS c ON v.{} = c.{} ORDER BY {};"""
-                            ).format(Identifier("likes"),
-                                     Identifier("vacation_id"),
-                                     Identifier("vacation_id"),
-                                     Identifier(self.table_name),
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("""SELECT * FROM {} AS v JOIN {} AS c ON v.{} = c.{} ORDER BY {};"""
+                            ).format(Identifier(self.table_name),
                                      Identifier("countries"),
                                      Identifier("country_id"),
                                      Identifier("country_id"),
@@ -38,36 +44,234 @@ class VacationDAO:
             
         return [Vacation(vacation_id=row['vacation_id'], country_id=row['country_id'], country_name=row['country_name'], vacation_info=row['vacation_info'],
                          vacation_start_date=row['vacation_start_date'], vacation_end_date=row['vacation_end_date'], price=row['price'],
-                         photo_file_path=row['photo_file_path'], likes_count=row['likes_count']) for row in result]
+                         photo_file_path=row['photo_file_path'], likes_count=row['likes_count'], photo_variants=row['photo_variants']) for row in result]
+
+
+    def get_likes_counts(self) -> Dict[int, int]:
+        """
+        Retrieves the likes count of every vacation (read by the catalog read model when only likes changed).
+        Returns: Dict[int, int]: vacation_id -> likes_count.
+        """
+        with get_connection(self.env) as conn, conn.cursor() as cur:
+            cur.execute(SQL("SELECT {}, {} FROM {};").format(Identifier("vacation_id"), Identifier("likes_count"), Identifier(self.table_name)))
+            return dict(cur.fetchall())
+
+
+    def iter_all_vacations(self, fetch_size: int = 1000) -> Iterator[Vacation]:
+        """
+        Streams all vacations (with their country name) through a server-side cursor, fetching fetch_size rows per round trip,
+        so memory use does not grow with the table size. The connection is held until the iteration ends.
+        Returns: Iterator[Vacation]: Vacation objects, one at a time.
+        """
+        with get_connection(self.env) as conn, conn.cursor(name="vacations_export", row_factory=pgrows.dict_row) as cur:
+            cur.itersize = fetch_size
+            cur.execute(SQL("SELECT * FROM {} AS v JOIN {} AS c ON v.{} = c.{} ORDER BY v.{}").format(
+                Identifier(self.table_name), Identifier("countries"), Identifier("country_id"), Identifier("country_id"),
+                Identifier("vacation_id")))
+            for row in cur:
+                yield Vacation(vacation_id=row['vacation_id'], country_id=row['country_id'], country_name=row['country_name'],
+                               vacation_info=row['vacation_info'], vacation_start_date=row['vacation_start_date'],
+                               vacation_end_date=row['vacation_end_date'], price=row['price'], photo_file_path=row['photo_file_path'],
+                               likes_count=row['likes_count'], photo_variants=row['photo_variants'])
+
+
+    @cached_read("vacations", "countries", "likes")
+    def get_vacations_page(self, limit: int, after_start_date: date | None = None, after_vacation_id: int | None = None) -> List[Vacation]:
+        """
+        Retrieves one page of vacations ordered by (vacation_start_date, vacation_id), using keyset pagination.
+        Args: limit (int), after_start_date (date) and after_vacation_id (int) of the last vacation of the previous page (None for the first page).
+        Returns: List[Vacation]: Up to 'limit' Vacation objects that come after the given key.
+        """
+        keyset_filter = SQL("")
+        params = []
+        if after_start_date is not None and after_vacation_id is not None:
+            keyset_filter = SQL("WHERE (v.{}, v.{}) > ({}, {})").format(
+                Identifier("vacation_start_date"), Identifier("vacation_id"), Placeholder(), Placeholder())
+            params += [after_start_date, after_vacation_id]
+
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("""SELECT * FROM {} AS v JOIN {} AS c ON v.{} = c.{}
+                           {} ORDER BY v.{}, v.{} LIMIT {};""").format(
+                Identifier(self.table_name), Identifier("countries"), Identifier("country_id"), Identifier("country_id"),
+                keyset_filter, Identifier("vacation_start_date"), Identifier("vacation_id"), Placeholder())
+            cur.execute(query, (*params, limit))
+            result = cur.fetchall()
+
+        return [Vacation(vacation_id=row['vacation_id'], country_id=row['country_id'], country_name=row['country_name'], vacation_info=row['vacation_info'],
+                         vacation_start_date=row['vacation_start_date'], vacation_end_date=row['vacation_end_date'], price=row['price'],
+                         photo_file_path=row['photo_file_path'], likes_count=row['likes_count'], photo_variants=row['photo_variants']) for row in result]
+
+
+    @cached_read("vacations", "countries", "likes")
+    @budgeted
+    def search_vacations(self, terms: Tuple[Tuple[str, Tuple[int, ...]], ...] = (), country_ids: Tuple[int, ...] = (), min_price: int | None = None,
+                         max_price: int | None = None, start_from: date | None = None, start_to: date | None = None,
+                         price_buckets: Tuple[int, ...] = (), limit: int = 12, offset: int = 0
+                         ) -> Tuple[List[Vacation], int, List[CountryFacet], dict]:
+        """
+        Searches the vacations and computes the facet counts of the search, all in a single query.
+        A vacation matches when every search word is a prefix of a word of its vacation_info (full-text, GIN index) or names its country,
+        its country is one of country_ids (any country if empty), its price is in [min_price, max_price] and it starts in [start_from, start_to].
+        The country facet ignores the country filter and the price facet ignores the price filter, so every option shows how many
+        vacations selecting it would give.
+        Args: terms (Tuple[Tuple[str, Tuple[int, ...]], ...]): (search word (letters and digits only), ids of the countries whose name matches it),
+              country_ids (Tuple[int, ...]), min_price / max_price (int), start_from / start_to (date), price_buckets (Tuple[int, ...]): ascending bucket edges, limit (int), offset (int).
+        Returns: Tuple: The vacations of the requested page ordered by start date, the total number of matches,
+                 the country facets, and the number of vacations per price bucket (index from 0, below the first edge, to len(price_buckets)).
+        """
+        params = {"country_ids": list(country_ids), "min_price": min_price, "max_price": max_price, "start_from": start_from,
+                  "start_to": start_to, "buckets": list(price_buckets), "limit": limit, "offset": offset}
+
+        filters = [SQL("TRUE")]
+        for index, (word, word_country_ids) in enumerate(terms):
+            params[f"word_{index}"], params[f"word_{index}_countries"] = f"{word}:*", list(word_country_ids)
+            if word_country_ids:
+                filters.append(SQL(f"({{search}} @@ to_tsquery('simple', %(word_{index})s) OR v.{{country_id}} = ANY(%(word_{index}_countries)s))"))
+            else:
+                filters.append(SQL(f"{{search}} @@ to_tsquery('simple', %(word_{index})s)"))
+        if start_from is not None:
+            filters.append(SQL("v.{start_date} >= %(start_from)s"))
+        if start_to is not None:
+            filters.append(SQL("v.{start_date} <= %(start_to)s"))
+        country_filter = SQL("v.{country_id} = ANY(%(country_ids)s)") if country_ids else SQL("TRUE")
+        price_filters = [SQL("TRUE")]
+        if min_price is not None:
+            price_filters.append(SQL("v.{price} >= %(min_price)s"))
+        if max_price is not None:
+            price_filters.append(SQL("v.{price} <= %(max_price)s"))
+
+        identifiers = {"vacations": Identifier(self.table_name), "countries": Identifier("countries"), "search": SEARCH_VECTOR,
+                       "country_id": Identifier("country_id"), "country_name": Identifier("country_name"), "price": Identifier("price"),
+                       "start_date": Identifier("vacation_start_date"), "vacation_id": Identifier("vacation_id")}
+        base_filter = SQL(" AND ").join(base_filter.format(**identifiers) for base_filter in filters)
+        country_filter = country_filter.format(**identifiers)
+        price_filter = SQL(" AND ").join(price_filter.format(**identifiers) for price_filter in price_filters)
+
+        # one scan of the matching vacations, grouped by (country, price bucket, in the price range): a few hundred rows
+        # at most, from which the total and both facets are summed up; the page itself walks the start date index
+        query = SQL("""WITH counts AS (SELECT v.{country_id}, width_bucket(v.{price}, %(buckets)s::int[]) AS bucket,
+                                              {price_filter} AS in_price_range, COUNT(*) AS count
+                                       FROM {vacations} AS v WHERE {base_filter} GROUP BY 1, 2, 3)
+                       SELECT (SELECT COALESCE(SUM(count), 0)::int FROM counts AS v WHERE in_price_range AND {country_filter}) AS total,
+                              (SELECT COALESCE(jsonb_agg(facet), '[]') FROM
+                                   (SELECT c.{country_id}, c.{country_name}, SUM(v.count)::int AS count
+                                    FROM counts AS v JOIN {countries} AS c ON v.{country_id} = c.{country_id}
+                                    WHERE v.in_price_range GROUP BY c.{country_id}, c.{country_name}
+                                    ORDER BY count DESC, c.{country_name}) AS facet) AS country_facets,
+                              (SELECT COALESCE(jsonb_object_agg(bucket, count), '{{}}') FROM
+                                   (SELECT bucket, SUM(count)::int AS count FROM counts AS v WHERE {country_filter} GROUP BY bucket) AS facet
+                              ) AS price_facets,
+                              (SELECT COALESCE(jsonb_agg(to_jsonb(page) ORDER BY page.{start_date}, page.{vacation_id}), '[]') FROM
+                                   (SELECT v.{vacation_id}, v.{country_id}, c.{country_name}, v.vacation_info, v.{start_date},
+                                           v.vacation_end_date, v.{price}, v.photo_file_path, v.likes_count, v.photo_variants
+                                    FROM {vacations} AS v JOIN {countries} AS c ON v.{country_id} = c.{country_id}
+                                    WHERE {base_filter} AND {country_filter} AND {price_filter}
+                                    ORDER BY v.{start_date}, v.{vacation_id} LIMIT %(limit)s OFFSET %(offset)s) AS page) AS vacations""").format(
+            base_filter=base_filter, country_filter=country_filter, price_filter=price_filter, **identifiers)
+
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            cur.execute(query, params)
+            result = cur.fetchone()
+
+        vacations = [Vacation(vacation_id=row['vacation_id'], country_id=row['country_id'], country_name=row['country_name'],
+                              vacation_info=row['vacation_info'], vacation_start_date=date.fromisoformat(row['vacation_start_date']),
+                              vacation_end_date=date.fromisoformat(row['vacation_end_date']), price=row['price'],
+                              photo_file_path=row['photo_file_path'], likes_count=row['likes_count'], photo_variants=row['photo_variants'])
+                     for row in result['vacations']]
+        country_facets = [CountryFacet(country_id=row['country_id'], country_name=row['country_name'], count=row['count'])
+                          for row in result['country_facets']]
+        price_counts = {int(bucket): count for bucket, count in result['price_facets'].items()}
+        return vacations, result['total'], country_facets, price_counts
+
+
+    @cached_read("vacations", "countries", "likes")
+    @budgeted
+    def get_vacations_overlapping(self, start_date: date, end_date: date, limit: int = 100) -> List[Vacation]:
+        """
+        Retrieves the vacations whose dates overlap the window [start_date, end_date] (both days included), ordered by start date.
+        The overlapping vacations are the ones already running on start_date, found with the GiST index on
+        daterange(vacation_start_date, vacation_end_date), and the ones starting later within the window, read in order
+        from the start date index; only their first 'limit' keys are sorted and only those rows are fetched.
+        Args: start_date (date), end_date (date), limit (int).
+        Returns: List[Vacation]: Up to 'limit' Vacation objects ordered by start date.
+        """
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("""WITH page AS ((SELECT {start}, {vacation_id} FROM {vacations}
+                                          WHERE daterange({start}, {end}, '[]') && daterange(%(start_date)s, %(start_date)s, '[]'))
+                                         UNION ALL
+                                         (SELECT {start}, {vacation_id} FROM {vacations}
+                                          WHERE {start} > %(start_date)s AND {start} <= %(end_date)s
+                                          ORDER BY {start}, {vacation_id} LIMIT %(limit)s)
+                                         ORDER BY 1, 2 LIMIT %(limit)s)
+                           SELECT v.*, c.{country_name} FROM page AS p JOIN {vacations} AS v ON v.{vacation_id} = p.{vacation_id}
+                           JOIN {countries} AS c ON v.{country_id} = c.{country_id}
+                           ORDER BY v.{start}, v.{vacation_id}""").format(
+                vacations=Identifier(self.table_name), countries=Identifier("countries"), start=Identifier("vacation_start_date"),
+                end=Identifier("vacation_end_date"), vacation_id=Identifier("vacation_id"), country_id=Identifier("country_id"),
+                country_name=Identifier("country_name"))
+            cur.execute(query, {"start_date": start_date, "end_date": end_date, "limit": limit})
+            result = cur.fetchall()
+
+        return [Vacation(vacation_id=row['vacation_id'], country_id=row['country_id'], country_name=row['country_name'], vacation_info=row['vacation_info'],
+                         vacation_start_date=row['vacation_start_date'], vacation_end_date=row['vacation_end_date'], price=row['price'],
+                         photo_file_path=row['photo_file_path'], likes_count=row['likes_count'], photo_variants=row['photo_variants']) for row in result]
+
+
+    @cached_read("vacations", "countries", "likes")
+    @budgeted
+    def get_vacations_starting_between(self, from_date: date, to_date: date, limit: int = 100) -> List[Vacation]:
+        """
+        Retrieves the vacations that start between from_date and to_date (both included), using the start date index.
+        Args: from_date (date), to_date (date), limit (int).
+        Returns: List[Vacation]: Up to 'limit' Vacation objects ordered by start date.
+        """
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("""SELECT * FROM {} AS v JOIN {} AS c ON v.{} = c.{}
+                           WHERE v.{} BETWEEN {} AND {}
+                           ORDER BY v.{}, v.{} LIMIT {}""").format(
+                Identifier(self.table_name), Identifier("countries"), Identifier("country_id"), Identifier("country_id"),
+                Identifier("vacation_start_date"), Placeholder(), Placeholder(),
+                Identifier("vacation_start_date"), Identifier("vacation_id"), Placeholder())
+            cur.execute(query, (from_date, to_date, limit))
+            result = cur.fetchall()
+
+        return [Vacation(vacation_id=row['vacation_id'], country_id=row['country_id'], country_name=row['country_name'], vacation_info=row['vacation_info'],
+                         vacation_start_date=row['vacation_start_date'], vacation_end_date=row['vacation_end_date'], price=row['price'],
+                         photo_file_path=row['photo_file_path'], likes_count=row['likes_count'], photo_variants=row['photo_variants']) for row in result]
 
 
-    def add_vacation(self, country_id: int, vacation_info: str, vacation_start_date: date, vacation_end_date: date, price: int, photo_file_path: str) -> Vacation:
+    @invalidates("vacations")
+    def add_vacation(self, country_id: int, vacation_info: str, vacation_start_date: date, vacation_end_date: date, price: int, photo_file_path: str,
+                     photo_variants: dict | None = None) -> Vacation:
         """
         Add a new vacation to the 'vacations' table with the provided details.
-        Args: country_id (int), vacation_info (str), vacation_start_date (date), vacation_end_date (date), price (int), photo_file_path (str).
+        Args: country_id (int), vacation_info (str), vacation_start_date (date), vacation_end_date (date), price (int), photo_file_path (str),
+              photo_variants (dict | None).
         Returns: Vacation: The inserted vacation as a Vacation object.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING *").format(
                 Identifier(self.table_name),  
-                SQL(", ").join(map(Identifier, ["country_id", "vacation_info", "vacation_start_date", "vacation_end_date", "price", "photo_file_path"])),
-                SQL(", ").join(Placeholder() for _ in range(6)))
-            cur.execute(query, (country_id, vacation_info, vacation_start_date, vacation_end_date, price, photo_file_path)) 
-            self.db_conn.commit()
+                SQL(", ").join(map(Identifier, ["country_id", "vacation_info", "vacation_start_date", "vacation_end_date", "price", "photo_file_path",
+                                                "photo_variants"])),
+                SQL(", ").join(Placeholder() for _ in range(7)))
+            cur.execute(query, (country_id, vacation_info, vacation_start_date, vacation_end_date, price, photo_file_path,
+                                Jsonb(photo_variants) if photo_variants is not None else None)) 
             result = cur.fetchone()
             
         return Vacation(vacation_id=result['vacation_id'], country_id=result['country_id'], vacation_info=result['vacation_info'],
                         vacation_start_date=result['vacation_start_date'], vacation_end_date=result['vacation_end_date'], 
-                        price=result['price'], photo_file_path=result['photo_file_path'])
+                        price=result['price'], photo_file_path=result['photo_file_path'], photo_variants=result['photo_variants'])
         
                 
+    @cached_read("vacations", "countries", "likes")
     def get_vacation_by_id(self, vacation_id: int) -> Vacation | None:
         """
         Retrieves a vacation from the 'vacations' table by vacation_id.
         Args: vacation_id (int)
         Returns: Vacation: The vacation object with the specified vacation_id, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("""SELECT * 
                         FROM {} as v
                         JOIN {} as c
@@ -78,20 +282,44 @@ class VacationDAO:
              
         return Vacation(vacation_id=result['vacation_id'], country_id=result['country_id'], country_name=result['country_name'],
                         vacation_info=result['vacation_info'],vacation_start_date=result['vacation_start_date'],
-                        vacation_end_date=result['vacation_end_date'],price=result['price'], photo_file_path=result['photo_file_path']) if result else None
+                        vacation_end_date=result['vacation_end_date'],price=result['price'], photo_file_path=result['photo_file_path'],
+                        likes_count=result['likes_count'], photo_variants=result['photo_variants']) if result else None
    
         
+    def lock_vacation_by_id(self, vacation_id: int) -> Vacation | None:
+        """
+        Reads a vacation from the 'vacations' table, bypassing the cache, and locks its row (SELECT ... FOR UPDATE)
+        until the end of the transaction - meant for a unit of work that then updates it.
+        Args: vacation_id (int)
+        Returns: Vacation: The current vacation, or None if not found.
+        """
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("""SELECT *
+                        FROM {} as v
+                        JOIN {} as c
+                        ON  v.country_id = c.country_id
+                        WHERE {} = {}
+                        FOR UPDATE OF v""").format(Identifier(self.table_name), Identifier("countries"), Identifier("vacation_id"), Placeholder())
+            cur.execute(query, (vacation_id,))
+            result = cur.fetchone()
+
+        return Vacation(vacation_id=result['vacation_id'], country_id=result['country_id'], country_name=result['country_name'],
+                        vacation_info=result['vacation_info'],vacation_start_date=result['vacation_start_date'],
+                        vacation_end_date=result['vacation_end_date'],price=result['price'], photo_file_path=result['photo_file_path'],
+                        likes_count=result['likes_count'], photo_variants=result['photo_variants']) if result else None
+
+
+    @invalidates("vacations")
     def update_vacation_value_by_id(self, vacation_id: int, column_to_update: str, new_value: str) -> Vacation | None:
         """
         Updates the value of a specific column for a vacation in the 'vacations' table.
         Args: vacation_id (int), column_to_update (str), new_value (str).
         Returns: Vacation: A Vacation object representing the vacation, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("UPDATE {} SET {} = {} WHERE {} = {} RETURNING *").format(
                 Identifier(self.table_name), Identifier(column_to_update), Placeholder(), Identifier("vacation_id"),Placeholder())
             cur.execute(query, (new_value, vacation_id))
-            self.db_conn.commit()
             result = cur.fetchone()
             
         return Vacation(vacation_id=result['vacation_id'], country_id=result['country_id'], vacation_info=result['vacation_info'],
@@ -99,16 +327,42 @@ class VacationDAO:
                         photo_file_path=result['photo_file_path']) if result else None
         
         
+    @invalidates("vacations")
+    def update_vacation_values_by_id(self, vacation_id: int, values: dict) -> Vacation | None:
+        """
+        Updates several columns of a vacation in the 'vacations' table in a single statement.
+        Args: vacation_id (int), values (dict): column name -> new value, only the columns that changed.
+        Returns: Vacation: The updated vacation (including its country name), or None if not found.
+        """
+        if not values:
+            return self.get_vacation_by_id(vacation_id)
+
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
+            query = SQL("""WITH updated AS (UPDATE {} SET {} WHERE {} = {} RETURNING *)
+                           SELECT * FROM updated AS v JOIN {} AS c ON v.{} = c.{}""").format(
+                Identifier(self.table_name),
+                SQL(", ").join(SQL("{} = {}").format(Identifier(column), Placeholder()) for column in values),
+                Identifier("vacation_id"), Placeholder(),
+                Identifier("countries"), Identifier("country_id"), Identifier("country_id"))
+            cur.execute(query, (*(Jsonb(value) if isinstance(value, dict) else value for value in values.values()), vacation_id))
+            result = cur.fetchone()
+
+        return Vacation(vacation_id=result['vacation_id'], country_id=result['country_id'], country_name=result['country_name'],
+                        vacation_info=result['vacation_info'], vacation_start_date=result['vacation_start_date'],
+                        vacation_end_date=result['vacation_end_date'], price=result['price'], photo_file_path=result['photo_file_path'],
+                        likes_count=result['likes_count'], photo_variants=result['photo_variants']) if result else None
+        
+        
+    @invalidates("vacations", "likes")
     def delete_vacation_by_id(self, vacation_id: int) -> Vacation | None:
         """
         Deletes a vacation from the 'vacations' table by vacation_id.
         Args: vacation_id (int)
         Returns: Vacation: A Vacation object representing the vacation, or None if not found.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("DELETE FROM {} WHERE {} = {} RETURNING *").format(Identifier(self.table_name), Identifier("vacation_id"), Placeholder())
             cur.execute(query, (vacation_id,))
-            self.db_conn.commit()
             result = cur.fetchone()
 
         return Vacation(vacation_id=result['vacation_id'], country_id=result['country_id'], vacation_info=result['vacation_info'],
@@ -116,14 +370,57 @@ class VacationDAO:
                         price=result['price'], photo_file_path=result['photo_file_path']) if result else None
         
         
+    @invalidates("vacations", "likes")
     def delete_all_vacations(self) -> None:
         """
         Deletes all vacations from the 'vacations' table.
         Returns: List of Vacations: Vacation objects representing the vacation.
         """
-        with self.db_conn.cursor(row_factory=pgrows.dict_row) as cur:
+        with get_connection(self.env) as conn, conn.cursor(row_factory=pgrows.dict_row) as cur:
             query = SQL("DELETE FROM {};").format(Identifier(self.table_name))
             cur.execute(query)
-            self.db_conn.commit()
 
-# 
+
+    @invalidates("vacations")
+    def copy_vacations(self, vacations: List[tuple]) -> int:
+        """
+        Bulk inserts vacations through the COPY protocol (one round trip for all rows instead of an INSERT per row).
+        Args: vacations (List[tuple]): (country_id, vacation_info, vacation_start_date, vacation_end_date, price, photo_file_path) rows.
+        Returns: int: The number of inserted vacations.
+        """
+        with get_connection(self.env) as conn, conn.cursor() as cur:
+            query = SQL("COPY {} ({}) FROM STDIN").format(
+                Identifier(self.table_name),
+                SQL(", ").join(map(Identifier, ["country_id", "vacation_info", "vacation_start_date", "vacation_end_date", "price", "photo_file_path"])))
+            with cur.copy(query) as copy:
+                for vacation in vacations:
+                    copy.write_row(vacation)
+
+        return len(vacations)
+
+
+    @invalidates("vacations")
+    def reconcile_likes_count(self) -> int:
+        """
+        Repairs drift between the maintained 'likes_count' column and the actual number of rows in the 'likes' table.
+        Returns: int: The number of vacations whose likes_count was corrected.
+        """
+        with get_connection(self.env) as conn, conn.cursor() as cur:
+            query = SQL("""UPDATE {} AS v SET {} = counts.actual
+                           FROM (SELECT v2.{}, COUNT(l.{}) AS actual
+                                 FROM {} AS v2 LEFT JOIN {} AS l ON l.{} = v2.{}
+                                 GROUP BY v2.{}) AS counts
+                           WHERE v.{} = counts.{} AND v.{} <> counts.actual
+                           RETURNING v.{}""").format(
+                Identifier(self.table_name), Identifier("likes_count"),
+                Identifier("vacation_id"), Identifier("like_id"),
+                Identifier(self.table_name), Identifier("likes"), Identifier("vacation_id"), Identifier("vacation_id"),
+                Identifier("vacation_id"),
+                Identifier("vacation_id"), Identifier("vacation_id"), Identifier("likes_count"),
+                Identifier("vacation_id"))
+            cur.execute(query)
+            repaired = cur.fetchall()
+
+        return len(repaired)
+
+#
@@ -0,0 +1,195 @@
+# built-in packages
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from contextlib import contextmanager
+from typing import Iterator, List
+
+# internal packages
+from src.dal.database import get_db_pool
+from src.dal.migrate import migrate_database
+from src.dal.cache import dao_cache
+
+# external packages
+import psycopg as pg
+from psycopg.sql import SQL, Identifier, Literal
+
+# the hash of the password "1234" (same as the default admin/customer accounts), shared by all generated users
+DEFAULT_PASSWORD_HASH = "pbkdf2:sha256:1000000$LuQuSLWArUV5KcIV$f72f7b6f3e5ca84886f5ee1f671ea2574e5d9ad10b2159f3381e21537df2f07f"
+GENERATED_EMAIL_TEMPLATE = "user{}@example.com"
+
+_COUNTRIES = [
+    ("צרפת", "france.jpg"), ("ספרד", "spain.jpg"), ("ארצות הברית", "usa.jpg"), ("סין", "china.jpg"),
+    ("איטליה", "italy.jpg"), ("תאילנד", "thailand.jpg"), ("גרמניה", "germany.jpg"), ("בריטניה", "united_kingdom.jpg"),
+    ("יפן", "japan.jpg"), ("אוסטריה", "austria.jpg"), ("יוון", "greece.jpg"), ("אוסטרליה", "australia.jpg"),
+    ("פורטוגל", "portugal.jpg"), ("הולנד", "test.jpg"), ("קנדה", "test.jpg"), ("מקסיקו", "test.jpg"),
+    ("ברזיל", "test.jpg"), ("ארגנטינה", "test.jpg"), ("פרו", "test.jpg"), ("מצרים", "test.jpg"),
+    ("מרוקו", "test.jpg"), ("הודו", "test.jpg"), ("וייטנאם", "test.jpg"), ("נורווגיה", "test.jpg"),
+    ("שוודיה", "test.jpg"), ("איסלנד", "test.jpg"), ("קרואטיה", "test.jpg"), ("צ'כיה", "test.jpg"),
+    ("הונגריה", "test.jpg"), ("שווייץ", "test.jpg"), ("ניו זילנד", "test.jpg"), ("קפריסין", "test.jpg"),
+]
+_FIRST_NAMES = ["נועה", "תמר", "מאיה", "יעל", "שירה", "אביגיל", "רוני", "מיכל", "דניאל", "איתי",
+                "יונתן", "אורי", "עומר", "נועם", "אריאל", "דוד", "משה", "שרה", "רחל", "אליה"]
+_LAST_NAMES = ["כהן", "לוי", "מזרחי", "פרץ", "ביטון", "אברהם", "פרידמן", "דהן", "אגבאריה", "חדד",
+               "גבאי", "שפירא", "אוחיון", "יוסף", "קליין", "גולדברג", "אזולאי", "רוזן", "בן דוד", "עמר"]
+_OPENINGS = ["חופשה קסומה", "מסע מרתק", "הרפתקה בלתי נשכחת", "חופשה רומנטית", "טיול משפחתי", "חוויה אותנטית"]
+_HIGHLIGHTS = ["חופים לבנים", "ערים תוססות", "נופים עוצרי נשימה", "אוכל מקומי משובח", "היסטוריה עשירה",
+               "הרים ירוקים", "שווקים צבעוניים", "חיי לילה סוערים", "מוזיאונים מרתקים", "טבע פראי"]
+
+
+def _zipf_like_counts(total_likes: int, vacations: int, users: int, exponent: float, rng: random.Random) -> List[int]:
+    """
+    Splits total_likes over the vacations by a Zipf distribution (the vacation of rank r gets a share of 1 / r^exponent),
+    each vacation getting at most 'users' likes. The ranks are shuffled, so popularity does not follow the id order.
+    """
+    if total_likes > vacations * users:
+        raise ValueError(f"Cannot create {total_likes} likes: at most {vacations * users} distinct (user, vacation) pairs exist")
+
+    weights = [1 / rank ** exponent for rank in range(1, vacations + 1)]
+    weights_sum = sum(weights)
+    counts = [min(users, int(total_likes * weight / weights_sum)) for weight in weights]
+
+    # hand out the rounding remainder (and whatever the cap cut off) one like at a time, most popular vacations first
+    remaining, index = total_likes - sum(counts), 0
+    while remaining:
+        if counts[index] < users:
+            counts[index] += 1
+            remaining -= 1
+        index = (index + 1) % vacations
+
+    rng.shuffle(counts)
+    return counts
+
+
+def _like_rows(likes_per_vacation: List[int], users: int, rng: random.Random) -> Iterator[bytes]:
+    # COPY text format, written in blocks: 'like_id \t user_id \t vacation_id \n'
+    like_id, lines = 0, []
+    for vacation_index, likes in enumerate(likes_per_vacation):
+        for user_index in rng.sample(range(users), likes):
+            like_id += 1
+            lines.append(f"{like_id}\t{user_index + 1}\t{vacation_index + 1}\n")
+        if len(lines) >= 50_000:
+            yield "".join(lines).encode()
+            lines = []
+    if lines:
+        yield "".join(lines).encode()
+
+
+@contextmanager
+def _without_secondary_indexes(cur: pg.Cursor, table: str):
+    """
+    Drops the foreign keys and secondary indexes of the table for a bulk load and recreates them afterwards
+    (from their own definitions): one index build and one foreign key check per table instead of one per row.
+    """
+    cur.execute("""SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+                   WHERE conrelid = %s::regclass AND contype = 'f'""", (table,))
+    foreign_keys = cur.fetchall()
+    cur.execute("""SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid) FROM pg_index
+                   WHERE indrelid = %s::regclass AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conindid = indexrelid)""", (table,))
+    indexes = cur.fetchall()
+
+    for name, _ in foreign_keys:
+        cur.execute(SQL("ALTER TABLE {} DROP CONSTRAINT {}").format(Identifier(table), Identifier(name)))
+    for name, _ in indexes:
+        cur.execute(SQL("DROP INDEX {}").format(Identifier(name)))
+
+    yield
+
+    for _, definition in indexes:
+        cur.execute(definition)
+    for name, definition in foreign_keys:
+        cur.execute(SQL("ALTER TABLE {} ADD CONSTRAINT {} ").format(Identifier(table), Identifier(name)) + SQL(definition))
+
+
+def generate_synthetic_data(env: str ='dev', vacations: int = 1_000, users: int = 10_000, likes: int = 100_000,
+                            seed: int = 42, zipf_exponent: float = 1.1) -> dict:
+    """
+    Replaces all the data of the environment's database with generated data, loaded through COPY in one transaction:
+    roles, Hebrew-named countries and users (the first two are the default admin and customer accounts, every user's
+    password is "1234"), vacations with Hebrew descriptions, and likes whose count per vacation follows a Zipf distribution.
+    The same seed always produces the same data.
+    Returns: dict: The number of rows loaded into every table.
+    """
+    if users < 2 or vacations < 1:
+        raise ValueError("At least 2 users (admin and customer) and 1 vacation are required")
+
+    rng = random.Random(seed)
+    today = date.today()
+    migrate_database(env=env)
+
+    with get_db_pool(env).connection() as conn, conn.cursor() as cur:
+        # the bulk load runs far longer than the statement_timeout of the pooled connections
+        cur.execute("SET LOCAL statement_timeout = 0; SET LOCAL lock_timeout = 0")
+        cur.execute("TRUNCATE likes, vacations, users, countries, roles RESTART IDENTITY CASCADE")
+
+        with cur.copy("COPY roles (role_id, role_name) FROM STDIN") as copy:
+            copy.write_row((1, "user"))
+            copy.write_row((2, "admin"))
+
+        with cur.copy("COPY countries (country_id, country_name) FROM STDIN") as copy:
+            for country_id, (country_name, _) in enumerate(_COUNTRIES, start=1):
+                copy.write_row((country_id, country_name))
+
+        with cur.copy("COPY users (user_id, first_name, last_name, email, hashed_password, role_id) FROM STDIN") as copy:
+            copy.write_row((1, "admin", "admin", "admin@gmail.com", DEFAULT_PASSWORD_HASH, 2))
+            copy.write_row((2, "customer", "customer", "customer@gmail.com", DEFAULT_PASSWORD_HASH, 1))
+            for user_id in range(3, users + 1):
+                copy.write_row((user_id, rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES),
+                                GENERATED_EMAIL_TEMPLATE.format(user_id), DEFAULT_PASSWORD_HASH, 1))
+
+        likes_per_vacation = _zipf_like_counts(likes, vacations, users, zipf_exponent, rng)
+        with cur.copy("""COPY vacations (vacation_id, country_id, vacation_info, vacation_start_date, vacation_end_date,
+                                         price, photo_file_path, likes_count) FROM STDIN""") as copy:
+            for vacation_index in range(vacations):
+                country_index = min(int(rng.paretovariate(1.2)) - 1, len(_COUNTRIES) - 1)
+                country_name, photo_file_path = _COUNTRIES[country_index]
+                start_date = today + timedelta(days=rng.randint(-60, 365))
+                description = f"{rng.choice(_OPENINGS)} ב{country_name}: {', '.join(rng.sample(_HIGHLIGHTS, 3))}"
+                price = max(1, min(10_000, int(rng.lognormvariate(8, 0.5))))
+                copy.write_row((vacation_index + 1, country_index + 1, description, start_date,
+                                start_date + timedelta(days=rng.randint(3, 21)), price, photo_file_path,
+                                likes_per_vacation[vacation_index]))
+
+        # likes_count is loaded with the vacations, the per-row trigger is not needed for the bulk load
+        cur.execute("ALTER TABLE likes DISABLE TRIGGER likes_count_sync")
+        with _without_secondary_indexes(cur, "likes"):
+            with cur.copy("COPY likes (like_id, user_id, vacation_id) FROM STDIN") as copy:
+                for block in _like_rows(likes_per_vacation, users, rng):
+                    copy.write(block)
+        cur.execute("ALTER TABLE likes ENABLE TRIGGER likes_count_sync")
+
+        for table, column in [("roles", "role_id"), ("countries", "country_id"), ("users", "user_id"),
+                              ("vacations", "vacation_id"), ("likes", "like_id")]:
+            cur.execute(SQL("SELECT setval(pg_get_serial_sequence({}, {}), GREATEST((SELECT MAX({}) FROM {}), 1))").format(
+                Literal(table), Literal(column), Identifier(column), Identifier(table)))
+        conn.commit()
+
+        cur.execute("SET LOCAL statement_timeout = 0; ANALYZE roles, countries, users, vacations, likes")
+
+    dao_cache.clear()
+    return {"roles": 2, "countries": len(_COUNTRIES), "users": users, "vacations": vacations, "likes": likes}
+
+
+if __name__ == "__main__":
+    # usage: python -m src.jobs.generate_synthetic_data --env dev --vacations 10000 --users 100000 --likes 5000000 [--seed 42]
+    # WARNING: all the existing data of the environment is deleted.
+    parser = argparse.ArgumentParser(description="Replace the database content with deterministic synthetic data (bulk loaded with COPY)")
+    parser.add_argument("--env", choices=["dev", "prod"], default="dev")
+    parser.add_argument("--vacations", type=int, default=1_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--likes", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of the likes per vacation")
+    parser.add_argument("--allow-prod", action="store_true", help="required to overwrite the prod database")
+    args = parser.parse_args()
+
+    if args.env == "prod" and not args.allow_prod:
+        parser.error("refusing to overwrite the prod database without --allow-prod")
+
+    started = time.perf_counter()
+    row_counts = generate_synthetic_data(env=args.env, vacations=args.vacations, users=args.users, likes=args.likes,
+                                         seed=args.seed, zipf_exponent=args.zipf)
+    print(f"[{args.env}] loaded {row_counts} in {time.perf_counter() - started:.1f} seconds")
+
+#
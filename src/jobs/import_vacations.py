@@ -0,0 +1,33 @@
+# built-in packages
+import argparse
+import json
+from dataclasses import asdict
+
+# internal packages
+from src.services.vacation_import_service import VacationImportService
+
+
+def import_vacations_file(file_path: str, env: str ='dev') -> dict:
+    """
+    Imports the vacations of a CSV/NDJSON file (see VacationImportService).
+    Returns the import report as a dict.
+    """
+    import_service = VacationImportService(env=env)
+    with open(file_path, "rb") as vacations_file:
+        rows = import_service.parse_file(vacations_file, file_path)
+    return asdict(import_service.import_vacations(rows))
+
+
+if __name__ == "__main__":
+    # usage: python -m src.jobs.import_vacations --env prod vacations.csv
+    # columns / keys: country_id, vacation_info, vacation_start_date (YYYY-MM-DD), vacation_end_date, price, photo_file_path
+    parser = argparse.ArgumentParser(description="Bulk import vacations from a CSV or NDJSON file")
+    parser.add_argument("--env", choices=["dev", "prod"], default="dev")
+    parser.add_argument("file", help="path of a .csv or .ndjson file")
+    args = parser.parse_args()
+
+    report = import_vacations_file(args.file, env=args.env)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"[{args.env}] imported {report['imported']} of {report['total_rows']} vacation(s), {len(report['errors'])} row(s) rejected")
+
+#
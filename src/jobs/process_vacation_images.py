@@ -0,0 +1,46 @@
+# built-in packages
+import argparse
+import os
+
+# internal packages
+from src.config import UPLOAD_FOLDER
+from src.dal.vacation_dao import VacationDAO
+from src.services import errors
+from src.services.image_service import ImageService
+
+
+def process_vacation_images(env: str ='dev', upload_folder: str = UPLOAD_FOLDER) -> int:
+    """
+    Creates the resized image variants for every vacation photo that has none yet (e.g. the bundled seed photos)
+    and points the vacation at them. Returns the number of vacations processed.
+    """
+    image_service = ImageService(upload_folder=upload_folder)
+    processed = 0
+    for vacation in VacationDAO(env=env).get_all_vacations():
+        photo_path = os.path.join(upload_folder, vacation.photo_file_path or "")
+        if vacation.photo_variants or not os.path.isfile(photo_path):
+            continue
+
+        try:
+            with open(photo_path, "rb") as photo_file:
+                photo_file_path, photo_variants = image_service.save_vacation_image(photo_file)
+        except errors.InvalidInputError:
+            print(f"[{env}] skipping vacation {vacation.vacation_id}: '{vacation.photo_file_path}' is not a valid image")
+            continue
+
+        VacationDAO(env=env).update_vacation_values_by_id(vacation_id=vacation.vacation_id,
+                                                          values={"photo_file_path": photo_file_path, "photo_variants": photo_variants})
+        processed += 1
+
+    return processed
+
+
+if __name__ == "__main__":
+    # usage: python -m src.jobs.process_vacation_images --env prod
+    parser = argparse.ArgumentParser(description="Create resized variants for vacation photos that have none")
+    parser.add_argument("--env", choices=["dev", "prod"], default="dev")
+    args = parser.parse_args()
+
+    print(f"[{args.env}] {process_vacation_images(env=args.env)} vacation photo(s) processed")
+
+#
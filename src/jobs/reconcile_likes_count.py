@@ -0,0 +1,31 @@
+# built-in packages
+import argparse
+import time
+
+# internal packages
+from src.dal.vacation_dao import VacationDAO
+
+
+def reconcile_likes_count(env: str ='dev') -> int:
+    """
+    Recounts the likes of every vacation and fixes any vacation whose stored likes_count drifted.
+    Returns the number of vacations that were corrected.
+    """
+    return VacationDAO(env=env).reconcile_likes_count()
+
+
+if __name__ == "__main__":
+    # usage: python -m src.jobs.reconcile_likes_count --env prod [--interval 3600]
+    parser = argparse.ArgumentParser(description="Repair drift in vacations.likes_count")
+    parser.add_argument("--env", choices=["dev", "prod"], default="dev")
+    parser.add_argument("--interval", type=int, default=0, help="repeat every N seconds (0 = run once)")
+    args = parser.parse_args()
+
+    while True:
+        repaired = reconcile_likes_count(env=args.env)
+        print(f"[{args.env}] likes_count reconciled, {repaired} vacation(s) repaired")
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+#
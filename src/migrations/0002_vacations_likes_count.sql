@@ -0,0 +1,22 @@
+-- persisted per-vacation like counter, kept in sync by a trigger on likes (including cascade deletes)
+ALTER TABLE vacations ADD COLUMN IF NOT EXISTS likes_count INT NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION sync_vacation_likes_count() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE vacations SET likes_count = likes_count + 1 WHERE vacation_id = NEW.vacation_id;
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE vacations SET likes_count = likes_count - 1 WHERE vacation_id = OLD.vacation_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS likes_count_sync ON likes;
+CREATE TRIGGER likes_count_sync
+    AFTER INSERT OR DELETE OR UPDATE OF vacation_id ON likes
+    FOR EACH ROW EXECUTE FUNCTION sync_vacation_likes_count();
+
+-- backfill existing rows (runs in the same transaction as the trigger creation, so no like is missed)
+UPDATE vacations AS v SET likes_count = (SELECT COUNT(*) FROM likes AS l WHERE l.vacation_id = v.vacation_id);
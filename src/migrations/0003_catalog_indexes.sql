@@ -0,0 +1,7 @@
+-- migrate: no-transaction
+-- online index builds; an index left invalid by an interrupted build is dropped and rebuilt on the next run
+DROP INDEX CONCURRENTLY IF EXISTS likes_vacation_id_idx;
+CREATE INDEX CONCURRENTLY likes_vacation_id_idx ON likes (vacation_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS vacations_start_date_idx;
+CREATE INDEX CONCURRENTLY vacations_start_date_idx ON vacations (vacation_start_date, vacation_id);
@@ -0,0 +1,7 @@
+-- migrate: no-transaction
+-- one like per user and vacation; existing duplicates are removed first (the trigger fixes likes_count)
+DELETE FROM likes AS a USING likes AS b
+WHERE a.user_id = b.user_id AND a.vacation_id = b.vacation_id AND a.like_id > b.like_id;
+
+DROP INDEX CONCURRENTLY IF EXISTS likes_user_vacation_unique_idx;
+CREATE UNIQUE INDEX CONCURRENTLY likes_user_vacation_unique_idx ON likes (user_id, vacation_id);
@@ -0,0 +1,2 @@
+-- resized/re-encoded image variants of the vacation photo: {"card": {"file": ..., "width": ..., "height": ...}, ...}
+ALTER TABLE vacations ADD COLUMN IF NOT EXISTS photo_variants JSONB;
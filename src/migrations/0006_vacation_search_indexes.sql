@@ -0,0 +1,17 @@
+-- migrate: no-transaction
+-- full-text search over vacation_info: the 'simple' configuration (no stemming, works for Hebrew), plus every word without
+-- its one-letter Hebrew prefix (ו, ה, ב, ל, מ, ש, כ), so searching 'צרפת' also finds 'בצרפת'
+-- the index is on the expression itself (a stored column would rewrite the whole table under an exclusive lock):
+-- the search query uses the very same expression (vacation_dao.SEARCH_VECTOR), or the index does not apply
+DROP INDEX CONCURRENTLY IF EXISTS vacations_search_vector_idx;
+CREATE INDEX CONCURRENTLY vacations_search_vector_idx ON vacations USING GIN ((
+    to_tsvector('simple', coalesce(vacation_info, ''))
+    || to_tsvector('simple', regexp_replace(coalesce(vacation_info, ''), '(^|\s)[ובהלמשכ](\S)', '\1\2', 'g'))
+));
+
+-- country filter, country name matches and the country facet
+DROP INDEX CONCURRENTLY IF EXISTS vacations_country_id_idx;
+CREATE INDEX CONCURRENTLY vacations_country_id_idx ON vacations (country_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS vacations_price_idx;
+CREATE INDEX CONCURRENTLY vacations_price_idx ON vacations (price);
@@ -0,0 +1,12 @@
+-- migrate: no-transaction
+-- a vacation never ends before it starts (daterange(start, end) - e.g. the date range index - raises for such a row).
+-- the constraint is added NOT VALID first, so new bad rows are rejected at once while the existing ones are fixed,
+-- then validated without blocking reads and writes
+ALTER TABLE vacations DROP CONSTRAINT IF EXISTS vacations_dates_order_check;
+ALTER TABLE vacations ADD CONSTRAINT vacations_dates_order_check CHECK (vacation_end_date >= vacation_start_date) NOT VALID;
+
+-- rows entered with their dates the wrong way round get them swapped
+UPDATE vacations SET vacation_start_date = vacation_end_date, vacation_end_date = vacation_start_date
+WHERE vacation_end_date < vacation_start_date;
+
+ALTER TABLE vacations VALIDATE CONSTRAINT vacations_dates_order_check;
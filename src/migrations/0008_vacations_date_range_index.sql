@@ -0,0 +1,4 @@
+-- migrate: no-transaction
+-- date overlap / availability queries: daterange(start, end, '[]') && daterange(a, b, '[]') is answered by this index
+DROP INDEX CONCURRENTLY IF EXISTS vacations_date_range_idx;
+CREATE INDEX CONCURRENTLY vacations_date_range_idx ON vacations USING GIST (daterange(vacation_start_date, vacation_end_date, '[]'));
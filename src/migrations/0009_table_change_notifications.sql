@@ -0,0 +1,111 @@
+-- every write to a cached table is announced on the 'table_changes' channel once its transaction commits,
+-- so the other application processes drop their cached reads of it (src/dal/change_events.py).
+-- one notification per statement that changed rows (transition tables); identical notifications of one transaction
+-- are delivered once.
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS TRIGGER AS $$
+BEGIN
+    -- the likes_count updates made by the likes trigger are part of the likes change (a like is not a vacation write)
+    IF TG_TABLE_NAME = 'vacations' AND pg_trigger_depth() > 1 THEN
+        RETURN NULL;
+    END IF;
+    -- a statement that changed no row (DELETE of a missing like, INSERT ... ON CONFLICT DO NOTHING) changed nothing;
+    -- nested IFs: a transition table is only queried by the triggers that declare it
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF NOT EXISTS (SELECT 1 FROM new_rows) THEN
+            RETURN NULL;
+        END IF;
+    ELSIF TG_OP = 'DELETE' THEN
+        IF NOT EXISTS (SELECT 1 FROM old_rows) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+    PERFORM pg_notify('table_changes', json_build_object('table', TG_TABLE_NAME,
+                                                         'origin', current_setting('application_name'))::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS roles_insert_notify ON roles;
+CREATE TRIGGER roles_insert_notify
+    AFTER INSERT ON roles REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS roles_update_notify ON roles;
+CREATE TRIGGER roles_update_notify
+    AFTER UPDATE ON roles REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS roles_delete_notify ON roles;
+CREATE TRIGGER roles_delete_notify
+    AFTER DELETE ON roles REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS roles_truncate_notify ON roles;
+CREATE TRIGGER roles_truncate_notify
+    AFTER TRUNCATE ON roles
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS users_insert_notify ON users;
+CREATE TRIGGER users_insert_notify
+    AFTER INSERT ON users REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS users_update_notify ON users;
+CREATE TRIGGER users_update_notify
+    AFTER UPDATE ON users REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS users_delete_notify ON users;
+CREATE TRIGGER users_delete_notify
+    AFTER DELETE ON users REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS users_truncate_notify ON users;
+CREATE TRIGGER users_truncate_notify
+    AFTER TRUNCATE ON users
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS countries_insert_notify ON countries;
+CREATE TRIGGER countries_insert_notify
+    AFTER INSERT ON countries REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS countries_update_notify ON countries;
+CREATE TRIGGER countries_update_notify
+    AFTER UPDATE ON countries REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS countries_delete_notify ON countries;
+CREATE TRIGGER countries_delete_notify
+    AFTER DELETE ON countries REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS countries_truncate_notify ON countries;
+CREATE TRIGGER countries_truncate_notify
+    AFTER TRUNCATE ON countries
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS vacations_insert_notify ON vacations;
+CREATE TRIGGER vacations_insert_notify
+    AFTER INSERT ON vacations REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS vacations_update_notify ON vacations;
+CREATE TRIGGER vacations_update_notify
+    AFTER UPDATE ON vacations REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS vacations_delete_notify ON vacations;
+CREATE TRIGGER vacations_delete_notify
+    AFTER DELETE ON vacations REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS vacations_truncate_notify ON vacations;
+CREATE TRIGGER vacations_truncate_notify
+    AFTER TRUNCATE ON vacations
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+DROP TRIGGER IF EXISTS likes_insert_notify ON likes;
+CREATE TRIGGER likes_insert_notify
+    AFTER INSERT ON likes REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS likes_update_notify ON likes;
+CREATE TRIGGER likes_update_notify
+    AFTER UPDATE ON likes REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS likes_delete_notify ON likes;
+CREATE TRIGGER likes_delete_notify
+    AFTER DELETE ON likes REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+DROP TRIGGER IF EXISTS likes_truncate_notify ON likes;
+CREATE TRIGGER likes_truncate_notify
+    AFTER TRUNCATE ON likes
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
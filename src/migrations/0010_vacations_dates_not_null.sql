@@ -0,0 +1,16 @@
+-- migrate: no-transaction
+-- every vacation has both dates: the home page keyset cursor (start date, id) and the date range index need them.
+-- the NOT NULL is proven by a validated CHECK first, so SET NOT NULL does not scan the table under an exclusive lock
+ALTER TABLE vacations DROP CONSTRAINT IF EXISTS vacations_dates_not_null_check;
+ALTER TABLE vacations ADD CONSTRAINT vacations_dates_not_null_check
+    CHECK (vacation_start_date IS NOT NULL AND vacation_end_date IS NOT NULL) NOT VALID;
+
+-- a vacation with one date missing takes the other one, a vacation without any date cannot be listed and is removed
+UPDATE vacations SET vacation_start_date = coalesce(vacation_start_date, vacation_end_date),
+                     vacation_end_date = coalesce(vacation_end_date, vacation_start_date)
+WHERE (vacation_start_date IS NULL OR vacation_end_date IS NULL) AND num_nulls(vacation_start_date, vacation_end_date) = 1;
+DELETE FROM vacations WHERE vacation_start_date IS NULL AND vacation_end_date IS NULL;
+
+ALTER TABLE vacations VALIDATE CONSTRAINT vacations_dates_not_null_check;
+ALTER TABLE vacations ALTER COLUMN vacation_start_date SET NOT NULL, ALTER COLUMN vacation_end_date SET NOT NULL;
+ALTER TABLE vacations DROP CONSTRAINT vacations_dates_not_null_check;
@@ -0,0 +1,20 @@
+# built-in packages
+import time
+from dataclasses import dataclass
+from typing import List
+
+# internal packages
+from src.models.vacation_dto import Vacation
+from src.models.country_dto import Country
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    vacations: List[Vacation]   # the first vacations in home page order (start date, id)
+    countries: List[Country]
+    complete: bool              # False when the catalog has more vacations than the snapshot keeps
+    taken_at: float             # time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.taken_at
+
+#
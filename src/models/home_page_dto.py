@@ -0,0 +1,16 @@
+# built-in packages
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# internal packages
+from src.models.vacation_dto import Vacation
+from src.models.country_dto import Country
+
+@dataclass
+class HomePageViewModel:
+    vacations: List[Vacation]
+    next_cursor: Optional[str]
+    countries: List[Country] = field(default_factory=list)
+    liked_vacations: List[int] = field(default_factory=list)
+
+#
@@ -14,5 +14,6 @@ class Vacation:
     photo_file_path: str
     country_name: Optional[str] = None
     likes_count: Optional[int] = 0
+    photo_variants: Optional[dict] = None
 
 # 
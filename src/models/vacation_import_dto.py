@@ -0,0 +1,17 @@
+# built-in packages
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass
+class VacationImportRowError:
+    row: int
+    errors: List[str]
+
+
+@dataclass
+class VacationImportReport:
+    total_rows: int
+    imported: int
+    errors: List[VacationImportRowError] = field(default_factory=list)
+
+# 
@@ -0,0 +1,31 @@
+# built-in packages
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# internal packages
+from src.models.vacation_dto import Vacation
+
+@dataclass
+class CountryFacet:
+    country_id: int
+    country_name: str
+    count: int
+
+
+@dataclass
+class PriceFacet:
+    min_price: Optional[int]
+    max_price: Optional[int]
+    count: int
+
+
+@dataclass
+class VacationSearchResult:
+    vacations: List[Vacation]
+    total: int
+    page: int
+    page_size: int
+    country_facets: List[CountryFacet] = field(default_factory=list)
+    price_facets: List[PriceFacet] = field(default_factory=list)
+
+#
@@ -0,0 +1,177 @@
+# built-in packages
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+
+# internal packages
+from src.config import (CATALOG_SNAPSHOT_MAX_VACATIONS, CATALOG_SNAPSHOT_REFRESH_SECONDS, CATALOG_SNAPSHOT_FAILURE_COOLDOWN,
+                        ROUTE_LATENCY_BUDGET_MS)
+from src.dal.vacation_dao import VacationDAO
+from src.dal.country_dao import CountryDAO
+from src.dal.latency_budget import LatencyBudgetExceeded, latency_budget
+from src.models.catalog_snapshot_dto import CatalogSnapshot
+
+# external packages
+import psycopg as pg
+
+snapshot_logger = logging.getLogger("jbproject.catalog_snapshot")
+
+# the errors of a slow or unreachable database (a cancelled statement and a broken connection are OperationalErrors)
+DATABASE_UNAVAILABLE_ERRORS = (LatencyBudgetExceeded, pg.OperationalError)
+
+# age (seconds) of the snapshot the current request was answered from, None when it was answered from the database
+_served_stale: ContextVar[float | None] = ContextVar("served_stale", default=None)
+
+
+def start_stale_tracking():
+    """
+    Starts tracking whether the current request is answered from the snapshot, returns the token for end_stale_tracking.
+    """
+    return _served_stale.set(None)
+
+
+def end_stale_tracking(token) -> None:
+    _served_stale.reset(token)
+
+
+def served_stale_age() -> float | None:
+    """
+    Returns the age in seconds of the snapshot the current request was answered from, None if it was not.
+    """
+    return _served_stale.get()
+
+
+class CatalogSnapshotKeeper:
+    """
+    Keeps, per environment, the last-known-good snapshot of the catalog (the first 'max_vacations' vacations in
+    home page order and all the countries), refreshed by a background thread every 'refresh_seconds'.
+    When a catalog read fails or runs past its latency budget, it is answered from the snapshot instead, and for
+    'failure_cooldown' seconds the next reads go straight to the snapshot without waiting for the database again.
+    """
+    def __init__(self, max_vacations: int, refresh_seconds: float, failure_cooldown: float):
+        self.max_vacations = max_vacations
+        self.refresh_seconds = refresh_seconds
+        self.failure_cooldown = failure_cooldown
+        self._lock = threading.Lock()
+        self._snapshots = {}
+        self._threads = {}
+        self._last_failure = {}
+        self._stats = {"refreshes": 0, "refresh_failures": 0, "read_failures": 0, "stale_reads": 0}
+
+
+    def refresh(self, env: str ='dev') -> CatalogSnapshot:
+        """
+        Reads a new snapshot of the catalog from the database and keeps it (the database is then known to be back).
+        """
+        with latency_budget("catalog_snapshot.refresh", ROUTE_LATENCY_BUDGET_MS):
+            vacations = VacationDAO(env=env).get_vacations_page(limit=self.max_vacations + 1)
+            countries = CountryDAO(env=env).get_all_countries()
+        snapshot = CatalogSnapshot(vacations=vacations[:self.max_vacations], countries=countries,
+                                   complete=len(vacations) <= self.max_vacations, taken_at=time.monotonic())
+        with self._lock:
+            self._snapshots[env] = snapshot
+            self._last_failure.pop(env, None)
+            self._stats["refreshes"] += 1
+        return snapshot
+
+
+    def start(self, env: str ='dev') -> None:
+        """
+        Starts the background refresh of the environment's snapshot (once per process).
+        """
+        if env in self._threads:
+            return
+        with self._lock:
+            if env in self._threads:
+                return
+            thread = threading.Thread(target=self._refresh_forever, args=(env,), name=f"catalog-snapshot-{env}", daemon=True)
+            self._threads[env] = thread
+        thread.start()
+
+
+    def _refresh_forever(self, env: str) -> None:
+        while True:
+            snapshot = self._snapshots.get(env)
+            if snapshot is None or snapshot.age() >= self.refresh_seconds:
+                try:
+                    self.refresh(env)
+                except Exception as e:
+                    with self._lock:
+                        self._stats["refresh_failures"] += 1
+                    snapshot_logger.warning(json.dumps({"event": "catalog_snapshot_refresh_failed", "env": env, "error": str(e)}))
+            time.sleep(self.refresh_seconds)
+
+
+    def stale_snapshot(self, env: str ='dev') -> CatalogSnapshot | None:
+        """
+        Returns the snapshot while the database is failing (a read failed less than 'failure_cooldown' seconds ago),
+        marking the current request as answered from it. Returns None when the database should be read.
+        """
+        last_failure = self._last_failure.get(env)
+        if last_failure is None or time.monotonic() - last_failure >= self.failure_cooldown:
+            return None
+        return self._serve(env)
+
+
+    def fall_back(self, env: str, error: Exception) -> CatalogSnapshot:
+        """
+        Records a failed catalog read and returns the snapshot to answer it with.
+        Raises the error again when there is no snapshot yet.
+        """
+        with self._lock:
+            self._last_failure[env] = time.monotonic()
+            self._stats["read_failures"] += 1
+        snapshot_logger.warning(json.dumps({"event": "catalog_read_failed", "env": env, "error": str(error)}))
+
+        snapshot = self._serve(env)
+        if snapshot is None:
+            raise error
+        return snapshot
+
+
+    def _serve(self, env: str) -> CatalogSnapshot | None:
+        snapshot = self._snapshots.get(env)
+        if snapshot is not None:
+            _served_stale.set(snapshot.age())
+            with self._lock:
+                self._stats["stale_reads"] += 1
+        return snapshot
+
+
+    def get_stats(self) -> dict:
+        """
+        Returns the counters and, per environment, the age of the snapshot in seconds and whether reads go to it.
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats = dict(self._stats)
+            stats["snapshots"] = {env: {"age_seconds": round(snapshot.age(), 3), "vacations": len(snapshot.vacations),
+                                        "complete": snapshot.complete,
+                                        "serving_stale": env in self._last_failure and now - self._last_failure[env] < self.failure_cooldown}
+                                  for env, snapshot in self._snapshots.items()}
+        return stats
+
+
+    def clear(self) -> None:
+        """
+        Drops the snapshots and the failure state (the refresh threads keep running).
+        """
+        with self._lock:
+            self._snapshots.clear()
+            self._last_failure.clear()
+
+
+    def reset_after_fork(self) -> None:
+        # the refresh threads do not survive a fork: the child keeps the inherited snapshots and starts its own threads
+        self._lock = threading.Lock()
+        self._threads = {}
+
+
+catalog_snapshots = CatalogSnapshotKeeper(max_vacations=CATALOG_SNAPSHOT_MAX_VACATIONS, refresh_seconds=CATALOG_SNAPSHOT_REFRESH_SECONDS,
+                                          failure_cooldown=CATALOG_SNAPSHOT_FAILURE_COOLDOWN)
+os.register_at_fork(after_in_child=catalog_snapshots.reset_after_fork)
+
+#
@@ -9,4 +9,9 @@ class InvalidTypeInputError(Exception):
 class MissingInputError(Exception):
     pass
 
-# 
+
+class ServiceUnavailableError(Exception):
+    pass
+
+#
+
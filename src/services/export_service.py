@@ -0,0 +1,77 @@
+# built-in packages
+import csv
+import io
+import json
+from dataclasses import asdict
+from typing import Iterator
+
+# internal packages
+from src.config import EXPORT_FETCH_SIZE, EXPORT_MAX_FETCH_SIZE
+from src.services import errors
+from src.dal.vacation_dao import VacationDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.user_dao import UserDAO
+
+EXPORT_ENTITIES = ["vacations", "likes", "users"]
+EXPORT_FORMATS = ["ndjson", "csv"]
+# never exported
+_EXCLUDED_FIELDS = {"users": {"hashed_password"}}
+
+
+class ExportService:
+    def __init__(self, env: str ='dev'):
+        self.env = env
+
+
+    def export_rows(self, entity: str, file_format: str = "ndjson", fetch_size: int = EXPORT_FETCH_SIZE) -> Iterator[str]:
+        """
+        Function to export a whole table as NDJSON or CSV text.
+        The input is validated right away; the returned iterator then streams the rows from a server-side cursor
+        and yields one chunk of text per fetch_size rows, so memory stays flat regardless of the table size.
+        """
+        if entity not in EXPORT_ENTITIES:
+            raise errors.InvalidInputError(f"Unknown export, expected one of: {', '.join(EXPORT_ENTITIES)}.")
+        if file_format not in EXPORT_FORMATS:
+            raise errors.InvalidInputError(f"Unknown format, expected one of: {', '.join(EXPORT_FORMATS)}.")
+        if not isinstance(fetch_size, int) or not 0 < fetch_size <= EXPORT_MAX_FETCH_SIZE:
+            raise errors.InvalidInputError(f"Fetch size must be between 1 and {EXPORT_MAX_FETCH_SIZE}.")
+
+        return self._stream(entity, file_format, fetch_size)
+
+
+    def _iter_entities(self, entity: str, fetch_size: int):
+        if entity == "vacations":
+            return VacationDAO(env=self.env).iter_all_vacations(fetch_size=fetch_size)
+        if entity == "likes":
+            return LikeDAO(env=self.env).iter_all_likes(fetch_size=fetch_size)
+        return UserDAO(env=self.env).iter_all_users(fetch_size=fetch_size)
+
+
+    def _stream(self, entity: str, file_format: str, fetch_size: int) -> Iterator[str]:
+        excluded_fields = _EXCLUDED_FIELDS.get(entity, set())
+        buffer = io.StringIO()
+        csv_writer = csv.writer(buffer) if file_format == "csv" else None
+        rows_in_buffer, header_written = 0, False
+
+        for item in self._iter_entities(entity, fetch_size):
+            row = {field_name: value for field_name, value in asdict(item).items() if field_name not in excluded_fields}
+            if csv_writer is None:
+                buffer.write(json.dumps(row, default=str, ensure_ascii=False) + "\n")
+            else:
+                if not header_written:
+                    csv_writer.writerow(row.keys())
+                    header_written = True
+                csv_writer.writerow(json.dumps(value, ensure_ascii=False) if isinstance(value, dict) else value
+                                    for value in row.values())
+
+            rows_in_buffer += 1
+            if rows_in_buffer >= fetch_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                rows_in_buffer = 0
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+#
@@ -0,0 +1,94 @@
+# built-in packages
+import hashlib
+import os
+import tempfile
+import uuid
+from typing import BinaryIO, Tuple
+
+# internal packages
+from src.config import UPLOAD_FOLDER, IMAGE_VARIANTS, IMAGE_QUALITY, IMAGE_MAX_PIXELS
+from src.services import errors
+
+# external packages
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ImageService:
+    def __init__(self, upload_folder: str = UPLOAD_FOLDER):
+        self.upload_folder = upload_folder
+
+
+    def save_vacation_image(self, stream: BinaryIO) -> Tuple[str, dict]:
+        """
+        Saves an uploaded vacation photo as resized WebP variants (see IMAGE_VARIANTS), without EXIF/metadata.
+        The upload is streamed to disk while it is hashed, and the variants are stored under that content hash
+        ('<hash>_<variant>.webp'), so identical uploads share the same files and a file name never changes content.
+        Returns the file name of the 'original' variant (stored as photo_file_path) and the variants
+        with their dimensions: {"card": {"file": ..., "width": ..., "height": ...}, ...}.
+        """
+        os.makedirs(self.upload_folder, exist_ok=True)
+        upload_path, content_hash = self._stream_to_disk(stream)
+        try:
+            variants = self._existing_variants(content_hash)
+            if variants is None:
+                with Image.open(upload_path) as image:
+                    image.load()
+                    variants = self._save_variants(image, content_hash)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError):
+            raise errors.InvalidInputError("Invalid image file.")
+        finally:
+            os.remove(upload_path)
+
+        return variants["original"]["file"], variants
+
+
+    def _stream_to_disk(self, stream: BinaryIO) -> Tuple[str, str]:
+        # the variant settings are part of the hash, so changing them never reuses a file name for different content
+        hasher = hashlib.sha256(f"{sorted(IMAGE_VARIANTS.items())}:{IMAGE_QUALITY}".encode())
+        with tempfile.NamedTemporaryFile(dir=self.upload_folder, suffix=".upload", delete=False) as upload_file:
+            while chunk := stream.read(_CHUNK_SIZE):
+                hasher.update(chunk)
+                upload_file.write(chunk)
+
+        return upload_file.name, hasher.hexdigest()[:32]
+
+
+    def _existing_variants(self, content_hash: str) -> dict | None:
+        variants = {}
+        for variant_name in IMAGE_VARIANTS:
+            variant_file = f"{content_hash}_{variant_name}.webp"
+            variant_path = os.path.join(self.upload_folder, variant_file)
+            if not os.path.isfile(variant_path):
+                return None
+            with Image.open(variant_path) as variant_image:
+                variants[variant_name] = {"file": variant_file, "width": variant_image.width, "height": variant_image.height}
+
+        return variants
+
+
+    def _save_variants(self, image: Image.Image, content_hash: str) -> dict:
+        # apply the EXIF orientation before the metadata is dropped
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+        variants = {}
+        for variant_name, max_width in IMAGE_VARIANTS.items():
+            resized = image.copy()
+            if resized.width > max_width:
+                resized = resized.resize((max_width, round(resized.height * max_width / resized.width)), Image.LANCZOS)
+
+            variant_file = f"{content_hash}_{variant_name}.webp"
+            variant_path = os.path.join(self.upload_folder, variant_file)
+            # write then rename, so a (forever cached) file is never served half written
+            temp_path = f"{variant_path}.{uuid.uuid4().hex}.tmp"
+            resized.save(temp_path, "WEBP", quality=IMAGE_QUALITY, method=4)
+            os.replace(temp_path, variant_path)
+            variants[variant_name] = {"file": variant_file, "width": resized.width, "height": resized.height}
+
+        return variants
+
+#
@@ -0,0 +1,163 @@
+# built-in packages
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Tuple
+
+# internal packages
+from src.config import PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_TIMEOUT
+from src.services import errors
+
+# external packages
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+def _timed_generate_hash(password: str) -> Tuple[str, float]:
+    started = time.perf_counter()
+    hashed_password = generate_password_hash(password, method='pbkdf2:sha256', salt_length=16)
+    return hashed_password, time.perf_counter() - started
+
+
+def _timed_check_hash(hashed_password: str, password: str) -> Tuple[bool, float]:
+    started = time.perf_counter()
+    is_valid = check_password_hash(hashed_password, password)
+    return is_valid, time.perf_counter() - started
+
+
+class PasswordHasher:
+    """
+    Runs the CPU heavy pbkdf2 hashing in a bounded pool of worker processes, so request threads
+    do not hold the GIL while a password is hashed. At most 'workers + max_queue' hashes are in
+    flight; beyond that, or when a hash is not done within 'timeout' seconds, ServiceUnavailableError is raised.
+    With workers = 0 hashing runs inline on the calling thread.
+    """
+    def __init__(self, workers: int, max_queue: int, timeout: float):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(workers + max_queue) if workers else None
+        self._stats_lock = threading.Lock()
+        self._stats = {"completed": 0, "rejected": 0, "timeouts": 0, "in_flight": 0,
+                       "queue_wait_total_ms": 0.0, "queue_wait_max_ms": 0.0, "hash_total_ms": 0.0, "hash_max_ms": 0.0}
+
+
+    def generate_password_hash(self, password: str) -> str:
+        """
+        Returns the pbkdf2:sha256 hash of the password.
+        """
+        return self._run(_timed_generate_hash, password)
+
+
+    def check_password_hash(self, hashed_password: str, password: str) -> bool:
+        """
+        Returns True if the password matches the hash.
+        """
+        return self._run(_timed_check_hash, hashed_password, password)
+
+
+    def get_stats(self) -> dict:
+        """
+        Returns the pool settings and counters, with the average queue wait versus hash time in milliseconds.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        completed = stats["completed"]
+        stats.update({"workers": self.workers, "max_queue": self.max_queue, "timeout": self.timeout,
+                      "queue_wait_avg_ms": round(stats["queue_wait_total_ms"] / completed, 3) if completed else 0.0,
+                      "hash_avg_ms": round(stats["hash_total_ms"] / completed, 3) if completed else 0.0})
+        return stats
+
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes; they are started again on the next hash.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+    def reset_after_fork(self) -> None:
+        """
+        Forgets the worker processes and in-flight hashes inherited from the parent process (called in a forked child).
+        """
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue) if self.workers else None
+        self._stats_lock = threading.Lock()
+        self._stats["in_flight"] = 0
+
+
+    def _run(self, function: Callable[..., Tuple[Any, float]], *args) -> Any:
+        if not self.workers:
+            result, hash_seconds = function(*args)
+            self._record(0.0, hash_seconds)
+            return result
+
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise errors.ServiceUnavailableError("Too many password hashing requests, try again later")
+
+        submitted = time.perf_counter()
+        self._change_in_flight(1)
+        try:
+            future = self._get_executor().submit(function, *args)
+        except Exception:
+            self._release_slot()
+            raise
+        # the slot is freed when the worker is done, even if the caller already gave up waiting
+        future.add_done_callback(self._release_slot)
+
+        try:
+            result, hash_seconds = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._count("timeouts")
+            raise errors.ServiceUnavailableError("Password hashing timed out, try again later")
+
+        self._record(time.perf_counter() - submitted - hash_seconds, hash_seconds)
+        return result
+
+
+    def _release_slot(self, future=None) -> None:
+        self._change_in_flight(-1)
+        self._slots.release()
+
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # 'spawn' workers do not inherit the web process threads, sockets or connection pools
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+
+    def _record(self, queue_wait_seconds: float, hash_seconds: float) -> None:
+        queue_wait_ms, hash_ms = max(queue_wait_seconds, 0.0) * 1000, hash_seconds * 1000
+        with self._stats_lock:
+            self._stats["completed"] += 1
+            self._stats["queue_wait_total_ms"] += queue_wait_ms
+            self._stats["queue_wait_max_ms"] = max(self._stats["queue_wait_max_ms"], queue_wait_ms)
+            self._stats["hash_total_ms"] += hash_ms
+            self._stats["hash_max_ms"] = max(self._stats["hash_max_ms"], hash_ms)
+
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+
+    def _change_in_flight(self, delta: int) -> None:
+        with self._stats_lock:
+            self._stats["in_flight"] += delta
+
+
+password_hasher = PasswordHasher(workers=PASSWORD_HASH_WORKERS, max_queue=PASSWORD_HASH_MAX_QUEUE, timeout=PASSWORD_HASH_TIMEOUT)
+os.register_at_fork(after_in_child=password_hasher.reset_after_fork)
+
+#
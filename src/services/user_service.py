@@ -1,16 +1,16 @@
 # built-in packages
 import re
+from typing import Tuple
 
 # internal packages
 from src.services import errors
 from src.dal.user_dao import UserDAO
 from src.dal.like_dao import LikeDAO
 from src.dal.vacation_dao import VacationDAO
+from src.dal.unit_of_work import transactional
 from src.models.user_dto import User
 from src.models.like_dto import Like
-
-# external packages
-from werkzeug.security import generate_password_hash, check_password_hash
+from src.services.password_hasher import password_hasher
 
 
 class UserService:
@@ -40,11 +40,7 @@ class UserService:
         if UserDAO(env=self.env).email_exists(email):
             raise errors.InvalidInputError("Email already exists")
         
-        hashed_password = generate_password_hash(
-            password,
-            method='pbkdf2:sha256',
-            salt_length=16
-        )
+        hashed_password = password_hasher.generate_password_hash(password)
         
         user_registered = UserDAO(env=self.env).add_user(first_name, last_name, email, hashed_password)
         return user_registered
@@ -74,10 +70,11 @@ class UserService:
         
         user = UserDAO(env=self.env).get_user_by_email(email)
         
-        if check_password_hash(user.hashed_password, password):
+        if password_hasher.check_password_hash(user.hashed_password, password):
             return user
     
     
+    @transactional
     def add_like(self, user_id: int, vacation_id: int) -> Like:
         """
         Add a like for a vacation.
@@ -98,6 +95,7 @@ class UserService:
         return like
 
 
+    @transactional
     def remove_like(self, user_id: int, vacation_id: int) -> Like:
         """
         Remove a like for a vacation.
@@ -113,6 +111,24 @@ class UserService:
         
         like_removed = LikeDAO(env=self.env).delete_like(user_id=user_id, vacation_id=vacation_id)
         return like_removed            
+
+
+    @transactional
+    def toggle_like(self, user_id: int, vacation_id: int, liked: bool | None = None) -> Tuple[bool, int]:
+        """
+        Toggle a like for a vacation (or set it when liked is True/False).
+        Returns whether the vacation is now liked by the user and its updated likes count.
+        """
+        if not isinstance(user_id, int) or not isinstance(vacation_id, int) or not isinstance(liked, (bool, type(None))):
+            raise errors.InvalidTypeInputError("Invalid data types: user_id and vacation_id must be integer, liked must be boolean")
+
+        if not user_id or not vacation_id:
+            raise errors.MissingInputError("user_id and vacation_id are required")
+        
+        result = LikeDAO(env=self.env).toggle_like(user_id=user_id, vacation_id=vacation_id, liked=liked)
+        if result is None:
+            raise errors.InvalidInputError("User id or vacation id not found")
+        
+        return result
     
 # 
-    
\ No newline at end of file
@@ -0,0 +1,138 @@
+# built-in packages
+import csv
+import io
+import json
+import os
+from datetime import date
+from typing import BinaryIO, List, Tuple
+
+# internal packages
+from src.config import VACATION_IMPORT_MAX_ROWS
+from src.services import errors
+from src.dal.vacation_dao import VacationDAO
+from src.dal.country_dao import CountryDAO
+from src.dal.unit_of_work import transactional
+from src.models.vacation_import_dto import VacationImportReport, VacationImportRowError
+
+IMPORT_FIELDS = ["country_id", "vacation_info", "vacation_start_date", "vacation_end_date", "price", "photo_file_path"]
+_TEXT_MAX_LENGTH = 1000
+
+
+class VacationImportService:
+    def __init__(self, env: str ='dev'):
+        self.env = env
+
+
+    def parse_file(self, stream: BinaryIO, file_name: str) -> List[dict]:
+        """
+        Function to read the rows of an uploaded vacations file: CSV with a header row, or NDJSON (one JSON object per line).
+        A NDJSON line that is not a JSON object is returned as None, so it is reported with its row number.
+        """
+        extension = os.path.splitext(file_name or "")[1].lower()
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            if extension == ".csv":
+                rows = list(csv.DictReader(text))
+            elif extension in (".ndjson", ".jsonl"):
+                rows = [self._parse_json_line(line) for line in text if line.strip()]
+            else:
+                raise errors.InvalidInputError("Unsupported file type, use .csv or .ndjson.")
+        except (UnicodeDecodeError, csv.Error):
+            raise errors.InvalidInputError("The file could not be read, it must be UTF-8 CSV or NDJSON.")
+
+        if len(rows) > VACATION_IMPORT_MAX_ROWS:
+            raise errors.InvalidInputError(f"Too many rows, at most {VACATION_IMPORT_MAX_ROWS} vacations can be imported at once.")
+        return rows
+
+
+    @staticmethod
+    def _parse_json_line(line: str) -> dict | None:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return row if isinstance(row, dict) else None
+
+
+    @transactional
+    def import_vacations(self, rows: List[dict | None]) -> VacationImportReport:
+        """
+        Function to import many vacations at once.
+        All rows are validated in one pass (same rules as add_vacation, with all the country ids checked in a single query),
+        the valid ones are inserted with COPY in one transaction, and every invalid row is reported with its errors.
+        Row numbers start at 1 (the first data row).
+        """
+        parsed_rows, report_errors = [], []
+        for row_number, row in enumerate(rows, start=1):
+            vacation, row_errors = self._validate_row(row)
+            if row_errors:
+                report_errors.append(VacationImportRowError(row=row_number, errors=row_errors))
+            else:
+                parsed_rows.append((row_number, vacation))
+
+        existing_country_ids = CountryDAO(env=self.env).get_existing_country_ids(
+            list({vacation[0] for _, vacation in parsed_rows})) if parsed_rows else set()
+
+        valid_vacations = []
+        for row_number, vacation in parsed_rows:
+            if vacation[0] in existing_country_ids:
+                valid_vacations.append(vacation)
+            else:
+                report_errors.append(VacationImportRowError(row=row_number, errors=["Country id not found."]))
+
+        imported = VacationDAO(env=self.env).copy_vacations(valid_vacations) if valid_vacations else 0
+        report_errors.sort(key=lambda row_error: row_error.row)
+        return VacationImportReport(total_rows=len(rows), imported=imported, errors=report_errors)
+
+
+    @staticmethod
+    def _validate_row(row: dict | None) -> Tuple[tuple | None, List[str]]:
+        if not isinstance(row, dict):
+            return None, ["Invalid row, expected a JSON object."]
+
+        values = {field_name: row.get(field_name) for field_name in IMPORT_FIELDS}
+        values = {field_name: value.strip() if isinstance(value, str) else value for field_name, value in values.items()}
+        missing = [field_name for field_name, value in values.items() if value in (None, "")]
+        if missing:
+            return None, [f"Missing fields: {', '.join(missing)}."]
+
+        row_errors = []
+        country_id = price = start_date = end_date = None
+        try:
+            country_id = _to_int(values["country_id"])
+        except (TypeError, ValueError):
+            row_errors.append("Country id must be an integer.")
+        try:
+            price = _to_int(values["price"])
+            if price > 10000 or price <= 0:
+                row_errors.append("Vacation price must be greater than 0 and less than 10,000.")
+        except (TypeError, ValueError):
+            row_errors.append("Price must be an integer.")
+        try:
+            start_date = date.fromisoformat(str(values["vacation_start_date"]))
+            end_date = date.fromisoformat(str(values["vacation_end_date"]))
+        except ValueError:
+            row_errors.append("Dates must be in the format YYYY-MM-DD.")
+
+        if start_date and end_date:
+            if end_date < start_date:
+                row_errors.append("The entered end date occurs before the start date.")
+            if start_date < date.today():
+                row_errors.append("The start date has occurred in the past.")
+
+        for field_name in ("vacation_info", "photo_file_path"):
+            if not isinstance(values[field_name], str) or len(values[field_name]) > _TEXT_MAX_LENGTH:
+                row_errors.append(f"{field_name} must be a text of up to {_TEXT_MAX_LENGTH} characters.")
+
+        if row_errors:
+            return None, row_errors
+        return (country_id, values["vacation_info"], start_date, end_date, price, values["photo_file_path"]), []
+
+
+def _to_int(value) -> int:
+    # CSV gives strings, NDJSON may give numbers; 12.5 or true are not silently truncated to an integer
+    if isinstance(value, (bool, float)):
+        raise ValueError(value)
+    return int(value)
+
+#
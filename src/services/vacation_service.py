@@ -1,30 +1,243 @@
 # built-in packages
-from datetime import date
-from typing import List
+from datetime import date, timedelta
+from typing import List, Tuple
+import base64
+import bisect
+import re
 
 # internal packages
+from src.config import (VACATIONS_PAGE_SIZE, SEARCH_MAX_PAGE_SIZE, SEARCH_MAX_QUERY_LENGTH, SEARCH_MAX_OFFSET, SEARCH_PRICE_BUCKETS,
+                        AVAILABILITY_MAX_DAYS)
 from src.services import errors
 from src.dal.vacation_dao import VacationDAO
 from src.dal.country_dao import CountryDAO
+from src.dal.home_page_dao import HomePageDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.catalog_read_model import catalog_read_models
+from src.dal.unit_of_work import transactional
 from src.models.vacation_dto import Vacation
+from src.models.country_dto import Country
+from src.models.vacation_search_dto import VacationSearchResult, PriceFacet
+from src.models.home_page_dto import HomePageViewModel
+from src.models.catalog_snapshot_dto import CatalogSnapshot
+from src.services.catalog_snapshot import catalog_snapshots, DATABASE_UNAVAILABLE_ERRORS
 
 
 class VacationService:
     def __init__(self, env: str ='dev'):
         self.env = env
         
+    def _catalog_reader(self, dao_class):
+        # the in-memory catalog read model (no SQL) while it is up to date, else the DAO - both have the same read methods
+        model = catalog_read_models.current(self.env)
+        return model if model is not None else dao_class(env=self.env)
+
+
     def get_vacations(self) -> List[Vacation]:
         """
         This function returns all vacations sorted by start date.
         """
-        vacations = VacationDAO(env=self.env).get_all_vacations()
+        vacations = self._catalog_reader(VacationDAO).get_all_vacations()
         if vacations == []:
             raise Exception("No vacations found.")
         else:
             return vacations
         
     
-    def add_vacation(self, country_id: int, vacation_info: str, vacation_start_date: date, vacation_end_date: date, price: int, photo_file_path: str) -> Vacation:
+    def get_vacation(self, vacation_id: int) -> Vacation | None:
+        """
+        Function to get one vacation by id (None if it does not exist).
+        """
+        if not isinstance(vacation_id, int):
+            raise errors.InvalidTypeInputError("Invalid data types.")
+
+        return self._catalog_reader(VacationDAO).get_vacation_by_id(vacation_id)
+
+
+    def get_countries(self) -> List[Country]:
+        """
+        Function to get all countries sorted by name.
+        """
+        return sorted(self._catalog_reader(CountryDAO).get_all_countries(), key=lambda country: country.country_name)
+
+
+    def get_vacations_page(self, cursor: str | None = None, page_size: int = VACATIONS_PAGE_SIZE) -> Tuple[List[Vacation], str | None]:
+        """
+        Function to get one page of vacations sorted by start date.
+        Returns the vacations of the page and the cursor of the next page (None when this is the last page).
+        While the database is slow or down the page comes from the catalog snapshot (see catalog_snapshot).
+        """
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise errors.InvalidInputError("Page size must be a positive integer.")
+
+        after_start_date, after_vacation_id = self._decode_cursor(cursor) if cursor else (None, None)
+        catalog_snapshots.start(self.env)
+        snapshot = catalog_snapshots.stale_snapshot(self.env)
+        if snapshot is None:
+            try:
+                vacations = self._catalog_reader(VacationDAO).get_vacations_page(limit=page_size + 1, after_start_date=after_start_date,
+                                                                                 after_vacation_id=after_vacation_id)
+            except DATABASE_UNAVAILABLE_ERRORS as e:
+                snapshot = catalog_snapshots.fall_back(self.env, e)
+        if snapshot is not None:
+            return self._snapshot_page(snapshot, after_start_date, after_vacation_id, page_size)
+
+        if len(vacations) <= page_size:
+            return vacations, None
+
+        vacations = vacations[:page_size]
+        return vacations, self._encode_cursor(vacations[-1])
+
+
+    def get_home_page(self, user_id: int, page_size: int = VACATIONS_PAGE_SIZE) -> HomePageViewModel:
+        """
+        Function to get all the data of the home page: the first page of vacations sorted by start date (with the cursor
+        of the next page), all countries and the vacations the user liked. The catalog comes from the in-memory read model
+        while it is up to date, else everything is read in one database round trip.
+        While the database is slow or down the page comes from the catalog snapshot, without the user's likes.
+        """
+        if not isinstance(user_id, int) or not isinstance(page_size, int):
+            raise errors.InvalidTypeInputError("Invalid data types.")
+
+        if page_size <= 0:
+            raise errors.InvalidInputError("Page size must be a positive integer.")
+
+        catalog_snapshots.start(self.env)
+        snapshot = catalog_snapshots.stale_snapshot(self.env)
+        if snapshot is None:
+            try:
+                model = catalog_read_models.current(self.env)
+                if model is not None:
+                    vacations, countries = model.get_vacations_page(limit=page_size + 1), model.get_all_countries()
+                    liked_vacations = LikeDAO(env=self.env).get_liked_vacation_ids_by_user(user_id)
+                else:
+                    vacations, countries, liked_vacations = HomePageDAO(env=self.env).get_home_page_data(user_id=user_id, limit=page_size + 1)
+            except DATABASE_UNAVAILABLE_ERRORS as e:
+                snapshot = catalog_snapshots.fall_back(self.env, e)
+        if snapshot is not None:
+            vacations, next_cursor = self._snapshot_page(snapshot, None, None, page_size)
+            return HomePageViewModel(vacations=vacations, next_cursor=next_cursor, countries=snapshot.countries, liked_vacations=[])
+
+        next_cursor = None
+        if len(vacations) > page_size:
+            vacations = vacations[:page_size]
+            next_cursor = self._encode_cursor(vacations[-1])
+
+        return HomePageViewModel(vacations=vacations, next_cursor=next_cursor, countries=countries, liked_vacations=liked_vacations)
+
+
+    def search_vacations(self, query: str | None = None, country_ids: List[int] | None = None, min_price: int | None = None,
+                         max_price: int | None = None, start_from: date | None = None, start_to: date | None = None,
+                         page: int = 1, page_size: int = VACATIONS_PAGE_SIZE) -> VacationSearchResult:
+        """
+        Function to search the vacations by free text (vacation description and country name), countries, price range
+        and start date window, sorted by start date.
+        Returns one page of the matching vacations together with the total number of matches and the facet counts
+        (per country and per price bucket).
+        """
+        if query is not None and not isinstance(query, str) or not isinstance(country_ids, (list, tuple, type(None))) \
+        or any(not isinstance(value, (int, type(None))) for value in (min_price, max_price)) \
+        or any(not isinstance(value, (date, type(None))) for value in (start_from, start_to)) \
+        or not isinstance(page, int) or not isinstance(page_size, int):
+            raise errors.InvalidTypeInputError("Invalid data types.")
+
+        if query and len(query) > SEARCH_MAX_QUERY_LENGTH:
+            raise errors.InvalidInputError(f"Search text must be up to {SEARCH_MAX_QUERY_LENGTH} characters.")
+
+        if any(not isinstance(country_id, int) for country_id in country_ids or []):
+            raise errors.InvalidTypeInputError("Country ids must be integers.")
+
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise errors.InvalidInputError("The minimum price is greater than the maximum price.")
+
+        if start_from is not None and start_to is not None and start_from > start_to:
+            raise errors.InvalidInputError("The entered date range ends before it starts.")
+
+        if page <= 0 or not 0 < page_size <= SEARCH_MAX_PAGE_SIZE:
+            raise errors.InvalidInputError(f"Page must be positive and page size between 1 and {SEARCH_MAX_PAGE_SIZE}.")
+
+        if (page - 1) * page_size > SEARCH_MAX_OFFSET:
+            raise errors.InvalidInputError(f"Only the first {SEARCH_MAX_OFFSET + page_size} matches can be paged through, refine the search.")
+
+        # letters and digits only, every word matches as a prefix (of a description word or of a country name word);
+        # the few country names are matched here, so the query gets plain country ids the planner can estimate
+        words = dict.fromkeys(re.findall(r"[^\W_]+", (query or "").lower()))
+        countries = CountryDAO(env=self.env).get_all_countries() if words else []
+        terms = tuple((word, tuple(country.country_id for country in countries
+                                   if any(name_word.startswith(word) for name_word in re.findall(r"[^\W_]+", country.country_name.lower()))))
+                      for word in words)
+        vacations, total, country_facets, price_counts = VacationDAO(env=self.env).search_vacations(
+            terms=terms, country_ids=tuple(sorted(set(country_ids or []))), min_price=min_price, max_price=max_price,
+            start_from=start_from, start_to=start_to, price_buckets=tuple(SEARCH_PRICE_BUCKETS),
+            limit=page_size, offset=(page - 1) * page_size)
+
+        edges = [None, *SEARCH_PRICE_BUCKETS, None]
+        price_facets = [PriceFacet(min_price=edges[bucket], max_price=edges[bucket + 1] - 1 if edges[bucket + 1] else None,
+                                   count=price_counts.get(bucket, 0)) for bucket in range(len(SEARCH_PRICE_BUCKETS) + 1)]
+        return VacationSearchResult(vacations=vacations, total=total, page=page, page_size=page_size,
+                                    country_facets=country_facets, price_facets=price_facets)
+
+
+    def get_vacations_overlapping(self, start_date: date, end_date: date, limit: int = VACATIONS_PAGE_SIZE) -> List[Vacation]:
+        """
+        Function to get the vacations taking place (at least partly) during the travel window [start_date, end_date], sorted by start date.
+        """
+        if not isinstance(start_date, date) or not isinstance(end_date, date) or not isinstance(limit, int):
+            raise errors.InvalidTypeInputError("Invalid data types.")
+
+        if end_date < start_date:
+            raise errors.InvalidInputError("The entered end date occurs before the start date.")
+
+        if not 0 < limit <= SEARCH_MAX_PAGE_SIZE:
+            raise errors.InvalidInputError(f"Limit must be between 1 and {SEARCH_MAX_PAGE_SIZE}.")
+
+        return VacationDAO(env=self.env).get_vacations_overlapping(start_date=start_date, end_date=end_date, limit=limit)
+
+
+    def get_vacations_starting_within(self, days: int, limit: int = VACATIONS_PAGE_SIZE) -> List[Vacation]:
+        """
+        Function to get the vacations starting within the next 'days' days (today included), sorted by start date.
+        """
+        if not isinstance(days, int) or not isinstance(limit, int):
+            raise errors.InvalidTypeInputError("Invalid data types.")
+
+        if not 0 <= days <= AVAILABILITY_MAX_DAYS or not 0 < limit <= SEARCH_MAX_PAGE_SIZE:
+            raise errors.InvalidInputError(f"Days must be between 0 and {AVAILABILITY_MAX_DAYS} and limit must be between 1 and {SEARCH_MAX_PAGE_SIZE}.")
+
+        return self._catalog_reader(VacationDAO).get_vacations_starting_between(from_date=date.today(), to_date=date.today() + timedelta(days=days),
+                                                                                limit=limit)
+
+
+    def _snapshot_page(self, snapshot: CatalogSnapshot, after_start_date: date | None, after_vacation_id: int | None,
+                       page_size: int) -> Tuple[List[Vacation], str | None]:
+        # same keyset order as VacationDAO.get_vacations_page; past the end of an incomplete snapshot the page is cut short
+        start = 0
+        if after_start_date is not None:
+            start = bisect.bisect_right(snapshot.vacations, (after_start_date, after_vacation_id),
+                                        key=lambda vacation: (vacation.vacation_start_date, vacation.vacation_id))
+        vacations = snapshot.vacations[start:start + page_size]
+        has_more = start + page_size < len(snapshot.vacations) or not snapshot.complete
+        return vacations, self._encode_cursor(vacations[-1]) if vacations and has_more else None
+
+
+    @staticmethod
+    def _encode_cursor(vacation: Vacation) -> str:
+        key = f"{vacation.vacation_start_date.isoformat()}_{vacation.vacation_id}"
+        return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[date, int]:
+        try:
+            start_date, vacation_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("_")
+            return date.fromisoformat(start_date), int(vacation_id)
+        except Exception:
+            raise errors.InvalidInputError("Invalid page cursor.")
+        
+    
+    @transactional
+    def add_vacation(self, country_id: int, vacation_info: str, vacation_start_date: date, vacation_end_date: date, price: int, photo_file_path: str,
+                     photo_variants: dict | None = None) -> Vacation:
         """
         Function to add a new vacation.
         """
@@ -32,7 +245,8 @@ class VacationService:
             raise errors.InvalidInputError("All fields are required.")
             
         if not isinstance(country_id, int) or not isinstance(vacation_info, str) or not isinstance(vacation_start_date, date) \
-        or not isinstance(vacation_end_date, date) or not isinstance(price, int) or not isinstance(photo_file_path, str):
+        or not isinstance(vacation_end_date, date) or not isinstance(price, int) or not isinstance(photo_file_path, str) \
+        or not isinstance(photo_variants, (dict, type(None))):
             raise errors.InvalidTypeInputError("Invalid data types.")
 
         if not country_id or not vacation_info or not vacation_start_date or not vacation_end_date or not price or not photo_file_path:
@@ -51,12 +265,15 @@ class VacationService:
             raise errors.InvalidInputError("Country id not found.")
         
         vacation_added = VacationDAO(env=self.env).add_vacation(country_id=country_id, vacation_info=vacation_info,vacation_start_date=vacation_start_date,
-                                vacation_end_date=vacation_end_date, price=price, photo_file_path=photo_file_path)
+                                vacation_end_date=vacation_end_date, price=price, photo_file_path=photo_file_path,
+                                photo_variants=photo_variants)
 
         return vacation_added
         
     
-    def update_vacation(self, vacation_id:int, country_id: int, vacation_info: str, vacation_start_date: date, vacation_end_date: date, price: int, photo_file_path: str = None) -> Vacation:
+    @transactional
+    def update_vacation(self, vacation_id:int, country_id: int, vacation_info: str, vacation_start_date: date, vacation_end_date: date, price: int, photo_file_path: str = None,
+                        photo_variants: dict | None = None) -> Vacation:
         """
         Function to update an existing vacation.
         """
@@ -64,7 +281,8 @@ class VacationService:
             raise errors.InvalidInputError("All fields are required (except photo file path).")
             
         if not isinstance(vacation_id, int) or not isinstance(country_id, int) or not isinstance(vacation_info, str) or not isinstance(vacation_start_date, date) \
-        or not isinstance(vacation_end_date, date) or not isinstance(price, int) or not isinstance(photo_file_path, (str, type(None))):
+        or not isinstance(vacation_end_date, date) or not isinstance(price, int) or not isinstance(photo_file_path, (str, type(None))) \
+        or not isinstance(photo_variants, (dict, type(None))):
             raise errors.InvalidTypeInputError("Invalid data types.")
 
         if not vacation_id or not country_id or not vacation_info or not vacation_start_date or not vacation_end_date or not price:
@@ -76,24 +294,30 @@ class VacationService:
         if vacation_end_date < vacation_start_date:
             raise errors.InvalidInputError("The entered end date occurs before the start date.")
         
-        if VacationDAO(env=self.env).get_vacation_by_id(vacation_id=vacation_id) == None:
+        # the change set is computed against the row itself (not the cache, which may lag behind another process's edit),
+        # locked until this unit of work commits
+        current_vacation = VacationDAO(env=self.env).lock_vacation_by_id(vacation_id=vacation_id)
+        if current_vacation == None:
             raise errors.InvalidInputError("Vacation id not found.")
         
-        if CountryDAO(env=self.env).get_country_by_id(country_id=country_id) == None:
+        if country_id != current_vacation.country_id and CountryDAO(env=self.env).get_country_by_id(country_id=country_id) == None:
             raise errors.InvalidInputError("Country id not found.")
         
         fields = [("country_id", country_id), ("vacation_info", vacation_info), ("vacation_start_date", vacation_start_date),
-                  ("vacation_end_date", vacation_end_date),("price", price),("photo_file_path", photo_file_path)]
-            
-        for field_name, value in fields:
-            VacationDAO(env=self.env).update_vacation_value_by_id(vacation_id=vacation_id, column_to_update=field_name, new_value=value)
+                  ("vacation_end_date", vacation_end_date),("price", price),("photo_file_path", photo_file_path),("photo_variants", photo_variants)]
+        
+        # only the changed columns are written, all in one statement (a None photo keeps the current one)
+        changed_values = {field_name: value for field_name, value in fields
+                          if value is not None and value != getattr(current_vacation, field_name)}
+        if not changed_values:
+            return current_vacation
             
-        vacation_updated = Vacation(vacation_id=vacation_id, country_id=country_id, vacation_info=vacation_info, vacation_start_date=vacation_start_date,
-                                     vacation_end_date=vacation_end_date, price=price, photo_file_path=photo_file_path)
+        vacation_updated = VacationDAO(env=self.env).update_vacation_values_by_id(vacation_id=vacation_id, values=changed_values)
 
         return vacation_updated
             
     
+    @transactional
     def delete_vacation(self, vacation_id: int) -> Vacation:
         """
         Function to delete an existing vacation.
@@ -94,21 +94,50 @@ document.addEventListener("DOMContentLoaded", function () {
         });
     }
 
-    // handle vacation card click — open popup with details
-    document.querySelectorAll(".vacation-card").forEach(card => {
-        card.addEventListener("click", function () {
-            if (this.classList.contains("add-new-card")) return;
-
-            const title = this.querySelector("h3")?.innerText || "חופשה";
-            const description = this.querySelector(".description")?.innerText || "";
-            const imageUrl = this.querySelector("img")?.src || "";
-            const dates = this.querySelector(".dates")?.innerText || "";
-            const price = this.querySelector(".price")?.innerText || "";
-
-            openPopup(title, description, imageUrl, dates, price);
-        });
+    // handle vacation card click — open popup with details (delegated, so cards loaded later are included)
+    const vacationsContainer = document.querySelector(".vacations-container");
+    vacationsContainer?.addEventListener("click", function (e) {
+        const card = e.target.closest(".vacation-card");
+        if (!card || card.classList.contains("add-new-card")) return;
+
+        const title = card.querySelector("h3")?.innerText || "חופשה";
+        const description = card.querySelector(".description")?.innerText || "";
+        const cardImage = card.querySelector("img");
+        const imageUrl = cardImage?.dataset.popupSrc || cardImage?.src || "";
+        const dates = card.querySelector(".dates")?.innerText || "";
+        const price = card.querySelector(".price")?.innerText || "";
+
+        openPopup(title, description, imageUrl, dates, price);
     });
 
+    // infinite scroll — load the next page of vacations when the sentinel gets close to the viewport
+    const loadMoreSentinel = document.getElementById("load-more-sentinel");
+    if (loadMoreSentinel && vacationsContainer) {
+        let loadingMore = false;
+        const loadMoreObserver = new IntersectionObserver(entries => {
+            if (!entries[0].isIntersecting || loadingMore) return;
+            loadingMore = true;
+
+            fetch(`/${envPrefix}/vacations?cursor=${encodeURIComponent(loadMoreSentinel.dataset.nextCursor)}`, { credentials: "include" })
+                .then(res => res.json())
+                .then(data => {
+                    vacationsContainer.insertAdjacentHTML("beforeend", data.html || "");
+                    if (data.next_cursor) {
+                        loadMoreSentinel.dataset.nextCursor = data.next_cursor;
+                        // re-observe so a sentinel that is still visible triggers the next page
+                        loadMoreObserver.unobserve(loadMoreSentinel);
+                        loadMoreObserver.observe(loadMoreSentinel);
+                    } else {
+                        loadMoreObserver.disconnect();
+                        loadMoreSentinel.remove();
+                    }
+                })
+                .catch(err => console.error("Error loading vacations:", err))
+                .finally(() => { loadingMore = false; });
+        }, { rootMargin: "400px" });
+        loadMoreObserver.observe(loadMoreSentinel);
+    }
+
     // close popup when clicking outside content
     if (popup) {
         popup.addEventListener("click", function (e) {
@@ -286,7 +315,7 @@ function handleLikeClick(event) {
                 likeCountSpan.textContent = `${data.likes_count} סימנו בלייק`;
 
                 const heartIcon = icon.querySelector("i");
-                heartIcon.style.color = data.message.includes("added") ? "red" : "white";
+                heartIcon.style.color = data.liked ? "red" : "white";
             } else {
                 alert(data.error || "Unexpected error");
             }
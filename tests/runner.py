@@ -6,10 +6,27 @@ from tests.test_user_service import TestUserService
 from tests.test_vacation_service import TestVacationService
 from tests.test_auth_api import TestAuthApi
 from tests.test_vacation_api import TestVacationApi
+from tests.test_stats_api import TestStatsApi
+from tests.test_migrate import TestMigrate
+from tests.test_dao_cache import TestDAOCache
+from tests.test_image_service import TestImageService
+from tests.test_media_api import TestMediaApi
+from tests.test_password_hasher import TestPasswordHasher
+from tests.test_instrumentation import TestInstrumentation
+from tests.test_unit_of_work import TestUnitOfWork
+from tests.test_benchmarks import TestBenchmarks
+from tests.test_generate_synthetic_data import TestGenerateSyntheticData
+from tests.test_vacation_import_service import TestVacationImportService
+from tests.test_export_service import TestExportService
+from tests.test_database import TestDatabase
+from tests.test_latency_budget import TestLatencyBudget
+from tests.test_catalog_snapshot import TestCatalogSnapshot
+from tests.test_catalog_read_model import TestCatalogReadModel
+from tests.test_change_events import TestChangeEvents
 
 
 def test_all():
-    test_cases = [TestUserService, TestVacationService, TestAuthApi, TestVacationApi]
+    test_cases = [TestUserService, TestVacationService, TestAuthApi, TestVacationApi, TestStatsApi, TestMigrate, TestDAOCache, TestImageService, TestMediaApi, TestPasswordHasher, TestInstrumentation, TestUnitOfWork, TestBenchmarks, TestGenerateSyntheticData, TestVacationImportService, TestExportService, TestDatabase, TestLatencyBudget, TestCatalogSnapshot, TestCatalogReadModel, TestChangeEvents]
     suite = unittest.TestSuite()
     loader = unittest.TestLoader()
     
@@ -0,0 +1,30 @@
+# built-in packages
+import json
+import unittest
+
+# internal packages
+from src.config import test_env
+from benchmarks.dataset import DATASET_SIZES
+from benchmarks.run_benchmarks import run_suite
+
+
+class TestBenchmarks(unittest.TestCase):
+    # ---Tests for run_suite---
+
+    def test_run_suite_report(self):
+        """
+        Positive test: the tiny dataset is seeded and every benchmark reports JSON-serializable timings.
+        """
+        report = run_suite(test_env, DATASET_SIZES["tiny"], repeat=2)
+        json.dumps(report)
+
+        self.assertEqual(report["dataset"]["rows"]["likes"], DATASET_SIZES["tiny"].likes)
+        self.assertGreaterEqual(report["dataset"]["rows"]["vacations"], DATASET_SIZES["tiny"].vacations)
+        names = [result["name"] for result in report["results"]]
+        self.assertIn("VacationDAO.get_all_vacations", names)
+        self.assertIn("UserService.login", names)
+        for result in report["results"]:
+            self.assertLessEqual(result["min_ms"], result["median_ms"])
+            self.assertLessEqual(result["median_ms"], result["max_ms"])
+
+#
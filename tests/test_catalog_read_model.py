@@ -0,0 +1,95 @@
+# built-in packages
+import unittest
+from datetime import date, timedelta
+
+# internal packages
+from src.config import test_env
+from src.dal.database import initialize_database
+from src.dal.cache import dao_cache
+from src.dal.catalog_read_model import catalog_read_models
+from src.dal.country_dao import CountryDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.vacation_dao import VacationDAO
+from src.dal.instrumentation import collect_query_stats
+from src.dal.unit_of_work import unit_of_work
+from src.services.vacation_service import VacationService
+
+
+class TestCatalogReadModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_database(env=test_env)
+
+    def setUp(self):
+        catalog_read_models.clear()
+        self.model = catalog_read_models.refresh(test_env)
+
+    def tearDown(self):
+        catalog_read_models.clear()
+
+    def _ids(self, vacations):
+        return [vacation.vacation_id for vacation in vacations]
+
+    # ---Tests for the catalog read model---
+
+    def test_pages_read_without_queries(self):
+        """
+        Positive test: while the model is up to date, the vacation pages are read without any query, in the database order.
+        """
+        dao_cache.clear()
+        catalog_read_models.refresh(test_env)
+        expected = VacationDAO(env=test_env).get_vacations_page(limit=6)
+
+        with collect_query_stats() as stats:
+            first_page, cursor = VacationService(env=test_env).get_vacations_page(page_size=3)
+            second_page, _ = VacationService(env=test_env).get_vacations_page(cursor=cursor, page_size=3)
+
+        self.assertEqual(stats.statements, 0)
+        self.assertEqual(self._ids(first_page + second_page), self._ids(expected))
+
+    def test_indexes_match_database(self):
+        """
+        Positive test: the lookups by id, by country and by start date return what the DAO returns.
+        """
+        vacations = VacationDAO(env=test_env).get_all_vacations()
+        vacation = vacations[0]
+        from_date, to_date = date.today(), date.today() + timedelta(days=365)
+
+        self.assertEqual(self.model.get_vacation_by_id(vacation.vacation_id), vacation)
+        self.assertIsNone(self.model.get_vacation_by_id(-1))
+        self.assertEqual(self._ids(self.model.get_vacations_by_country(vacation.country_id)),
+                         self._ids(v for v in vacations if v.country_id == vacation.country_id))
+        self.assertEqual(self._ids(self.model.get_vacations_starting_between(from_date, to_date, limit=5)),
+                         self._ids(VacationDAO(env=test_env).get_vacations_starting_between(from_date, to_date, limit=5)))
+        self.assertEqual(self.model.get_all_countries(), CountryDAO(env=test_env).get_all_countries())
+
+    def test_like_refreshes_only_likes_counts(self):
+        """
+        Positive test: after a like the model is not served until it is refreshed, and the refresh only re-reads the likes counts.
+        """
+        vacation = self.model.get_all_vacations()[0]
+        stats_before = catalog_read_models.get_stats()
+        liked, likes_count = LikeDAO(env=test_env).toggle_like(user_id=1, vacation_id=vacation.vacation_id)
+        try:
+            self.assertIsNone(catalog_read_models.current(test_env))
+            model = catalog_read_models.refresh(test_env)
+            stats = catalog_read_models.get_stats()
+
+            self.assertEqual(model.get_vacation_by_id(vacation.vacation_id).likes_count, likes_count)
+            self.assertEqual(stats["full_builds"], stats_before["full_builds"])
+            self.assertGreater(stats["likes_refreshes"], stats_before["likes_refreshes"])
+            self.assertIs(catalog_read_models.current(test_env), model)
+        finally:
+            LikeDAO(env=test_env).toggle_like(user_id=1, vacation_id=vacation.vacation_id, liked=not liked)
+
+    def test_not_served_inside_writing_transaction(self):
+        """
+        Negative test: a unit of work that wrote to the catalog reads the database (its own uncommitted writes), not the model.
+        """
+        vacation = self.model.get_all_vacations()[0]
+        with unit_of_work(env=test_env):
+            LikeDAO(env=test_env).toggle_like(user_id=1, vacation_id=vacation.vacation_id)
+            self.assertIsNone(catalog_read_models.current(test_env))
+            LikeDAO(env=test_env).toggle_like(user_id=1, vacation_id=vacation.vacation_id)
+
+#
@@ -0,0 +1,87 @@
+# built-in packages
+import unittest
+from unittest import mock
+
+# internal packages
+from src.config import test_env
+from src.dal.database import initialize_database
+from src.dal.home_page_dao import HomePageDAO
+from src.dal.vacation_dao import VacationDAO
+from src.dal.catalog_read_model import catalog_read_models
+from src.dal.instrumentation import collect_query_stats
+from src.dal.latency_budget import LatencyBudgetExceeded
+from src.services.catalog_snapshot import catalog_snapshots, start_stale_tracking, end_stale_tracking, served_stale_age
+from src.services.vacation_service import VacationService
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_database(env=test_env)
+
+    def setUp(self):
+        catalog_snapshots.clear()
+        self.stale_token = start_stale_tracking()
+        # the catalog is read from the database, not from the in-memory read model
+        read_model = mock.patch.object(catalog_read_models, "current", return_value=None)
+        read_model.start()
+        self.addCleanup(read_model.stop)
+
+    def tearDown(self):
+        end_stale_tracking(self.stale_token)
+        catalog_snapshots.clear()
+
+    def _database_down(self):
+        return mock.patch.object(HomePageDAO, "get_home_page_data", side_effect=LatencyBudgetExceeded("test", "deadline"))
+
+    # ---Tests for the serve-stale fallback---
+
+    def test_home_page_served_from_snapshot(self):
+        """
+        Positive test: a failed home page read is answered from the snapshot, without the user's likes, marked stale.
+        """
+        snapshot = catalog_snapshots.refresh(test_env)
+        with self._database_down():
+            page = VacationService(env=test_env).get_home_page(user_id=1, page_size=3)
+
+        self.assertEqual([vacation.vacation_id for vacation in page.vacations], [vacation.vacation_id for vacation in snapshot.vacations[:3]])
+        self.assertEqual(page.countries, snapshot.countries)
+        self.assertEqual(page.liked_vacations, [])
+        self.assertIsNotNone(page.next_cursor)
+        self.assertIsNotNone(served_stale_age())
+
+    def test_reads_skip_database_during_cooldown(self):
+        """
+        Positive test: after a failed read, the next pages come from the snapshot without any query, in the same order.
+        """
+        catalog_snapshots.refresh(test_env)
+        expected = VacationDAO(env=test_env).get_vacations_page(limit=6)
+        with self._database_down():
+            first_page = VacationService(env=test_env).get_home_page(user_id=1, page_size=3)
+
+        with collect_query_stats() as stats:
+            second_page, _ = VacationService(env=test_env).get_vacations_page(cursor=first_page.next_cursor, page_size=3)
+
+        self.assertEqual(stats.statements, 0)
+        self.assertEqual([vacation.vacation_id for vacation in first_page.vacations + second_page],
+                         [vacation.vacation_id for vacation in expected])
+
+    def test_failure_without_snapshot_raises(self):
+        """
+        Negative test: with no snapshot taken yet, the failure of the read is raised.
+        """
+        with self._database_down(), self.assertRaises(LatencyBudgetExceeded):
+            VacationService(env=test_env).get_home_page(user_id=1)
+
+        self.assertIsNone(served_stale_age())
+
+    def test_fresh_reads_not_marked_stale(self):
+        """
+        Negative test: with the database up, the pages are read from it and not marked stale.
+        """
+        catalog_snapshots.refresh(test_env)
+        VacationService(env=test_env).get_home_page(user_id=1)
+
+        self.assertIsNone(served_stale_age())
+
+#
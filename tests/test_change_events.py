@@ -0,0 +1,103 @@
+# built-in packages
+import time
+import unittest
+
+# internal packages
+from src.config import test_env, dev_db_conn_info
+from src.dal.database import initialize_database, get_db_pool
+from src.dal.cache import dao_cache
+from src.dal.change_events import change_listener, application_name, CHANGED_TABLES
+from src.dal.vacation_dao import VacationDAO
+
+# external packages
+import psycopg as pg
+
+
+class TestChangeEvents(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_database(env=test_env)
+
+    def setUp(self):
+        # a connection of another process: its writes are not seen by this process's DAOs
+        self.other_process = pg.connect(dev_db_conn_info, autocommit=True)
+
+    def tearDown(self):
+        self.other_process.close()
+
+    def _versions(self, *tables):
+        return dao_cache.table_versions(test_env, tables)
+
+    def _wait_until(self, condition, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    # ---Tests for the change listener---
+
+    def test_other_process_write_invalidates_cache(self):
+        """
+        Positive test: a write committed by another process invalidates the table in this process's DAO cache.
+        """
+        countries_version = self._versions("countries")
+        self.other_process.execute("UPDATE countries SET country_name = country_name WHERE country_id = 1")
+
+        self.assertTrue(self._wait_until(lambda: self._versions("countries") != countries_version))
+
+    def test_like_does_not_invalidate_vacations(self):
+        """
+        Positive test: a like of another process invalidates the likes, not the vacations (whose likes_count a trigger updates).
+        """
+        vacation_id = VacationDAO(env=test_env).get_vacations_page(limit=1)[0].vacation_id
+        likes_version, vacations_version = self._versions("likes"), self._versions("vacations")
+        with self.other_process.transaction():
+            self.other_process.execute("INSERT INTO likes (user_id, vacation_id) VALUES (1, %s) ON CONFLICT DO NOTHING", (vacation_id,))
+            self.other_process.execute("DELETE FROM likes WHERE user_id = 1 AND vacation_id = %s", (vacation_id,))
+
+        self.assertTrue(self._wait_until(lambda: self._versions("likes") != likes_version))
+        self.assertEqual(self._versions("vacations"), vacations_version)
+
+    def test_own_writes_skipped(self):
+        """
+        Negative test: the notification of this process's own write does not invalidate the cache a second time.
+        """
+        countries_version, roles_version = self._versions("countries"), self._versions("roles")
+        with get_db_pool(test_env).connection() as conn:
+            conn.execute("UPDATE countries SET country_name = country_name WHERE country_id = 1")
+        # notifications are delivered in commit order: once this one is applied, the one before was handled
+        self.other_process.execute("UPDATE roles SET role_name = role_name WHERE role_id = 1")
+
+        self.assertTrue(self._wait_until(lambda: self._versions("roles") != roles_version))
+        self.assertEqual(self._versions("countries"), countries_version)
+
+    def test_write_without_changed_rows_not_announced(self):
+        """
+        Negative test: a statement of another process that changes no row (a missing like removed, a conflicting insert skipped) invalidates nothing.
+        """
+        likes_version, roles_version = self._versions("likes"), self._versions("roles")
+        self.other_process.execute("DELETE FROM likes WHERE user_id = -1")
+        self.other_process.execute("INSERT INTO roles (role_id, role_name) VALUES (1, 'Admin') ON CONFLICT DO NOTHING")
+        # notifications are delivered in commit order: once this one is applied, the ones before were handled
+        self.other_process.execute("UPDATE roles SET role_name = role_name WHERE role_id = 1")
+
+        self.assertTrue(self._wait_until(lambda: self._versions("roles") != roles_version))
+        self.assertEqual(self._versions("roles"), (roles_version[0] + 1,))
+        self.assertEqual(self._versions("likes"), likes_version)
+
+    def test_lost_connection_invalidates_all_tables(self):
+        """
+        Negative test: when the listening connection is lost, every table is invalidated once it is re-opened.
+        """
+        get_db_pool(test_env)
+        versions = self._versions(*CHANGED_TABLES)
+        reconnects = change_listener.get_stats()["reconnects"]
+        self.other_process.execute("""SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+                                      WHERE application_name = %s AND query LIKE 'LISTEN %%'""", (application_name(),))
+
+        self.assertTrue(self._wait_until(lambda: change_listener.get_stats()["reconnects"] > reconnects))
+        self.assertTrue(all(new > old for new, old in zip(self._versions(*CHANGED_TABLES), versions)))
+
+#
@@ -0,0 +1,84 @@
+# built-in packages
+import time
+import unittest
+
+# internal packages
+from src.config import test_env
+from src.dal.cache import DAOCache, dao_cache
+from src.dal.country_dao import CountryDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.database import initialize_database
+
+
+class TestDAOCache(unittest.TestCase):
+    def setUp(self):
+        initialize_database(env=test_env)
+
+    # ---Tests for DAOCache class---
+
+    def test_lru_eviction(self):
+        """
+        Positive test: the least recently used entry is evicted when the cache is full.
+        """
+        cache = DAOCache(max_entries=2, ttl=60)
+        cache.set("a", 1, ())
+        cache.set("b", 2, ())
+        cache.get("a", test_env, ())
+        cache.set("c", 3, ())
+        self.assertEqual(cache.get("a", test_env, ()), (True, 1))
+        self.assertEqual(cache.get("b", test_env, ()), (False, None))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """
+        Positive test: an expired entry is a miss.
+        """
+        cache = DAOCache(max_entries=10, ttl=0.01)
+        cache.set("a", 1, ())
+        time.sleep(0.02)
+        self.assertEqual(cache.get("a", test_env, ()), (False, None))
+
+    def test_table_invalidation(self):
+        """
+        Positive test: writing a table invalidates entries read from it only.
+        """
+        cache = DAOCache(max_entries=10, ttl=60)
+        cache.set("countries", 1, cache.table_versions(test_env, ("countries",)))
+        cache.set("roles", 2, cache.table_versions(test_env, ("roles",)))
+        cache.invalidate(test_env, "countries")
+        self.assertEqual(cache.get("countries", test_env, ("countries",)), (False, None))
+        self.assertEqual(cache.get("roles", test_env, ("roles",)), (True, 2))
+
+    # ---Tests for cached DAO reads---
+
+    def test_cached_read_hit(self):
+        """
+        Positive test: repeated reads are served from the cache.
+        """
+        CountryDAO(env=test_env).get_all_countries()
+        hits_before = dao_cache.get_stats()["hits"]
+        countries = CountryDAO(env=test_env).get_all_countries()
+        self.assertEqual(dao_cache.get_stats()["hits"], hits_before + 1)
+        self.assertEqual(len(countries), 14)
+
+    def test_cached_read_invalidated_by_write(self):
+        """
+        Positive test: a write through the DAO is visible to the next read.
+        """
+        CountryDAO(env=test_env).get_all_countries()
+        CountryDAO(env=test_env).add_country("קנדה")
+        countries = CountryDAO(env=test_env).get_all_countries()
+        self.assertIn("קנדה", [country.country_name for country in countries])
+
+    def test_scope_version_bumped_by_write(self):
+        """
+        Positive test: a like bumps the likes version of its user only (and the likes table version).
+        """
+        user_version, other_version = dao_cache.scope_version(test_env, "likes", 1), dao_cache.scope_version(test_env, "likes", 2)
+        table_version = dao_cache.table_versions(test_env, ("likes",))[0]
+        LikeDAO(env=test_env).add_like(1, 1)
+        self.assertEqual(dao_cache.scope_version(test_env, "likes", 1), user_version + 1)
+        self.assertEqual(dao_cache.scope_version(test_env, "likes", 2), other_version)
+        self.assertEqual(dao_cache.table_versions(test_env, ("likes",))[0], table_version + 1)
+
+#
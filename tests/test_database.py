@@ -0,0 +1,65 @@
+# built-in packages
+import os
+import unittest
+
+# internal packages
+from src.api import create_app, warm_up_templates
+from src.config import test_env
+from src.dal import database
+from src.dal.database import get_db_pool, close_pools
+
+
+class TestDatabase(unittest.TestCase):
+
+    # ---Tests for get_db_pool---
+
+    def test_pool_opened_on_first_use(self):
+        """
+        Positive test: no pool exists until the environment is queried, then the same pool is reused.
+        """
+        close_pools()
+        self.assertEqual(database._pools, {})
+
+        pool = get_db_pool(test_env)
+        self.assertIs(get_db_pool(test_env), pool)
+        with pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT 1").fetchone()[0], 1)
+
+    def test_forked_child_opens_own_pool(self):
+        """
+        Positive test: a forked worker does not reuse the parent's pool, it opens (and closes) its own connections.
+        """
+        parent_pool = get_db_pool(test_env)
+        with parent_pool.connection() as conn:
+            conn.execute("SELECT 1")
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                child_pool = get_db_pool(test_env)
+                with child_pool.connection() as conn:
+                    if child_pool is not parent_pool and conn.execute("SELECT 1").fetchone()[0] == 1:
+                        exit_code = 0
+                close_pools()
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        with parent_pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT 1").fetchone()[0], 1)
+
+    # ---Tests for warm_up_templates---
+
+    def test_warm_up_templates(self):
+        """
+        Positive test: every html template is compiled before the workers are forked.
+        """
+        app = create_app()
+        compiled = warm_up_templates(app)
+
+        self.assertEqual(compiled, len(app.jinja_env.list_templates(extensions=["html"])))
+        self.assertGreaterEqual(len(app.jinja_env.cache), compiled)
+
+#
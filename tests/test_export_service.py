@@ -0,0 +1,64 @@
+# built-in packages
+import csv
+import io
+import json
+import unittest
+
+# internal packages
+from src.config import test_env
+from src.dal.database import initialize_database
+from src.dal.like_dao import LikeDAO
+from src.dal.user_dao import UserDAO
+from src.dal.vacation_dao import VacationDAO
+from src.services.export_service import ExportService
+from src.services import errors
+
+
+class TestExportService(unittest.TestCase):
+    def setUp(self):
+        initialize_database(env=test_env)
+        self.export_service = ExportService(env=test_env)
+
+    # ---Tests for export_rows method---
+
+    def test_export_ndjson_in_chunks(self):
+        """
+        Positive test: all the vacations are exported as NDJSON, one chunk per fetch_size rows.
+        """
+        chunks = list(self.export_service.export_rows("vacations", "ndjson", fetch_size=2))
+        rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+        vacations = VacationDAO(env=test_env).get_all_vacations()
+
+        self.assertEqual(sorted(row["vacation_id"] for row in rows), sorted(vacation.vacation_id for vacation in vacations))
+        self.assertTrue(all(len(chunk.splitlines()) <= 2 for chunk in chunks))
+        self.assertEqual(len(chunks), (len(vacations) + 1) // 2)
+
+    def test_export_csv(self):
+        """
+        Positive test: the likes are exported as CSV with a header row.
+        """
+        LikeDAO(env=test_env).add_like(1, 1)
+        rows = list(csv.DictReader(io.StringIO("".join(self.export_service.export_rows("likes", "csv")))))
+        self.assertEqual(len(rows), len(LikeDAO(env=test_env).get_all_likes()))
+        self.assertEqual(set(rows[0]), {"like_id", "user_id", "vacation_id"})
+
+    def test_export_users_without_password(self):
+        """
+        Positive test: the users are exported without their password hash.
+        """
+        rows = [json.loads(line) for chunk in self.export_service.export_rows("users") for line in chunk.splitlines()]
+        self.assertEqual(len(rows), len(UserDAO(env=test_env).get_all_users()))
+        self.assertTrue(all("hashed_password" not in row for row in rows))
+
+    def test_export_invalid_input(self):
+        """
+        Negative test: an unknown entity, format or fetch size is rejected before anything is read.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.export_service.export_rows("countries")
+        with self.assertRaises(errors.InvalidInputError):
+            self.export_service.export_rows("vacations", "xml")
+        with self.assertRaises(errors.InvalidInputError):
+            self.export_service.export_rows("vacations", "csv", fetch_size=0)
+
+#
@@ -0,0 +1,53 @@
+# built-in packages
+import random
+import unittest
+
+# internal packages
+from src.config import test_env
+from src.dal.database import get_db_pool
+from src.jobs.generate_synthetic_data import generate_synthetic_data, _zipf_like_counts
+from src.services.user_service import UserService
+
+
+class TestGenerateSyntheticData(unittest.TestCase):
+    def _snapshot(self):
+        with get_db_pool(test_env).connection() as conn:
+            return conn.execute("""SELECT (SELECT COUNT(*) FROM likes), (SELECT SUM(likes_count) FROM vacations),
+                                          (SELECT string_agg(vacation_info || price, ',' ORDER BY vacation_id) FROM vacations),
+                                          (SELECT string_agg(user_id || ':' || vacation_id, ',' ORDER BY like_id) FROM likes)""").fetchone()
+
+    # ---Tests for generate_synthetic_data---
+
+    def test_generate_deterministic(self):
+        """
+        Positive test: the requested rows are loaded, likes_count matches the likes and the same seed gives the same data.
+        """
+        row_counts = generate_synthetic_data(env=test_env, vacations=50, users=40, likes=500, seed=7)
+        self.assertEqual(row_counts["likes"], 500)
+        first = self._snapshot()
+        self.assertEqual(first[0], 500)
+        self.assertEqual(first[1], 500)
+
+        generate_synthetic_data(env=test_env, vacations=50, users=40, likes=500, seed=7)
+        self.assertEqual(self._snapshot(), first)
+        self.assertIsNotNone(UserService(env=test_env).login("admin@gmail.com", "1234"))
+
+    def test_generate_too_many_likes(self):
+        """
+        Negative test: more likes than distinct (user, vacation) pairs are rejected.
+        """
+        with self.assertRaises(ValueError):
+            generate_synthetic_data(env=test_env, vacations=2, users=2, likes=5)
+
+    # ---Tests for _zipf_like_counts---
+
+    def test_zipf_like_counts_skewed(self):
+        """
+        Positive test: likes add up, respect the per-vacation cap and are concentrated on few vacations.
+        """
+        counts = _zipf_like_counts(total_likes=10_000, vacations=100, users=1_000, exponent=1.1, rng=random.Random(1))
+        self.assertEqual(sum(counts), 10_000)
+        self.assertLessEqual(max(counts), 1_000)
+        self.assertGreater(sum(sorted(counts, reverse=True)[:20]), sum(counts) / 2)
+
+#
@@ -0,0 +1,77 @@
+# built-in packages
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+# internal packages
+from src.config import IMAGE_VARIANTS
+from src.services.image_service import ImageService
+from src.services import errors
+
+# external packages
+from PIL import Image
+
+
+class TestImageService(unittest.TestCase):
+    def setUp(self):
+        self.upload_dir = tempfile.TemporaryDirectory()
+        self.image_service = ImageService(upload_folder=self.upload_dir.name)
+
+    def tearDown(self):
+        self.upload_dir.cleanup()
+
+    def create_image(self, width: int, height: int) -> BytesIO:
+        exif = Image.Exif()
+        exif[0x010F] = "Test Camera"  # Make
+        image_bytes = BytesIO()
+        Image.new("RGB", (width, height), "orange").save(image_bytes, "JPEG", exif=exif)
+        image_bytes.seek(0)
+        return image_bytes
+
+    # ---Tests for save vacation image function---
+
+    def test_save_vacation_image_variants(self):
+        """
+        Positive test: every variant is saved as WebP, resized to its max width with the aspect ratio kept.
+        """
+        photo_file_path, variants = self.image_service.save_vacation_image(self.create_image(3000, 1500))
+        self.assertEqual(set(variants), set(IMAGE_VARIANTS))
+        self.assertEqual(photo_file_path, variants["original"]["file"])
+        for variant_name, max_width in IMAGE_VARIANTS.items():
+            variant = variants[variant_name]
+            self.assertEqual(variant["width"], min(max_width, 3000))
+            self.assertEqual(variant["height"], variant["width"] // 2)
+            with Image.open(os.path.join(self.upload_dir.name, variant["file"])) as saved:
+                self.assertEqual(saved.format, "WEBP")
+                self.assertEqual(saved.size, (variant["width"], variant["height"]))
+                self.assertEqual(len(saved.getexif()), 0)
+
+    def test_save_vacation_image_no_upscale(self):
+        """
+        Positive test: small images are not upscaled.
+        """
+        _, variants = self.image_service.save_vacation_image(self.create_image(300, 200))
+        self.assertEqual((variants["original"]["width"], variants["original"]["height"]), (300, 200))
+
+    def test_save_vacation_image_deduplicated(self):
+        """
+        Positive test: identical uploads are stored once under the same content hash.
+        """
+        photo_file_path, variants = self.image_service.save_vacation_image(self.create_image(600, 400))
+        self.assertRegex(photo_file_path, r"^[0-9a-f]{32}_original\.webp$")
+        modified_at = os.path.getmtime(os.path.join(self.upload_dir.name, photo_file_path))
+
+        same_path, same_variants = self.image_service.save_vacation_image(self.create_image(600, 400))
+        self.assertEqual((same_path, same_variants), (photo_file_path, variants))
+        self.assertEqual(os.path.getmtime(os.path.join(self.upload_dir.name, photo_file_path)), modified_at)
+        self.assertEqual(len(os.listdir(self.upload_dir.name)), len(IMAGE_VARIANTS))
+
+    def test_save_vacation_image_invalid(self):
+        """
+        Negative test: a file that is not an image.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.image_service.save_vacation_image(BytesIO(b"dummy image data"))
+
+#
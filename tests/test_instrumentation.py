@@ -0,0 +1,103 @@
+# built-in packages
+import json
+import unittest
+from unittest import mock
+
+# internal packages
+from src.config import test_env
+from src.api import create_app
+from src.dal import instrumentation
+from src.dal.country_dao import CountryDAO
+from src.dal.vacation_dao import VacationDAO
+from src.dal.database import initialize_database, get_db_pool
+from src.dal.instrumentation import collect_query_stats
+
+
+class TestInstrumentation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_database(env=test_env)
+        cls.app = create_app()
+        cls.app.config["TESTING"] = True
+        cls.client = cls.app.test_client()
+
+    # ---Tests for collect_query_stats---
+
+    def test_collect_query_stats(self):
+        """
+        Positive test: statements run inside the block are counted with their rows and time.
+        """
+        with collect_query_stats("test") as stats:
+            with get_db_pool(test_env).connection() as conn:
+                conn.execute("SELECT generate_series(1, 5)")
+                conn.execute("SELECT 1")
+
+        self.assertEqual(stats.statements, 2)
+        self.assertEqual(stats.rows, 6)
+        self.assertGreater(stats.db_ms, 0)
+
+    def test_no_stats_outside_block(self):
+        """
+        Negative test: statements run outside a request are not collected.
+        """
+        CountryDAO(env=test_env).get_all_countries()
+        self.assertIsNone(instrumentation.get_query_stats())
+
+    def test_server_side_cursor_recorded(self):
+        """
+        Positive test: a streamed export is recorded - its DECLARE and every FETCH round trip with the rows it returned.
+        """
+        vacations_count = len(VacationDAO(env=test_env).get_all_vacations())
+        with collect_query_stats("test") as stats:
+            exported = list(VacationDAO(env=test_env).iter_all_vacations(fetch_size=2))
+
+        self.assertEqual(len(exported), vacations_count)
+        self.assertEqual(stats.rows, vacations_count)
+        self.assertEqual(stats.statements, 1 + vacations_count // 2 + 1)
+        self.assertGreater(stats.db_ms, 0)
+
+    def test_copy_recorded(self):
+        """
+        Positive test: a COPY is recorded once it ends, with the rows it copied.
+        """
+        with collect_query_stats("test") as stats:
+            with get_db_pool(test_env).connection() as conn, conn.cursor() as cur:
+                cur.execute("CREATE TEMP TABLE copied (n INT) ON COMMIT DROP")
+                with cur.copy("COPY copied (n) FROM STDIN") as copy:
+                    for n in range(3):
+                        copy.write_row((n,))
+
+        self.assertEqual(stats.statements, 2)
+        self.assertEqual(stats.rows, 3)
+
+    # ---Tests for the slow-query log---
+
+    def test_slow_query_logged(self):
+        """
+        Positive test: a statement over the threshold is logged as JSON with its route, without parameters.
+        """
+        with mock.patch.object(instrumentation, "slow_query_threshold_ms", 0), \
+             self.assertLogs(instrumentation.slow_query_logger, level="WARNING") as logs, \
+             collect_query_stats("GET /test"):
+            with get_db_pool(test_env).connection() as conn:
+                conn.execute("SELECT %s::text", ("secret",))
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["route"], "GET /test")
+        self.assertIn("SELECT", record["statement"])
+        self.assertNotIn("secret", record["statement"])
+
+    # ---Tests for the Server-Timing header---
+
+    def test_server_timing_header(self):
+        """
+        Positive test: a rendered page reports its DB and render time.
+        """
+        res = self.client.get(f"/{test_env}/login")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("db;dur=", res.headers["Server-Timing"])
+        self.assertIn("total;dur=", res.headers["Server-Timing"])
+        render_ms = float(res.headers["Server-Timing"].split("render;dur=")[1].split(",")[0])
+        self.assertGreater(render_ms, 0)
+
+#
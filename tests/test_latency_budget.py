@@ -0,0 +1,96 @@
+# built-in packages
+import threading
+import time
+import unittest
+from unittest import mock
+
+# internal packages
+from src.config import test_env
+from src.dal.database import get_db_pool
+from src.dal.instrumentation import collect_query_stats
+from src.dal.latency_budget import LatencyBudgetExceeded, latency_budget, budget_stats, statement_watchdog
+from src.dal.unit_of_work import get_connection
+
+
+class TestLatencyBudget(unittest.TestCase):
+    def setUp(self):
+        budget_stats.clear()
+
+    # ---Tests for latency_budget---
+
+    def test_statement_cancelled_at_deadline(self):
+        """
+        Positive test: a statement still running at the budget deadline is cancelled and the violation is counted.
+        """
+        started = time.perf_counter()
+        with self.assertRaises(LatencyBudgetExceeded) as raised:
+            with latency_budget("test", 200), get_connection(test_env) as conn:
+                conn.execute("SELECT pg_sleep(5)")
+
+        self.assertLess(time.perf_counter() - started, 2)
+        self.assertEqual(raised.exception.reason, "deadline")
+        self.assertEqual(budget_stats.get_stats()["violations"], {"test": {"deadline": 1}})
+
+    def test_slow_cancel_does_not_block_other_statements(self):
+        """
+        Positive test: while a cancel request waits for the server, the other statements still register and unregister at once.
+        """
+        cancel_started, release_cancel = threading.Event(), threading.Event()
+        slow_conn = mock.Mock(cancel_safe=mock.Mock(side_effect=lambda timeout: (cancel_started.set(), release_cancel.wait(2))))
+        expired = statement_watchdog.watch(slow_conn, "test", time.monotonic())
+        try:
+            self.assertTrue(cancel_started.wait(2))
+            started = time.perf_counter()
+            statement_watchdog.unwatch(statement_watchdog.watch(mock.Mock(), "test", time.monotonic() + 60))
+            self.assertLess(time.perf_counter() - started, 0.1)
+        finally:
+            release_cancel.set()
+            statement_watchdog.unwatch(expired)
+
+        self.assertTrue(expired.cancelled)
+
+    def test_spent_budget_sends_no_statement(self):
+        """
+        Negative test: once the budget is spent, no connection is checked out and no statement is sent.
+        """
+        with collect_query_stats() as stats, self.assertRaises(LatencyBudgetExceeded):
+            with latency_budget("test", 0), get_connection(test_env) as conn:
+                conn.execute("SELECT 1")
+
+        self.assertEqual(stats.statements, 0)
+
+    def test_nested_budget_only_tightens(self):
+        """
+        Negative test: an inner budget longer than the outer one does not extend the outer deadline.
+        """
+        with self.assertRaises(LatencyBudgetExceeded) as raised:
+            with latency_budget("outer", 200), latency_budget("inner", 10_000), get_connection(test_env) as conn:
+                conn.execute("SELECT pg_sleep(5)")
+
+        self.assertEqual(raised.exception.budget, "outer")
+
+    # ---Tests for the server-side timeouts---
+
+    def test_server_timeouts_set_on_pooled_connections(self):
+        """
+        Positive test: pooled connections are bounded by statement_timeout and lock_timeout.
+        """
+        with get_db_pool(test_env).connection() as conn:
+            self.assertNotEqual(conn.execute("SHOW statement_timeout").fetchone()[0], "0")
+            self.assertNotEqual(conn.execute("SHOW lock_timeout").fetchone()[0], "0")
+
+    def test_lock_timeout_raises_budget_exceeded(self):
+        """
+        Negative test: a lock wait stopped by lock_timeout raises LatencyBudgetExceeded.
+        """
+        with get_db_pool(test_env).connection() as locker:
+            locker.execute("SELECT 1 FROM countries WHERE country_id = 1 FOR UPDATE")
+            with self.assertRaises(LatencyBudgetExceeded) as raised:
+                with get_connection(test_env) as conn:
+                    conn.execute("SET LOCAL lock_timeout = 100")
+                    conn.execute("UPDATE countries SET country_name = country_name WHERE country_id = 1")
+            locker.rollback()
+
+        self.assertEqual(raised.exception.reason, "lock_timeout")
+
+#
@@ -0,0 +1,63 @@
+# built-in packages
+import tempfile
+import unittest
+from io import BytesIO
+
+# internal packages
+from src.api import create_app
+from src.services.image_service import ImageService
+
+# external packages
+from PIL import Image
+
+
+class TestMediaApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app()
+        cls.app.config["TESTING"] = True
+        cls.upload_dir = tempfile.TemporaryDirectory()
+        cls.app.config["UPLOAD_FOLDER"] = cls.upload_dir.name
+        cls.client = cls.app.test_client()
+
+        image_bytes = BytesIO()
+        Image.new("RGB", (640, 480), "green").save(image_bytes, "JPEG")
+        image_bytes.seek(0)
+        cls.photo_file_path, _ = ImageService(upload_folder=cls.upload_dir.name).save_vacation_image(image_bytes)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.upload_dir.cleanup()
+
+
+    # --- Tests for vacation_image route ---
+
+    def test_vacation_image_immutable_positive(self):
+        """
+        positive test: content-addressed photo is served as immutable with a strong ETag.
+        """
+        res = self.client.get(f"/media/vacation-images/{self.photo_file_path}")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, "image/webp")
+        self.assertIn("immutable", res.headers["Cache-Control"])
+        self.assertIn("max-age=31536000", res.headers["Cache-Control"])
+        self.assertEqual(res.headers["ETag"], f'"{self.photo_file_path.removesuffix(".webp")}"')
+
+
+    def test_vacation_image_not_modified_positive(self):
+        """
+        positive test: matching If-None-Match returns 304.
+        """
+        etag = self.client.get(f"/media/vacation-images/{self.photo_file_path}").headers["ETag"]
+        res = self.client.get(f"/media/vacation-images/{self.photo_file_path}", headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, 304)
+
+
+    def test_vacation_image_negative(self):
+        """
+        negative test: missing photo returns 404.
+        """
+        res = self.client.get("/media/vacation-images/missing.jpg")
+        self.assertEqual(res.status_code, 404)
+
+#
@@ -0,0 +1,94 @@
+# built-in packages
+import unittest
+
+# internal packages
+from src.config import test_env
+from src.dal.database import initialize_database, get_db_pool
+from src.dal.migrate import migrate_database, get_migration_status, get_migrations, _split_statements
+from src.dal.vacation_dao import SEARCH_VECTOR
+
+# external packages
+from psycopg.errors import CheckViolation, NotNullViolation
+from psycopg.sql import SQL
+
+
+class TestMigrate(unittest.TestCase):
+    def setUp(self):
+        initialize_database(env=test_env)
+
+    # ---Tests for migrate database function---
+
+    def test_all_migrations_applied(self):
+        """
+        Positive test: a freshly initialized database has every migration applied.
+        """
+        status = get_migration_status(env=test_env)
+        self.assertEqual(len(status), len(get_migrations()))
+        self.assertTrue(all(is_applied for _, is_applied in status))
+
+    def test_migrate_up_to_date(self):
+        """
+        Positive test: migrating an up to date database applies nothing.
+        """
+        self.assertEqual(migrate_database(env=test_env), [])
+
+    def test_vacation_dates_order_fixed_before_range_index(self):
+        """
+        Positive test: a vacation ending before it starts gets its dates swapped, so the date range index is built (and valid).
+        """
+        with get_db_pool(test_env).connection() as conn:
+            conn.execute("DROP INDEX vacations_date_range_idx")
+            conn.execute("ALTER TABLE vacations DROP CONSTRAINT vacations_dates_order_check")
+            conn.execute("UPDATE vacations SET vacation_end_date = vacation_start_date - 1 WHERE vacation_id = 1")
+            conn.execute("DELETE FROM schema_migrations WHERE version IN (7, 8)")
+
+        self.assertEqual([migration.version for migration in migrate_database(env=test_env)], [7, 8])
+        with get_db_pool(test_env).connection() as conn:
+            start, end = conn.execute("SELECT vacation_start_date, vacation_end_date FROM vacations WHERE vacation_id = 1").fetchone()
+            index_valid = conn.execute("SELECT indisvalid FROM pg_index WHERE indexrelid = 'vacations_date_range_idx'::regclass").fetchone()[0]
+        self.assertEqual((end - start).days, 1)
+        self.assertTrue(index_valid)
+        with self.assertRaises(CheckViolation), get_db_pool(test_env).connection() as conn:
+            conn.execute("UPDATE vacations SET vacation_end_date = vacation_start_date - 1 WHERE vacation_id = 1")
+
+    def test_vacation_dates_made_not_null(self):
+        """
+        Positive test: a vacation missing one date takes the other, one without dates is removed, and dates are then required.
+        """
+        with get_db_pool(test_env).connection() as conn:
+            conn.execute("""ALTER TABLE vacations ALTER COLUMN vacation_start_date DROP NOT NULL,
+                                                  ALTER COLUMN vacation_end_date DROP NOT NULL""")
+            end = conn.execute("UPDATE vacations SET vacation_start_date = NULL WHERE vacation_id = 1 RETURNING vacation_end_date").fetchone()[0]
+            conn.execute("UPDATE vacations SET vacation_start_date = NULL, vacation_end_date = NULL WHERE vacation_id = 2")
+            conn.execute("DELETE FROM schema_migrations WHERE version = 10")
+
+        self.assertEqual([migration.version for migration in migrate_database(env=test_env)], [10])
+        with get_db_pool(test_env).connection() as conn:
+            self.assertEqual(conn.execute("SELECT vacation_start_date FROM vacations WHERE vacation_id = 1").fetchone()[0], end)
+            self.assertIsNone(conn.execute("SELECT 1 FROM vacations WHERE vacation_id = 2").fetchone())
+        with self.assertRaises(NotNullViolation), get_db_pool(test_env).connection() as conn:
+            conn.execute("UPDATE vacations SET vacation_start_date = NULL WHERE vacation_id = 1")
+
+    def test_search_index_on_expression(self):
+        """
+        Positive test: the full-text index is built on the search expression (no stored column) and the search query uses it.
+        """
+        with get_db_pool(test_env).connection() as conn:
+            self.assertIsNone(conn.execute("""SELECT 1 FROM information_schema.columns
+                                              WHERE table_name = 'vacations' AND column_name = 'search_vector'""").fetchone())
+            conn.execute("SET LOCAL enable_seqscan = off")
+            plan = conn.execute(SQL("EXPLAIN SELECT * FROM vacations AS v WHERE {} @@ to_tsquery('simple', 'צרפת:*')").format(SEARCH_VECTOR)).fetchall()
+
+        self.assertIn("vacations_search_vector_idx", " ".join(row[0] for row in plan))
+
+    def test_split_statements_keeps_dollar_quoted_blocks(self):
+        """
+        Positive test: statements are split on ';' except inside $$ blocks, comments are dropped.
+        """
+        sql = "-- comment\nCREATE TABLE a (id INT);\nCREATE FUNCTION f() RETURNS INT AS $$\nBEGIN\n    RETURN 1;\nEND;\n$$ LANGUAGE plpgsql;\n"
+        statements = _split_statements(sql)
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(statements[1].startswith("CREATE FUNCTION"))
+        self.assertTrue(statements[1].endswith("LANGUAGE plpgsql;"))
+
+#
@@ -0,0 +1,56 @@
+# built-in packages
+import unittest
+
+# internal packages
+from src.services import errors
+from src.services.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher(unittest.TestCase):
+    def setUp(self):
+        self.hasher = PasswordHasher(workers=1, max_queue=0, timeout=30)
+
+    def tearDown(self):
+        self.hasher.shutdown()
+
+    # ---Tests for generate_password_hash / check_password_hash methods---
+
+    def test_hash_and_check_positive(self):
+        """
+        Positive test: a password hashed in the worker process is verified, a wrong one is not.
+        """
+        hashed_password = self.hasher.generate_password_hash("1234")
+        self.assertTrue(hashed_password.startswith("pbkdf2:sha256"))
+        self.assertTrue(self.hasher.check_password_hash(hashed_password, "1234"))
+        self.assertFalse(self.hasher.check_password_hash(hashed_password, "4321"))
+
+        stats = self.hasher.get_stats()
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertGreater(stats["hash_avg_ms"], 0)
+
+    def test_inline_hashing(self):
+        """
+        Positive test: with no workers the hash is computed on the calling thread.
+        """
+        hasher = PasswordHasher(workers=0, max_queue=0, timeout=30)
+        hashed_password = hasher.generate_password_hash("1234")
+        self.assertTrue(hasher.check_password_hash(hashed_password, "1234"))
+        self.assertEqual(hasher.get_stats()["completed"], 2)
+
+    def test_timeout_and_rejection(self):
+        """
+        Negative test: a hash that is not done in time raises ServiceUnavailableError,
+        and while it still runs the full pool rejects new hashes.
+        """
+        self.hasher.timeout = 0.001
+        with self.assertRaises(errors.ServiceUnavailableError):
+            self.hasher.generate_password_hash("1234")
+        with self.assertRaises(errors.ServiceUnavailableError):
+            self.hasher.generate_password_hash("1234")
+
+        stats = self.hasher.get_stats()
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertEqual(stats["rejected"], 1)
+
+#
@@ -0,0 +1,139 @@
+# built-in packages
+import unittest
+
+# internal packages
+from src.config import test_env
+from src.api import create_app
+
+
+class TestStatsApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = test_env
+        cls.app = create_app()
+        cls.app.config["TESTING"] = True
+        cls.app.config["WTF_CSRF_ENABLED"] = False
+        cls.client = cls.app.test_client()
+
+    def setUp(self):
+        with self.client.session_transaction() as sess:
+            sess.clear()
+
+
+    # --- Tests for db_pool_stats route ---
+
+    def test_db_pool_stats_positive(self):
+        """
+        positive test: admin gets the connection pool statistics.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/stats/db-pool")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("pool_size", res.json)
+        self.assertIn("pool_available", res.json)
+
+
+    def test_db_pool_stats_negative(self):
+        """
+        negative test: non-admin user forbidden from pool statistics.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 1
+
+        res = self.client.get(f"/{self.env}/stats/db-pool")
+        self.assertEqual(res.status_code, 403)
+
+
+    # --- Tests for dao_cache_stats route ---
+
+    def test_dao_cache_stats_positive(self):
+        """
+        positive test: admin gets the DAO cache statistics.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/stats/dao-cache")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("hits", res.json)
+        self.assertIn("hit_ratio", res.json)
+
+
+    # --- Tests for password_hashing_stats route ---
+
+    def test_password_hashing_stats_positive(self):
+        """
+        positive test: admin gets the password hashing pool statistics.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/stats/password-hashing")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("queue_wait_avg_ms", res.json)
+        self.assertIn("hash_avg_ms", res.json)
+
+
+    # --- Tests for latency_budget_stats route ---
+
+    def test_latency_budget_stats_positive(self):
+        """
+        positive test: admin gets the latency budget violations.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/stats/latency-budgets")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("total_violations", res.json)
+        self.assertIn("violations", res.json)
+
+
+    # --- Tests for catalog_snapshot_stats route ---
+
+    def test_catalog_snapshot_stats_positive(self):
+        """
+        positive test: admin gets the catalog snapshot statistics.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/stats/catalog-snapshot")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("stale_reads", res.json)
+        self.assertIn("snapshots", res.json)
+
+
+    # --- Tests for catalog_read_model_stats route ---
+
+    def test_catalog_read_model_stats_positive(self):
+        """
+        positive test: admin gets the catalog read model statistics.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/stats/catalog-read-model")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("full_builds", res.json)
+        self.assertIn("models", res.json)
+
+
+    # --- Tests for change_events_stats route ---
+
+    def test_change_events_stats_positive(self):
+        """
+        positive test: admin gets the change listener statistics.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/stats/change-events")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("notifications", res.json)
+        self.assertIn("listening", res.json)
+
+
+#
@@ -0,0 +1,67 @@
+# built-in packages
+import unittest
+
+# internal packages
+from src.config import test_env
+from src.dal.country_dao import CountryDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.database import initialize_database, get_db_pool
+from src.dal.instrumentation import collect_query_stats
+from src.dal.unit_of_work import unit_of_work
+
+
+class TestUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        initialize_database(env=test_env)
+
+    def _country_names(self):
+        # read on a separate connection, outside of any unit of work and cache
+        with get_db_pool(test_env).connection() as conn:
+            return {row[0] for row in conn.execute("SELECT country_name FROM countries").fetchall()}
+
+    # ---Tests for unit_of_work---
+
+    def test_commit_once_at_end(self):
+        """
+        Positive test: writes are invisible to other connections until the unit of work commits them together.
+        """
+        with collect_query_stats() as stats, unit_of_work(env=test_env):
+            CountryDAO(env=test_env).add_country("Atlantis")
+            CountryDAO(env=test_env).add_country("Lemuria")
+            self.assertNotIn("Atlantis", self._country_names())
+
+        self.assertTrue({"Atlantis", "Lemuria"} <= self._country_names())
+        self.assertEqual(stats.statements, 3)
+
+    def test_rollback_on_exception(self):
+        """
+        Negative test: an exception rolls back every write of the unit of work.
+        """
+        with self.assertRaises(ValueError), unit_of_work(env=test_env):
+            CountryDAO(env=test_env).add_country("Atlantis")
+            raise ValueError("fail")
+
+        self.assertNotIn("Atlantis", self._country_names())
+
+    def test_uncommitted_reads_not_cached(self):
+        """
+        Negative test: reads of the tables written in the unit of work do not leak into the cache after a rollback.
+        """
+        with self.assertRaises(ValueError), unit_of_work(env=test_env):
+            CountryDAO(env=test_env).add_country("Atlantis")
+            self.assertIn("Atlantis", [country.country_name for country in CountryDAO(env=test_env).get_all_countries()])
+            raise ValueError("fail")
+
+        self.assertNotIn("Atlantis", [country.country_name for country in CountryDAO(env=test_env).get_all_countries()])
+
+    def test_failed_statement_keeps_unit_of_work(self):
+        """
+        Positive test: a like on a missing vacation fails alone (savepoint), the other writes are still committed.
+        """
+        with unit_of_work(env=test_env):
+            self.assertIsNone(LikeDAO(env=test_env).toggle_like(user_id=1, vacation_id=999999))
+            CountryDAO(env=test_env).add_country("Atlantis")
+
+        self.assertIn("Atlantis", self._country_names())
+
+#
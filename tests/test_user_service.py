@@ -154,4 +154,37 @@ class TestUserService(unittest.TestCase):
         with self.assertRaises(errors.InvalidTypeInputError):
             self.user_service.remove_like(1, "1")
 
+    # ---Tests for toggle like function---
+
+    def test_toggle_like_success(self):
+        """
+        Positive test: toggle like adds and then removes the like with the updated count.
+        """
+        self.assertEqual(self.user_service.toggle_like(1, 1), (True, 1))
+        self.assertEqual(self.user_service.toggle_like(2, 1), (True, 2))
+        self.assertEqual(self.user_service.toggle_like(1, 1), (False, 1))
+
+    def test_toggle_like_set_idempotent(self):
+        """
+        Positive test: setting the like twice keeps a single like.
+        """
+        self.assertEqual(self.user_service.toggle_like(1, 1, liked=True), (True, 1))
+        self.assertEqual(self.user_service.toggle_like(1, 1, liked=True), (True, 1))
+        self.assertEqual(self.user_service.toggle_like(1, 1, liked=False), (False, 0))
+        self.assertEqual(self.user_service.toggle_like(1, 1, liked=False), (False, 0))
+
+    def test_toggle_like_invalid_vacation(self):
+        """
+        Negative test: vacation does not exist.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.user_service.toggle_like(1, 9999)
+
+    def test_toggle_like_invalid_user_type(self):
+        """
+        Negative test: user_id as string.
+        """
+        with self.assertRaises(errors.InvalidTypeInputError):
+            self.user_service.toggle_like("1", 1)
+
 #
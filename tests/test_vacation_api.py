@@ -1,10 +1,28 @@
 # built-in packages
+import tempfile
+from datetime import date, timedelta
 import unittest
+from io import BytesIO
+from unittest import mock
 
 # internal packages
 from src.config import test_env
 from src.api import create_app
-from src.dal.database import initialize_database
+from src.dal.database import initialize_database, get_db_pool
+from src.dal.home_page_dao import HomePageDAO
+from src.dal.latency_budget import LatencyBudgetExceeded
+from src.services.catalog_snapshot import catalog_snapshots
+from src.dal.catalog_read_model import catalog_read_models
+
+# external packages
+from PIL import Image
+
+
+def create_test_image(file_name: str = "test.jpg") -> tuple:
+    image_bytes = BytesIO()
+    Image.new("RGB", (800, 600), "skyblue").save(image_bytes, "JPEG")
+    image_bytes.seek(0)
+    return image_bytes, file_name
 
 
 class TestVacationApi(unittest.TestCase):
@@ -15,8 +33,14 @@ class TestVacationApi(unittest.TestCase):
         cls.app = create_app()
         cls.app.config["TESTING"] = True
         cls.app.config["WTF_CSRF_ENABLED"] = False
+        cls.upload_dir = tempfile.TemporaryDirectory()
+        cls.app.config["UPLOAD_FOLDER"] = cls.upload_dir.name
         cls.client = cls.app.test_client()
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.upload_dir.cleanup()
+
     def setUp(self):
         with self.client.session_transaction() as sess:
             sess.clear()
@@ -47,6 +71,56 @@ class TestVacationApi(unittest.TestCase):
         self.assertIn("התחברות", res.data.decode())
 
 
+    def test_home_page_served_stale_when_database_fails(self):
+        """
+        negative test: the database read fails, the home page is answered from the catalog snapshot and marked stale.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+            sess["user_name"] = "shir"
+
+        catalog_snapshots.refresh(test_env)
+        try:
+            with mock.patch.object(catalog_read_models, "current", return_value=None), \
+                 mock.patch.object(HomePageDAO, "get_home_page_data", side_effect=LatencyBudgetExceeded("test", "deadline")):
+                res = self.client.get(f"/{self.env}/")
+        finally:
+            catalog_snapshots.clear()
+
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("X-Catalog-Stale", res.headers)
+        self.assertNotIn("ETag", res.headers)
+        self.assertIn("חופשות", res.data.decode())
+
+    # --- Tests for vacations_page route ---
+
+    def test_vacations_page_positive(self):
+        """
+        positive test: next page of vacation cards is returned as HTML with a cursor.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+
+        res = self.client.get(f"/{self.env}/vacations")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("vacation-card", res.json["html"])
+        self.assertIn("next_cursor", res.json)
+
+
+    def test_vacations_page_negative(self):
+        """
+        negative test: invalid cursor returns 400.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+
+        res = self.client.get(f"/{self.env}/vacations?cursor=invalid")
+        self.assertEqual(res.status_code, 400)
+
+
     # --- Tests for add_vacation route ---
 
     def test_add_vacation_get_positive(self):
@@ -79,21 +153,37 @@ class TestVacationApi(unittest.TestCase):
         with self.client.session_transaction() as sess:
             sess["role_id"] = 2
 
-        from io import BytesIO
-        dummy_image = (BytesIO(b"dummy image data"), "test.jpg")
-
         res = self.client.post(f"/{self.env}/add-vacation", data={
             "destination_id": "1",
             "dateRangeInput": "01/01/2030 - 05/01/2030",
             "price": "1000",
             "vacation_info": "חופשה מהממת",
-            "image": dummy_image
+            "image": create_test_image()
         }, content_type="multipart/form-data", follow_redirects=True)
 
         self.assertEqual(res.status_code, 200)
         self.assertIn("החופשה נוספה בהצלחה", res.data.decode())
 
 
+    def test_add_vacation_post_negative_invalid_image(self):
+        """
+        negative test: admin uploads a file that is not an image, expect error flash.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.post(f"/{self.env}/add-vacation", data={
+            "destination_id": "1",
+            "dateRangeInput": "01/01/2030 - 05/01/2030",
+            "price": "1000",
+            "vacation_info": "חופשה מהממת",
+            "image": (BytesIO(b"dummy image data"), "test.jpg")
+        }, content_type="multipart/form-data", follow_redirects=True)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("קובץ התמונה אינו תקין", res.data.decode())
+
+
     def test_add_vacation_post_negative(self):
         """
         negative test: admin submits empty form, expect error flash.
@@ -163,6 +253,185 @@ class TestVacationApi(unittest.TestCase):
         self.assertIn("יש למלא את כל השדות", res.data.decode())
 
 
+    # --- Tests for import_vacations route ---
+
+    def test_import_vacations_positive(self):
+        """
+        positive test: admin imports a CSV file, valid rows are added and invalid rows reported.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        start_date = date.today() + timedelta(days=30)
+        csv_content = ("country_id,vacation_info,vacation_start_date,vacation_end_date,price,photo_file_path\n"
+                       f"1,חופשה מיובאת,{start_date},{start_date + timedelta(days=5)},2500,france.jpg\n"
+                       f"1,מחיר שגוי,{start_date},{start_date + timedelta(days=5)},20000,france.jpg\n")
+        res = self.client.post(f"/{self.env}/import-vacations",
+                               data={"file": (BytesIO(csv_content.encode()), "vacations.csv")},
+                               content_type="multipart/form-data")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json["imported"], 1)
+        self.assertEqual(res.json["errors"][0]["row"], 2)
+
+
+    def test_import_vacations_negative(self):
+        """
+        negative test: unsupported file type is rejected.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.post(f"/{self.env}/import-vacations",
+                               data={"file": (BytesIO(b"vacations"), "vacations.txt")},
+                               content_type="multipart/form-data")
+        self.assertEqual(res.status_code, 400)
+
+
+    # --- Tests for conditional GET (ETag) ---
+
+    def test_home_page_not_modified(self):
+        """
+        positive test: a repeat visit with the page ETag gets 304 without running any query.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+            sess["user_name"] = "shir"
+            sess["csrf_token"] = "token"
+
+        etag = self.client.get(f"/{self.env}/").headers["ETag"]
+        res = self.client.get(f"/{self.env}/", headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res.headers["ETag"], etag)
+        self.assertIn('db;dur=0.0;desc="0 queries', res.headers["Server-Timing"])
+
+
+    def test_home_page_modified_after_like(self):
+        """
+        negative test: the ETag no longer matches once the user likes a vacation.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+            sess["user_name"] = "shir"
+            sess["csrf_token"] = "token"
+
+        etag = self.client.get(f"/{self.env}/").headers["ETag"]
+        self.client.post(f"/{self.env}/like", json={"vacation_id": 2})
+        res = self.client.get(f"/{self.env}/", headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res.headers["ETag"], etag)
+
+
+    def test_home_page_modified_after_database_reset(self):
+        """
+        negative test: the ETag no longer matches once the database is re-initialized.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+            sess["user_name"] = "shir"
+            sess["csrf_token"] = "token"
+
+        etag = self.client.get(f"/{self.env}/").headers["ETag"]
+        initialize_database(env=test_env)
+        res = self.client.get(f"/{self.env}/", headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res.headers["ETag"], etag)
+
+
+    # --- Tests for search route ---
+
+    def test_search_vacations_positive(self):
+        """
+        positive test: search returns the matching cards, the total and the facets.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+
+        res = self.client.get(f"/{self.env}/search?q=יפן&max_price=9000")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json["total"], 1)
+        self.assertIn("יפן", res.json["html"])
+        self.assertEqual(res.json["country_facets"][0]["country_name"], "יפן")
+
+
+    def test_search_vacations_negative(self):
+        """
+        negative test: invalid filters are rejected.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+
+        res = self.client.get(f"/{self.env}/search?start_from=tomorrow")
+        self.assertEqual(res.status_code, 400)
+        res = self.client.get(f"/{self.env}/search?page=100000000000000000000")
+        self.assertEqual(res.status_code, 400)
+        res = self.client.get(f"/{self.env}/search?page=abc")
+        self.assertEqual(res.status_code, 400)
+        res = self.client.get(f"/{self.env}/search?page_size=1.5")
+        self.assertEqual(res.status_code, 400)
+
+
+    # --- Tests for available route ---
+
+    def test_available_vacations_positive(self):
+        """
+        positive test: vacations overlapping a travel window.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+
+        res = self.client.get(f"/{self.env}/available?start_date=2000-01-01&end_date=2100-01-01")
+        self.assertEqual(res.status_code, 200)
+        self.assertGreater(res.json["count"], 0)
+
+
+    def test_available_vacations_negative(self):
+        """
+        negative test: missing or inverted travel window.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+            sess["role_id"] = 1
+
+        self.assertEqual(self.client.get(f"/{self.env}/available").status_code, 400)
+        self.assertEqual(self.client.get(f"/{self.env}/available?start_date=2025-10-10&end_date=2025-10-01").status_code, 400)
+        self.assertEqual(self.client.get(f"/{self.env}/available?within_days=99999999").status_code, 400)
+
+
+    # --- Tests for export routes ---
+
+    def test_export_positive(self):
+        """
+        positive test: admin downloads the vacations as a streamed CSV file.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+
+        res = self.client.get(f"/{self.env}/export/vacations?format=csv&fetch_size=2")
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.is_streamed)
+        self.assertIn("attachment; filename=vacations.csv", res.headers["Content-Disposition"])
+        self.assertTrue(res.data.decode().startswith("vacation_id,"))
+
+
+    def test_export_negative(self):
+        """
+        negative test: non admin users cannot export, and an unknown export is rejected.
+        """
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 1
+        self.assertEqual(self.client.get(f"/{self.env}/export/users").status_code, 403)
+
+        with self.client.session_transaction() as sess:
+            sess["role_id"] = 2
+        self.assertEqual(self.client.get(f"/{self.env}/export/passwords").status_code, 400)
+
+
     # --- Tests for delete_vacation route ---
 
     def test_delete_vacation_positive(self):
@@ -209,6 +478,35 @@ class TestVacationApi(unittest.TestCase):
         self.assertIn("Like removed successfully", res_remove.json["message"])
 
 
+    def test_toggle_like_set_liked(self):
+        """
+        positive test: sending "liked" sets the like idempotently and returns the count.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+
+        for _ in range(2):
+            res = self.client.post(f"/{self.env}/like", json={"vacation_id": 8, "liked": True})
+            self.assertEqual(res.status_code, 200)
+            self.assertEqual(res.json["likes_count"], 1)
+            self.assertTrue(res.json["liked"])
+
+        res = self.client.post(f"/{self.env}/like", json={"vacation_id": 8, "liked": False})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json["likes_count"], 0)
+
+
+    def test_toggle_like_negative_vacation_not_found(self):
+        """
+        negative test: like a vacation that does not exist.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+
+        res = self.client.post(f"/{self.env}/like", json={"vacation_id": 99999})
+        self.assertEqual(res.status_code, 404)
+
+
     def test_toggle_like_negative_not_logged_in(self):
         """
         negative test: no user logged in (no session).
@@ -229,4 +527,21 @@ class TestVacationApi(unittest.TestCase):
         self.assertEqual(res.status_code, 400)
         self.assertIn("Missing data", res.json["error"])
 
+
+    def test_toggle_like_negative_over_latency_budget(self):
+        """
+        negative test: the vacation row is locked by another transaction, the like is cancelled at its latency budget
+        and answered with 503 and Retry-After instead of waiting for the lock.
+        """
+        with self.client.session_transaction() as sess:
+            sess["user_id"] = 1
+
+        with get_db_pool(test_env).connection() as conn:
+            conn.execute("SELECT 1 FROM vacations WHERE vacation_id = 9 FOR UPDATE")
+            res = self.client.post(f"/{self.env}/like", json={"vacation_id": 9})
+            conn.rollback()
+
+        self.assertEqual(res.status_code, 503)
+        self.assertIn("Retry-After", res.headers)
+
 #
@@ -0,0 +1,79 @@
+# built-in packages
+import json
+import unittest
+from datetime import date, timedelta
+from io import BytesIO
+
+# internal packages
+from src.config import test_env
+from src.dal.database import initialize_database
+from src.dal.vacation_dao import VacationDAO
+from src.services.vacation_import_service import VacationImportService
+from src.services import errors
+
+
+class TestVacationImportService(unittest.TestCase):
+    def setUp(self):
+        initialize_database(env=test_env)
+        self.import_service = VacationImportService(env=test_env)
+        self.start_date = date.today() + timedelta(days=10)
+        self.end_date = self.start_date + timedelta(days=7)
+
+    def vacation_row(self, **values) -> dict:
+        row = {"country_id": 1, "vacation_info": "חופשה מיובאת", "vacation_start_date": self.start_date.isoformat(),
+               "vacation_end_date": self.end_date.isoformat(), "price": 3000, "photo_file_path": "france.jpg"}
+        row.update(values)
+        return row
+
+    # ---Tests for parse_file method---
+
+    def test_parse_csv_and_ndjson(self):
+        """
+        Positive test: CSV and NDJSON files give the same rows (an invalid NDJSON line is kept as None).
+        """
+        csv_file = BytesIO("country_id,price\n1,3000\n".encode())
+        ndjson_file = BytesIO(b'{"country_id": 1, "price": 3000}\n\nnot json\n')
+        self.assertEqual(self.import_service.parse_file(csv_file, "vacations.csv"), [{"country_id": "1", "price": "3000"}])
+        self.assertEqual(self.import_service.parse_file(ndjson_file, "vacations.ndjson"), [{"country_id": 1, "price": 3000}, None])
+
+    def test_parse_unsupported_file(self):
+        """
+        Negative test: a file that is neither CSV nor NDJSON raises InvalidInputError.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.import_service.parse_file(BytesIO(b"{}"), "vacations.xlsx")
+
+    # ---Tests for import_vacations method---
+
+    def test_import_valid_rows(self):
+        """
+        Positive test: all valid rows are inserted.
+        """
+        vacations_before = len(VacationDAO(env=test_env).get_all_vacations())
+        report = self.import_service.import_vacations([self.vacation_row(), self.vacation_row(country_id="2", price="1500")])
+
+        self.assertEqual(report.imported, 2)
+        self.assertEqual(report.errors, [])
+        self.assertEqual(len(VacationDAO(env=test_env).get_all_vacations()), vacations_before + 2)
+
+    def test_import_reports_invalid_rows(self):
+        """
+        Negative test: invalid rows are reported by row number and skipped, the valid ones are still inserted.
+        """
+        rows = [self.vacation_row(),
+                self.vacation_row(price=0),
+                self.vacation_row(vacation_end_date=(self.start_date - timedelta(days=1)).isoformat()),
+                self.vacation_row(vacation_start_date="2020-01-01", vacation_end_date="2020-01-05"),
+                self.vacation_row(country_id=9999),
+                self.vacation_row(vacation_info=""),
+                self.vacation_row(price=12.5),
+                None]
+        report = self.import_service.import_vacations(rows)
+
+        self.assertEqual(report.total_rows, 8)
+        self.assertEqual(report.imported, 1)
+        self.assertEqual([row_error.row for row_error in report.errors], [2, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(report.errors[3].errors, ["Country id not found."])
+        json.dumps([row_error.errors for row_error in report.errors])
+
+#
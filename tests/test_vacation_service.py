@@ -6,6 +6,8 @@ from datetime import date, timedelta
 from src.config import test_env
 from src.services.vacation_service import VacationService
 from src.dal.vacation_dao import VacationDAO
+from src.dal.like_dao import LikeDAO
+from src.dal.database import get_db_pool
 from src.dal.database import initialize_database
 from src.services import errors
 from src.models.vacation_dto import Vacation
@@ -38,6 +40,166 @@ class TestVacationService(unittest.TestCase):
         self.assertEqual(str(context.exception), "No vacations found.")
     
     
+    def test_get_vacations_likes_count(self):
+        """
+        Positive test: likes_count follows added and removed likes.
+        """
+        LikeDAO(env=test_env).add_like(user_id=1, vacation_id=2)
+        LikeDAO(env=test_env).add_like(user_id=2, vacation_id=2)
+        LikeDAO(env=test_env).delete_like(user_id=1, vacation_id=2)
+        vacations = {v.vacation_id: v for v in self.vacation_service.get_vacations()}
+        self.assertEqual(vacations[2].likes_count, 1)
+        self.assertEqual(vacations[3].likes_count, 0)
+        
+    
+    def test_reconcile_likes_count(self):
+        """
+        Positive test: drifted likes_count is repaired by the reconciliation.
+        """
+        LikeDAO(env=test_env).add_like(user_id=1, vacation_id=2)
+        with get_db_pool(test_env).connection() as conn:
+            conn.execute("UPDATE vacations SET likes_count = 7 WHERE vacation_id IN (2, 3)")
+        repaired = VacationDAO(env=test_env).reconcile_likes_count()
+        self.assertEqual(repaired, 2)
+        self.assertEqual(VacationDAO(env=test_env).get_vacation_by_id(2).likes_count, 1)
+        self.assertEqual(VacationDAO(env=test_env).get_vacation_by_id(3).likes_count, 0)
+    
+    
+    # ---Tests for get vacations page function---
+    
+    def test_get_vacations_page_success(self):
+        """
+        Positive test: paging through all vacations returns each vacation once, sorted by start date.
+        """
+        vacations, cursor = self.vacation_service.get_vacations_page(page_size=5)
+        self.assertEqual(len(vacations), 5)
+        self.assertIsNotNone(cursor)
+        while cursor:
+            page, cursor = self.vacation_service.get_vacations_page(cursor=cursor, page_size=5)
+            vacations += page
+        self.assertEqual([v.vacation_id for v in vacations], [v.vacation_id for v in self.vacation_service.get_vacations()])
+        
+    
+    def test_get_vacations_page_invalid_cursor(self):
+        """
+        Negative test: get vacations page with an invalid cursor.
+        """
+        with self.assertRaises(errors.InvalidInputError) as context:
+            self.vacation_service.get_vacations_page(cursor="not-a-cursor")
+        self.assertEqual(str(context.exception), "Invalid page cursor.")
+    
+    
+    # ---Tests for get home page function---
+
+    def test_get_home_page_success(self):
+        """
+        Positive test: the pipelined home page data matches the separate reads.
+        """
+        LikeDAO(env=test_env).add_like(1, 2)
+        page = self.vacation_service.get_home_page(user_id=1, page_size=5)
+        vacations, cursor = self.vacation_service.get_vacations_page(page_size=5)
+
+        self.assertEqual([v.vacation_id for v in page.vacations], [v.vacation_id for v in vacations])
+        self.assertEqual(page.next_cursor, cursor)
+        self.assertEqual(len(page.countries), 14)
+        self.assertEqual(page.liked_vacations, [2])
+
+
+    def test_get_home_page_invalid_page_size(self):
+        """
+        Negative test: get home page with an invalid page size.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.vacation_service.get_home_page(user_id=1, page_size=0)
+
+
+    # ---Tests for search vacations function---
+
+    def test_search_vacations_text(self):
+        """
+        Positive test: search words match description words (also after a Hebrew prefix letter) and country names.
+        """
+        result = self.vacation_service.search_vacations(query="נופים")
+        self.assertGreater(result.total, 0)
+        self.assertTrue(all("נופים" in vacation.vacation_info for vacation in result.vacations))
+        self.assertIn("ונופים", " ".join(vacation.vacation_info for vacation in result.vacations))
+
+        result = self.vacation_service.search_vacations(query="יפן")
+        self.assertEqual([vacation.country_name for vacation in result.vacations], ["יפן"])
+
+
+    def test_search_vacations_filters_and_facets(self):
+        """
+        Positive test: the country facet ignores the country filter, the price facet counts the filtered countries.
+        """
+        all_vacations = self.vacation_service.get_vacations()
+        result = self.vacation_service.search_vacations(country_ids=[1, 2], min_price=1, page_size=1)
+
+        self.assertEqual(result.total, 2)
+        self.assertEqual(len(result.vacations), 1)
+        self.assertEqual(sum(facet.count for facet in result.country_facets), len(all_vacations))
+        self.assertEqual(sum(facet.count for facet in result.price_facets), 2)
+
+        second_page = self.vacation_service.search_vacations(country_ids=[1, 2], page=2, page_size=1)
+        self.assertEqual({result.vacations[0].country_id, second_page.vacations[0].country_id}, {1, 2})
+
+
+    def test_search_vacations_invalid_input(self):
+        """
+        Negative test: search with an inverted price range or an invalid page.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.vacation_service.search_vacations(min_price=5000, max_price=1000)
+        with self.assertRaises(errors.InvalidInputError):
+            self.vacation_service.search_vacations(page=0)
+        with self.assertRaises(errors.InvalidInputError):
+            self.vacation_service.search_vacations(page=100000000000000000000)
+
+
+    # ---Tests for date overlap functions---
+
+    def test_get_vacations_overlapping(self):
+        """
+        Positive test: the vacations overlapping a window are exactly those starting before its end and ending after its start.
+        """
+        vacations = self.vacation_service.get_vacations()
+        window_start = min(vacation.vacation_start_date for vacation in vacations) + timedelta(days=10)
+        window_end = window_start + timedelta(days=20)
+        expected = [vacation.vacation_id for vacation in vacations
+                    if vacation.vacation_start_date <= window_end and vacation.vacation_end_date >= window_start]
+
+        overlapping = self.vacation_service.get_vacations_overlapping(window_start, window_end, limit=100)
+        self.assertEqual([vacation.vacation_id for vacation in overlapping], expected)
+        self.assertEqual(len(self.vacation_service.get_vacations_overlapping(window_start, window_end, limit=1)), min(1, len(expected)))
+
+
+    def test_get_vacations_starting_within(self):
+        """
+        Positive test: vacations starting within the next days.
+        """
+        vacation = VacationDAO(env=test_env).add_vacation(1, "חופשה קרובה", date.today() + timedelta(days=3), date.today() + timedelta(days=8), 2000, "france.jpg")
+        self.assertIn(vacation.vacation_id, [v.vacation_id for v in self.vacation_service.get_vacations_starting_within(7)])
+        self.assertNotIn(vacation.vacation_id, [v.vacation_id for v in self.vacation_service.get_vacations_starting_within(2)])
+
+
+    def test_get_vacations_starting_within_invalid_days(self):
+        """
+        Negative test: a negative number of days, or a window beyond the maximum.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.vacation_service.get_vacations_starting_within(-1)
+        with self.assertRaises(errors.InvalidInputError):
+            self.vacation_service.get_vacations_starting_within(99999999)
+
+
+    def test_get_vacations_overlapping_invalid_window(self):
+        """
+        Negative test: a window that ends before it starts.
+        """
+        with self.assertRaises(errors.InvalidInputError):
+            self.vacation_service.get_vacations_overlapping(date.today(), date.today() - timedelta(days=1))
+
+
     # ---Tests for add vacation function---
     
     def test_add_vacation_success(self):
@@ -169,6 +331,47 @@ class TestVacationService(unittest.TestCase):
         self.assertEqual(vacation.vacation_info, "Updated Vacation")
         
         
+    def test_update_vacation_partial(self):
+        """
+        Positive test: update vacation keeps the photo when none is given and returns the joined country name.
+        """
+        before = VacationDAO(env=test_env).get_vacation_by_id(2)
+        vacation = self.vacation_service.update_vacation(
+            vacation_id=2, 
+            country_id=3, 
+            vacation_info=before.vacation_info, 
+            vacation_start_date=before.vacation_start_date,
+            vacation_end_date=before.vacation_end_date,
+            price=before.price + 1
+        )
+        self.assertEqual(vacation.price, before.price + 1)
+        self.assertEqual(vacation.photo_file_path, before.photo_file_path)
+        self.assertEqual(vacation.country_name, "ארצות הברית")
+        self.assertEqual(VacationDAO(env=test_env).get_vacation_by_id(2), vacation)
+        
+    
+    def test_update_vacation_compared_with_current_row(self):
+        """
+        Positive test: a change back to a value the cache still holds is written (the row was changed behind the cache).
+        """
+        before = VacationDAO(env=test_env).get_vacation_by_id(vacation_id=2)
+        # a raw write: the cached read above is not invalidated
+        with get_db_pool(test_env).connection() as conn:
+            conn.execute("UPDATE vacations SET price = price + 1 WHERE vacation_id = 2")
+
+        vacation = self.vacation_service.update_vacation(
+            vacation_id=2,
+            country_id=before.country_id,
+            vacation_info=before.vacation_info,
+            vacation_start_date=before.vacation_start_date,
+            vacation_end_date=before.vacation_end_date,
+            price=before.price
+        )
+        self.assertEqual(vacation.price, before.price)
+        with get_db_pool(test_env).connection() as conn:
+            self.assertEqual(conn.execute("SELECT price FROM vacations WHERE vacation_id = 2").fetchone()[0], before.price)
+
+
     def test_update_vacation_invalid_id(self):
         """
         Negative test: update vacation with country id dose not exist.